@@ -0,0 +1,513 @@
+import base64
+import bisect
+import json
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from bench.synthetic import SyntheticGenerator
+
+
+# -------------------------------------------------
+# Rutas base (mismas que usan los clientes)
+# -------------------------------------------------
+DSCO_PREFIX = "/api/v3"
+MINTSOFT_PREFIX = "/api"
+
+
+class MockServer:
+    """
+    Servidor HTTP en proceso que imita los endpoints
+    DSCO / Mintsoft que usan los clientes:
+
+    DSCO:     /oauth2/token, /order/, /order/page, /catalog,
+              /catalog/batch/small
+    Mintsoft: /Auth, /Order, /Order/{id}, /Order/List,
+              /Product, /Product/List, /Product/{id}
+
+    - latency / jitter: segundos agregados a cada respuesta
+    - error_rate: fracción de requests que responden 503
+    - orders / products: volumen de datos DSCO generados
+      (bench.synthetic, determinísticos por seed)
+    - expire_api_key() / expire_dsco_token(): invalidan la API key
+      Mintsoft / el token DSCO emitidos (los requests con la
+      credencial vieja reciben 401)
+    - fail_next(): fuerza las próximas respuestas de un endpoint
+      (ej: 429 con Retry-After) para probar reintentos
+    """
+
+    def __init__(
+        self,
+        orders: int = 1000,
+        products: int = 1000,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+
+        self.created_to = created_to or datetime.now(timezone.utc)
+        self.created_from = created_from or self.created_to - timedelta(hours=1)
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        # Datos DSCO sintéticos (órdenes ordenadas por orderDate)
+        generator = SyntheticGenerator(
+            seed=seed,
+            catalog_size=max(products, 1),
+            created_from=self.created_from,
+            created_to=self.created_to,
+        )
+        self.dsco_orders = list(generator.iter_orders(orders))
+        self._order_times = [
+            _parse_iso(o["orderDate"]) for o in self.dsco_orders
+        ]
+        self.dsco_products = list(generator.iter_products(products))
+
+        # Estado Mintsoft (lo que van creando los clientes)
+        self.mintsoft_orders: Dict[str, Dict[str, Any]] = {}
+        self.mintsoft_products: Dict[str, Dict[str, Any]] = {}
+        self._next_id = 1
+
+        self._api_key_version = 1
+        self._dsco_token_version = 1
+
+        # Respuestas forzadas: (METHOD, path) → [(status, headers), ...]
+        self._scripted: Dict[Tuple[str, str], List[Tuple[int, Dict[str, str]]]] = {}
+
+        self.requests: Dict[str, int] = {}
+        self.errors = 0
+
+        self._server = _Server((host, port), _Handler)
+        self._server.mock = self
+        self._thread: Optional[threading.Thread] = None
+
+    # -------------------------------------------------
+    # Ciclo de vida
+    # -------------------------------------------------
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="mock-server",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # -------------------------------------------------
+    # Estadísticas
+    # -------------------------------------------------
+    def request_count(self) -> int:
+        with self._lock:
+            return sum(self.requests.values())
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.requests.clear()
+            self.errors = 0
+
+    def _count(self, method: str, path: str) -> None:
+        with self._lock:
+            key = f"{method} {path}"
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+    @property
+    def api_key(self) -> str:
+        return f"mock-api-key-{self._api_key_version}"
+
+    def expire_api_key(self) -> None:
+        with self._lock:
+            self._api_key_version += 1
+
+    @property
+    def dsco_token(self) -> str:
+        return f"mock-token-{self._dsco_token_version}"
+
+    def expire_dsco_token(self) -> None:
+        with self._lock:
+            self._dsco_token_version += 1
+
+    def fail_next(
+        self,
+        method: str,
+        path: str,
+        status: int,
+        times: int = 1,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Las próximas `times` respuestas a METHOD path (completo) son `status`"""
+        with self._lock:
+            self._scripted.setdefault((method.upper(), path), []).extend(
+                [(status, dict(headers or {}))] * times
+            )
+
+    def _next_scripted(self, method: str, path: str) -> Optional[Tuple[int, Dict[str, str]]]:
+        with self._lock:
+            pending = self._scripted.get((method, path))
+            return pending.pop(0) if pending else None
+
+    def _new_id(self) -> int:
+        with self._lock:
+            value = self._next_id
+            self._next_id += 1
+            return value
+
+    def _delay(self) -> float:
+        with self._lock:
+            extra = self._random.uniform(0, self.jitter) if self.jitter else 0.0
+            fail = self._random.random() < self.error_rate
+            if fail:
+                self.errors += 1
+
+        return self.latency + extra if not fail else -1.0
+
+    # -------------------------------------------------
+    # DSCO
+    # -------------------------------------------------
+    def dsco(
+        self,
+        method: str,
+        path: str,
+        query: Dict,
+        body: Any,
+        token: Optional[str] = None,
+    ) -> Tuple[int, Any]:
+        if path == "/oauth2/token" and method == "POST":
+            return 200, {"access_token": self.dsco_token, "expires_in": 3600}
+
+        if token != self.dsco_token:
+            return 401, {"message": "invalid or expired token"}
+
+        if path == "/order/" and method == "GET":
+            return self._order_lookup(query)
+
+        if path == "/order/page" and method == "POST":
+            return 200, self._order_page(body or {})
+
+        if path == "/catalog" and method == "GET":
+            return 200, self._catalog(query)
+
+        if path == "/catalog/batch/small" and method == "POST":
+            return 200, {
+                "status": "success",
+                "requestId": f"mock-{self._new_id()}",
+                "messages": [],
+            }
+
+        return 404, {"message": "not found"}
+
+    def _order_page(self, body: Dict) -> Dict:
+        if body.get("scrollId"):
+            scroll = json.loads(base64.urlsafe_b64decode(body["scrollId"]))
+            start, end, limit = scroll["start"], scroll["end"], scroll["limit"]
+        else:
+            since = _parse_iso(body.get("ordersCreatedSince")) or self.created_from
+            until = _parse_iso(body.get("until")) or self.created_to
+            start = bisect.bisect_left(self._order_times, since)
+            end = bisect.bisect_right(self._order_times, until)
+            limit = int(body.get("limit") or 100)
+
+        page_end = min(start + limit, end)
+        scroll_id = None
+
+        if page_end < end:
+            scroll_id = base64.urlsafe_b64encode(json.dumps({
+                "start": page_end,
+                "end": end,
+                "limit": limit,
+            }).encode()).decode()
+
+        return {
+            "orders": self.dsco_orders[start:page_end],
+            "scrollId": scroll_id,
+        }
+
+    def _order_lookup(self, query: Dict) -> Tuple[int, Any]:
+        key, value = query.get("orderKey"), query.get("value")
+        for order in self.dsco_orders:
+            if order.get(key) == value:
+                return 200, order
+        return 404, {"message": "order not found"}
+
+    def _catalog(self, query: Dict) -> Dict:
+        if "page" not in query:
+            # Lookup puntual (sku=... / dscoItemId=...)
+            sku = query.get("sku")
+            items = [p for p in self.dsco_products if p["sku"] == sku]
+            return {"items": items}
+
+        page = int(query["page"])
+        size = int(query.get("size") or 100)
+        total_pages = -(-len(self.dsco_products) // size)
+
+        return {
+            "items": self.dsco_products[page * size:(page + 1) * size],
+            "page": page,
+            "totalPages": total_pages,
+        }
+
+    # -------------------------------------------------
+    # Mintsoft
+    # -------------------------------------------------
+    def mintsoft(
+        self,
+        method: str,
+        path: str,
+        query: Dict,
+        body: Any,
+        api_key: Optional[str] = None,
+    ) -> Tuple[int, Any]:
+        if path == "/Auth" and method == "POST":
+            return 200, self.api_key
+
+        if api_key != self.api_key:
+            return 401, {"message": "Authorization has been denied for this request."}
+
+        if path == "/Order" and method == "PUT":
+            order_id = self._new_id()
+            with self._lock:
+                self.mintsoft_orders[body.get("OrderNumber")] = {
+                    "ID": order_id,
+                    "OrderNumber": body.get("OrderNumber"),
+                }
+            return 200, {"OrderId": order_id, "Success": True}
+
+        if path.startswith("/Order/") and path != "/Order/List" and method == "POST":
+            return 200, {"Success": True}
+
+        if path.startswith("/Order/") and path != "/Order/List" and method == "GET":
+            return self._by_id(self.mintsoft_orders, path)
+
+        if path == "/Order/List" and method == "GET":
+            with self._lock:
+                rows = list(self.mintsoft_orders.values())
+            return 200, _page_of(rows, query)
+
+        if path == "/Product" and method in ("PUT", "POST"):
+            product_id = body.get("ID") or self._new_id()
+            with self._lock:
+                self.mintsoft_products[body.get("SKU")] = {
+                    "ID": product_id,
+                    "SKU": body.get("SKU"),
+                }
+            return 200, {"ID": product_id, "Success": True}
+
+        if path == "/Product/List" and method == "GET":
+            with self._lock:
+                rows = list(self.mintsoft_products.values())
+            return 200, _page_of(rows, query)
+
+        if path.startswith("/Product/") and method == "GET":
+            return self._by_id(self.mintsoft_products, path)
+
+        return 404, {"message": "not found"}
+
+
+    def _by_id(self, rows: Dict[str, Dict[str, Any]], path: str) -> Tuple[int, Any]:
+        """GET /Product/{id} / GET /Order/{id}"""
+        record_id = path.rsplit("/", 1)[-1]
+        with self._lock:
+            for row in rows.values():
+                if str(row.get("ID")) == record_id:
+                    return 200, row
+        return 404, {"message": "not found"}
+
+
+def point_clients_at(url: str) -> None:
+    """
+    Apunta los clientes (sync y, si aiohttp está
+    instalado, async) al servidor mock
+    """
+    from clients.dsco_order_client import DscoOrderClient
+    from clients.dsco_product_client import DscoProductClient
+    from clients.mintsoft_order_client import MintsoftOrderClient
+    from clients.mintsoft_product_client import MintsoftProductClient
+
+    classes = [
+        (DscoOrderClient, DscoProductClient, MintsoftOrderClient, MintsoftProductClient),
+    ]
+
+    try:
+        from clients.async_dsco_order_client import AsyncDscoOrderClient
+        from clients.async_dsco_product_client import AsyncDscoProductClient
+        from clients.async_mintsoft_order_client import AsyncMintsoftOrderClient
+        from clients.async_mintsoft_product_client import AsyncMintsoftProductClient
+    except ImportError:
+        pass
+    else:
+        classes.append((
+            AsyncDscoOrderClient,
+            AsyncDscoProductClient,
+            AsyncMintsoftOrderClient,
+            AsyncMintsoftProductClient,
+        ))
+
+    for dsco_order, dsco_product, mintsoft_order, mintsoft_product in classes:
+        dsco_order.BASE_URL = dsco_product.BASE_URL = f"{url}{DSCO_PREFIX}"
+        dsco_order.AUTH_URL = dsco_product.TOKEN_URL = (
+            f"{url}{DSCO_PREFIX}/oauth2/token"
+        )
+        mintsoft_order.BASE_URL = url
+        mintsoft_product.BASE_URL = f"{url}{MINTSOFT_PREFIX}"
+
+
+# -------------------------------------------------
+# HTTP server / handler
+# -------------------------------------------------
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    # El default (5) descarta conexiones cuando un cliente
+    # async abre decenas a la vez
+    request_queue_size = 512
+
+    def handle_error(self, request, client_address) -> None:
+        # Clientes que cierran la conexión (fin del bench, pool
+        # cerrado en los tests) no son errores del mock
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep-alive, como las APIs reales
+    protocol_version = "HTTP/1.1"
+
+    # Headers y body van en writes separados: sin esto Nagle +
+    # delayed ACK agregan ~40ms a cada respuesta
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def do_PUT(self) -> None:
+        self._handle("PUT")
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _handle(self, method: str) -> None:
+        mock: MockServer = self.server.mock
+
+        parts = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        body = _parse_body(raw, self.headers.get("Content-Type", ""))
+
+        mock._count(method, parts.path)
+
+        scripted = mock._next_scripted(method, parts.path)
+        if scripted is not None:
+            status, headers = scripted
+            return self._send(status, {"message": "scripted"}, headers)
+
+        delay = mock._delay()
+        if delay < 0:
+            return self._send(503, {"message": "mock error"})
+        if delay:
+            time.sleep(delay)
+
+        path = parts.path
+        if path.startswith(DSCO_PREFIX):
+            status, payload = mock.dsco(
+                method,
+                path[len(DSCO_PREFIX):],
+                query,
+                body,
+                self.headers.get("Authorization", "").split(" ")[-1],
+            )
+        elif path.startswith(MINTSOFT_PREFIX):
+            status, payload = mock.mintsoft(
+                method,
+                path[len(MINTSOFT_PREFIX):],
+                query,
+                body,
+                self.headers.get("ms-apikey"),
+            )
+        else:
+            status, payload = 404, {"message": "not found"}
+
+        self._send(status, payload)
+
+    def _send(
+        self,
+        status: int,
+        payload: Any,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        data = json.dumps(payload).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+# -------------------------------------------------
+# Helpers
+# -------------------------------------------------
+def _parse_body(raw: bytes, content_type: str) -> Any:
+    if not raw:
+        return None
+
+    if "application/x-www-form-urlencoded" in content_type:
+        return {k: v[-1] for k, v in parse_qs(raw.decode()).items()}
+
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+def _page_of(rows: List[Dict[str, Any]], query: Dict) -> List[Dict[str, Any]]:
+    page = int(query.get("PageNo") or 1)
+    limit = int(query.get("Limit") or 100)
+
+    return rows[(page - 1) * limit:page * limit]
+
+
+def _parse_iso(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+
+    return parsed
@@ -0,0 +1,221 @@
+"""
+Benchmark de sync_all_orders / sync_all_products
+contra el servidor mock (sin APIs reales)
+
+    python -m bench.run_bench --orders 2000 --products 2000 --latency 0.02
+
+Cada escenario corre en un proceso propio (state/, logs y
+pico de RSS aislados) y reporta items/seg, requests y RSS.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+
+SCENARIOS = ("orders", "products")
+MODES = ("sync", "async")
+
+
+# -------------------------------------------------
+# Escenario (proceso hijo)
+# -------------------------------------------------
+def _run_scenario(scenario: str, mode: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    workdir = tempfile.mkdtemp(prefix=f"bench-{scenario}-")
+
+    # Antes de importar clientes / servicios (leen env al importar)
+    os.environ.update({
+        "STATE_DIR": os.path.join(workdir, "state"),
+        "LOG_DIR": os.path.join(workdir, "logs"),
+        "LOG_LEVEL": options["log_level"],
+        "DSCO_CLIENT_ID": "bench",
+        "DSCO_CLIENT_SECRET": "bench",
+        "MINTSOFT_USERNAME": "bench",
+        "MINTSOFT_PASSWORD": "bench",
+        "MINTSOFT_CLIENT_ID": "1",
+    })
+    os.environ.pop("DSCO_TOKEN_CACHE_FILE", None)
+    os.environ.pop("MINTSOFT_API_KEY_CACHE_FILE", None)
+
+    # product_logger escribe en ./logs
+    os.chdir(workdir)
+
+    from bench.mock_server import MockServer, point_clients_at
+
+    server = MockServer(
+        orders=options["orders"],
+        products=options["products"],
+        latency=options["latency"],
+        jitter=options["jitter"],
+        error_rate=options["error_rate"],
+        seed=options["seed"],
+    ).start()
+
+    point_clients_at(server.url)
+
+    try:
+        start = time.perf_counter()
+        items = _sync(scenario, mode, server, options)
+        elapsed = time.perf_counter() - start
+    finally:
+        server.stop()
+
+    from loggers.metrics import registry
+
+    return {
+        "scenario": scenario,
+        "mode": mode,
+        "items": items,
+        "seconds": round(elapsed, 3),
+        "items_per_sec": round(items / elapsed, 1) if elapsed else 0.0,
+        "requests": server.request_count(),
+        "injected_errors": server.errors,
+        "requests_by_endpoint": dict(sorted(server.requests.items())),
+        # ru_maxrss está en KB en Linux
+        "peak_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+        ),
+        # Latencia por endpoint / etapa (loggers.metrics)
+        "metrics": registry.summary(),
+    }
+
+
+def _sync(scenario: str, mode: str, server, options: Dict[str, Any]) -> int:
+    window = {
+        "updated_from": server.created_from,
+        "updated_to": server.created_to,
+    }
+    workers = options["workers"]
+
+    if mode == "async":
+        import asyncio
+
+        async def _main() -> None:
+            if scenario == "orders":
+                from services.async_order_service import AsyncOrderSyncService
+                service = AsyncOrderSyncService()
+                await service.sync_all_orders(workers=workers, **window)
+            else:
+                from services.async_product_service import AsyncProductSyncService
+                service = AsyncProductSyncService()
+                await service.sync_all_products(
+                    page_size=options["page_size"],
+                    created_from=server.created_from,
+                    workers=workers,
+                    **window,
+                )
+            await service.aclose()
+
+        asyncio.run(_main())
+
+    elif scenario == "orders":
+        from services.order_service import OrderSyncService
+        OrderSyncService().sync_all_orders(workers=workers, **window)
+
+    else:
+        from services.product_service import ProductSyncService
+        ProductSyncService().sync_all_products(
+            page_size=options["page_size"],
+            created_from=server.created_from,
+            workers=workers,
+            **window,
+        )
+
+    if scenario == "orders":
+        return len(server.mintsoft_orders)
+    return len(server.mintsoft_products)
+
+
+def _child(queue, scenario: str, mode: str, options: Dict[str, Any]) -> None:
+    try:
+        queue.put(_run_scenario(scenario, mode, options))
+    except BaseException as e:
+        queue.put({"scenario": scenario, "mode": mode, "error": repr(e)})
+
+
+def run(scenarios: List[str], modes: List[str], options: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Corre cada escenario / modo en un proceso nuevo"""
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+
+    for mode in modes:
+        for scenario in scenarios:
+            queue = ctx.Queue()
+            process = ctx.Process(
+                target=_child,
+                args=(queue, scenario, mode, options),
+            )
+            process.start()
+            results.append(queue.get())
+            process.join()
+
+    return results
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+def _print_table(results: List[Dict[str, Any]]) -> None:
+    header = f"{'scenario':<10}{'mode':<7}{'items':>8}{'sec':>9}{'items/s':>10}{'requests':>10}{'errors':>8}{'rss MB':>9}"
+    print(header)
+    print("-" * len(header))
+
+    for r in results:
+        if "error" in r:
+            print(f"{r['scenario']:<10}{r['mode']:<7}  FAILED: {r['error']}")
+            continue
+
+        print(
+            f"{r['scenario']:<10}{r['mode']:<7}{r['items']:>8}{r['seconds']:>9}"
+            f"{r['items_per_sec']:>10}{r['requests']:>10}"
+            f"{r['injected_errors']:>8}{r['peak_rss_mb']:>9}"
+        )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenario", choices=SCENARIOS, action="append")
+    parser.add_argument("--mode", choices=MODES + ("both",), default="sync")
+    parser.add_argument("--orders", type=int, default=1000)
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.0, help="segundos por request")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fracción de 503")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--json", action="store_true", help="salida JSON")
+    args = parser.parse_args(argv)
+
+    options = {
+        "orders": args.orders,
+        "products": args.products,
+        "page_size": args.page_size,
+        "workers": args.workers,
+        "latency": args.latency,
+        "jitter": args.jitter,
+        "error_rate": args.error_rate,
+        "seed": args.seed,
+        "log_level": args.log_level,
+    }
+    modes = list(MODES) if args.mode == "both" else [args.mode]
+
+    results = run(args.scenario or list(SCENARIOS), modes, options)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_table(results)
+
+    return 1 if any("error" in r for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,461 @@
+"""
+Generador de datos sintéticos DSCO (órdenes y catálogo)
+a partir de models/dsco_order_model.json y
+models/dsco_product_model.json
+
+    python -m bench.synthetic orders --count 1000000 --out orders.jsonl
+    python -m bench.synthetic products --count 50000 --out - | head
+
+Determinístico por seed. La salida es JSONL en streaming
+(memoria constante aunque se generen millones de registros).
+"""
+
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Optional
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODELS_DIR = os.path.join(ROOT, "models")
+
+ORDER_MODEL = "dsco_order_model.json"
+PRODUCT_MODEL = "dsco_product_model.json"
+
+# Fin del rango de orderDate si no se pasa uno: fijo, para
+# que la misma seed dé siempre la misma salida
+DEFAULT_CREATED_TO = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+# -------------------------------------------------
+# Valores "realistas" por nombre de campo
+# -------------------------------------------------
+FIRST_NAMES = ["Ana", "John", "Maria", "James", "Laura", "David", "Sofia", "Peter", "Emma", "Lucas"]
+LAST_NAMES = ["Smith", "Garcia", "Brown", "Jones", "Miller", "Davis", "Lopez", "Wilson", "Taylor", "Clark"]
+STREETS = ["High Street", "Station Road", "Main Street", "Park Road", "Church Lane", "Victoria Road"]
+CITIES = [
+    ("London", "Greater London", "GB"),
+    ("Manchester", "Greater Manchester", "GB"),
+    ("Leeds", "West Yorkshire", "GB"),
+    ("New York", "NY", "US"),
+    ("Austin", "TX", "US"),
+    ("Madrid", None, "ES"),
+]
+COMPANIES = ["Acme Ltd", "Globex", "Initech", "Umbrella Co", "Stark Retail"]
+CHANNELS = ["amazon", "walmart", "target", "wayfair", "direct"]
+SHIPPING_METHODS = ["UPS Ground", "UPS", "DHL", "FEDEX", "Royal Mail 48"]
+ORDER_STATUSES = (["created", "shipment_pending", "shipped", "cancelled"], [60, 25, 12, 3])
+PRODUCT_STATUSES = (["active", "pending", "discontinued"], [85, 10, 5])
+BRANDS = ["Northwind", "Contoso", "Fabrikam", "Tailspin", "Litware"]
+CATEGORIES = ["Home", "Garden", "Kitchen", "Toys", "Outdoor", "Office"]
+ADJECTIVES = ["Classic", "Deluxe", "Compact", "Premium", "Eco", "Pro"]
+NOUNS = ["Lamp", "Chair", "Kettle", "Planter", "Backpack", "Desk", "Blanket", "Tent"]
+WAREHOUSES = [("WH1", "Main warehouse"), ("WH2", "North DC"), ("WH3", "Overflow")]
+TAGS = ["gift", "priority", "fragile", "promo", "b2b"]
+
+
+class SyntheticGenerator:
+    """
+    Órdenes y productos DSCO sintéticos.
+
+    - catalog_size: cantidad de SKUs distintos
+    - skew: exponente Zipf de popularidad de SKUs en las
+      órdenes (0 = uniforme, ~1.1 = pocos SKUs concentran
+      la mayoría de las líneas)
+    - min_lines / mean_lines / max_lines: líneas por orden
+    - null_rate: probabilidad de null en campos opcionales
+    - created_from / created_to: rango de orderDate (default:
+      30 días hasta DEFAULT_CREATED_TO); las órdenes salen
+      ordenadas por fecha
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        catalog_size: int = 10000,
+        skew: float = 1.1,
+        min_lines: int = 1,
+        mean_lines: float = 1.8,
+        max_lines: int = 10,
+        null_rate: float = 0.1,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ):
+        if catalog_size <= 0:
+            raise ValueError("catalog_size must be > 0")
+        if not 1 <= min_lines <= max_lines:
+            raise ValueError("expected 1 <= min_lines <= max_lines")
+
+        self.seed = seed
+        self.catalog_size = catalog_size
+        self.skew = skew
+        self.min_lines = min_lines
+        self.mean_lines = max(mean_lines, min_lines)
+        self.max_lines = max_lines
+        self.null_rate = null_rate
+
+        self.created_to = created_to or DEFAULT_CREATED_TO
+        self.created_from = created_from or self.created_to - timedelta(days=30)
+
+        self._random = random.Random(seed)
+
+        # Pesos acumulados Zipf: elegir un SKU es O(log n)
+        self._sku_weights: Optional[List[float]] = None
+        if skew > 0:
+            self._sku_weights = list(itertools.accumulate(
+                1.0 / (rank ** skew) for rank in range(1, catalog_size + 1)
+            ))
+
+        self._order_builder = _compile(_load_model(ORDER_MODEL), ORDER_FIELDS, self)
+        self._product_builder = _compile(_load_model(PRODUCT_MODEL), PRODUCT_FIELDS, self)
+
+    # -------------------------------------------------
+    # Public
+    # -------------------------------------------------
+    def iter_orders(self, count: int) -> Iterator[Dict[str, Any]]:
+        step = (self.created_to - self.created_from) / max(count, 1)
+
+        for index in range(count):
+            ctx = {
+                "index": index,
+                "date": self.created_from + step * index,
+            }
+            order = self._order_builder(ctx)
+
+            # Totales coherentes con las líneas
+            totals = order.get("totals")
+            if isinstance(totals, dict):
+                totals["orderValue"] = round(sum(
+                    line["quantity"] * (line.get("unitPrice") or 0)
+                    for line in order.get("orderLines") or []
+                ), 2)
+
+            yield order
+
+    def iter_products(self, count: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        for index in range(self.catalog_size if count is None else count):
+            ctx = {
+                "index": index,
+                "sku_index": index % self.catalog_size,
+                "date": self.created_from,
+            }
+            yield self._product_builder(ctx)
+
+    # -------------------------------------------------
+    # Helpers usados por los campos
+    # -------------------------------------------------
+    def sku(self, sku_index: int) -> str:
+        return f"SKU-{sku_index:07d}"
+
+    def price(self, sku_index: int) -> float:
+        # Precio estable por SKU (órdenes y catálogo coinciden)
+        return round(4.99 + (sku_index * 7919 % 19500) / 100, 2)
+
+    def pick_sku(self) -> int:
+        if self._sku_weights is None:
+            return self._random.randrange(self.catalog_size)
+
+        return self._random.choices(
+            range(self.catalog_size),
+            cum_weights=self._sku_weights,
+        )[0]
+
+    def line_count(self) -> int:
+        extra = self.mean_lines - self.min_lines
+        count = self.min_lines
+        if extra > 0:
+            count += int(self._random.expovariate(1.0 / extra))
+        return min(count, self.max_lines)
+
+
+# -------------------------------------------------
+# Campos conocidos: nombre → valor(gen, ctx)
+# -------------------------------------------------
+Field = Callable[[SyntheticGenerator, Dict[str, Any]], Any]
+
+
+def _choice(options: List[Any]) -> Field:
+    return lambda gen, ctx: gen._random.choice(options)
+
+
+def _weighted(options: List[Any], weights: List[int]) -> Field:
+    return lambda gen, ctx: gen._random.choices(options, weights)[0]
+
+
+def _city(gen: SyntheticGenerator, ctx: Dict[str, Any]) -> tuple:
+    # Misma ciudad en toda la orden (city / state / country coherentes)
+    if "city" not in ctx:
+        ctx["city"] = gen._random.choice(CITIES)
+    return ctx["city"]
+
+
+def _person(gen: SyntheticGenerator, ctx: Dict[str, Any]) -> tuple:
+    if "person" not in ctx:
+        ctx["person"] = (
+            gen._random.choice(FIRST_NAMES),
+            gen._random.choice(LAST_NAMES),
+        )
+    return ctx["person"]
+
+
+def _warehouse(ctx: Dict[str, Any]) -> tuple:
+    return WAREHOUSES[(ctx["index"] + ctx.get("line", 0)) % len(WAREHOUSES)]
+
+
+def _line_sku(gen: SyntheticGenerator, ctx: Dict[str, Any]) -> str:
+    ctx["sku_index"] = gen.pick_sku()
+    return gen.sku(ctx["sku_index"])
+
+
+def _product_name(sku_index: int) -> str:
+    return (
+        f"{ADJECTIVES[sku_index % len(ADJECTIVES)]} "
+        f"{NOUNS[(sku_index // len(ADJECTIVES)) % len(NOUNS)]} "
+        f"{sku_index}"
+    )
+
+
+def _ean13(gen: SyntheticGenerator, ctx: Dict[str, Any]) -> str:
+    body = f"50{ctx['sku_index']:010d}"
+    total = sum(int(d) * (3 if i % 2 else 1) for i, d in enumerate(body))
+    return body + str((10 - total % 10) % 10)
+
+
+def _iso(value: datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+COMMON_FIELDS: Dict[str, Field] = {
+    "client": lambda gen, ctx: "synthetic-client",
+    "company": _choice(COMPANIES),
+    "firstName": lambda gen, ctx: _person(gen, ctx)[0],
+    "lastName": lambda gen, ctx: _person(gen, ctx)[1],
+    "address1": lambda gen, ctx: f"{gen._random.randint(1, 250)} {gen._random.choice(STREETS)}",
+    "address2": lambda gen, ctx: f"Flat {gen._random.randint(1, 40)}",
+    "address3": lambda gen, ctx: None,
+    "city": lambda gen, ctx: _city(gen, ctx)[0],
+    "state": lambda gen, ctx: _city(gen, ctx)[1],
+    "country": lambda gen, ctx: _city(gen, ctx)[2],
+    "postalCode": lambda gen, ctx: f"{gen._random.randint(10000, 99999)}",
+    "email": lambda gen, ctx: (
+        f"{_person(gen, ctx)[0]}.{_person(gen, ctx)[1]}{ctx['index'] % 1000}@example.com"
+    ).lower(),
+    "phone": lambda gen, ctx: f"+44 7{gen._random.randint(100000000, 999999999)}",
+    "warehouseCode": lambda gen, ctx: _warehouse(ctx)[0],
+    "warehouseName": lambda gen, ctx: _warehouse(ctx)[1],
+    "currency": lambda gen, ctx: "USD",
+}
+
+ORDER_FIELDS: Dict[str, Field] = {
+    **COMMON_FIELDS,
+    "orderNumber": lambda gen, ctx: f"SYN-{gen.seed}-{ctx['index']:09d}",
+    "externalOrderReference": lambda gen, ctx: f"PO-{gen._random.randrange(10 ** 8):08d}",
+    "orderStatus": _weighted(*ORDER_STATUSES),
+    "orderType": lambda gen, ctx: "dropship",
+    "orderDate": lambda gen, ctx: _iso(ctx["date"]),
+    "shipByDate": lambda gen, ctx: _iso(ctx["date"] + timedelta(days=gen._random.randint(1, 3))),
+    "deliverByDate": lambda gen, ctx: _iso(ctx["date"] + timedelta(days=gen._random.randint(3, 7))),
+    "channel": _choice(CHANNELS),
+    "shippingMethod": _choice(SHIPPING_METHODS),
+    "carrier": lambda gen, ctx: gen._random.choice(SHIPPING_METHODS).split()[0],
+    "serviceLevel": _choice(["standard", "express", "next_day"]),
+    "lineNumber": lambda gen, ctx: ctx["line"] + 1,
+    "sku": _line_sku,
+    "description": lambda gen, ctx: _product_name(ctx["sku_index"]),
+    "quantity": lambda gen, ctx: 1 + int(gen._random.expovariate(1.5)),
+    "unitPrice": lambda gen, ctx: gen.price(ctx["sku_index"]),
+    "orderValue": lambda gen, ctx: 0.0,
+    "shipping": lambda gen, ctx: gen._random.choice([0.0, 4.99, 9.99]),
+    "tax": lambda gen, ctx: round(gen._random.uniform(0, 20), 2),
+    "discount": lambda gen, ctx: gen._random.choice([0.0, 0.0, 0.0, 5.0]),
+    "tags": lambda gen, ctx: gen._random.sample(TAGS, gen._random.randint(0, 2)),
+}
+
+PRODUCT_FIELDS: Dict[str, Field] = {
+    **COMMON_FIELDS,
+    "productId": lambda gen, ctx: f"P{ctx['sku_index']:09d}",
+    "sku": lambda gen, ctx: gen.sku(ctx["sku_index"]),
+    "externalSku": lambda gen, ctx: f"EXT-{ctx['sku_index']:07d}",
+    "productName": lambda gen, ctx: _product_name(ctx["sku_index"]),
+    "description": lambda gen, ctx: f"{_product_name(ctx['sku_index'])} - synthetic item",
+    "status": _weighted(*PRODUCT_STATUSES),
+    "productType": lambda gen, ctx: "simple",
+    "brand": lambda gen, ctx: BRANDS[ctx["sku_index"] % len(BRANDS)],
+    "category": lambda gen, ctx: CATEGORIES[ctx["sku_index"] % len(CATEGORIES)],
+    "barcode": _ean13,
+    "weight": lambda gen, ctx: round(gen._random.uniform(0.1, 25), 2),
+    "length": lambda gen, ctx: round(gen._random.uniform(5, 120), 1),
+    "width": lambda gen, ctx: round(gen._random.uniform(5, 80), 1),
+    "height": lambda gen, ctx: round(gen._random.uniform(1, 60), 1),
+    "weightUnit": lambda gen, ctx: "kg",
+    "dimensionUnit": lambda gen, ctx: "cm",
+    "cost": lambda gen, ctx: round(gen.price(ctx["sku_index"]) * 0.55, 2),
+    "price": lambda gen, ctx: gen.price(ctx["sku_index"]),
+    "trackingType": lambda gen, ctx: "standard",
+    "batchTracking": lambda gen, ctx: False,
+    "serialTracking": lambda gen, ctx: False,
+    "stockOnHand": lambda gen, ctx: gen._random.randint(0, 500),
+    "stockAllocated": lambda gen, ctx: gen._random.randint(0, 20),
+    "stockAvailable": lambda gen, ctx: gen._random.randint(0, 480),
+    "name": _choice(["color", "size", "material"]),
+    "value": _choice(["red", "blue", "M", "L", "oak", "steel"]),
+    "createdAt": lambda gen, ctx: _iso(ctx["date"]),
+    "updatedAt": lambda gen, ctx: _iso(ctx["date"] + timedelta(hours=gen._random.randint(0, 72))),
+}
+
+
+# -------------------------------------------------
+# Schema → builder
+# -------------------------------------------------
+def _load_model(filename: str) -> Dict[str, Any]:
+    with open(os.path.join(MODELS_DIR, filename), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _compile(
+    schema: Any,
+    fields: Dict[str, Field],
+    gen: SyntheticGenerator,
+    name: str = "",
+) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Convierte el modelo (tipos como "string | null",
+    "number", objetos y listas) en una función que
+    arma un registro. Se compila una sola vez.
+    """
+
+    if isinstance(schema, dict):
+        children = [
+            (key, _compile(value, fields, gen, key))
+            for key, value in schema.items()
+        ]
+        return lambda ctx: {key: build(ctx) for key, build in children}
+
+    if isinstance(schema, list):
+        item = _compile(schema[0], fields, gen, name) if schema else (lambda ctx: None)
+
+        def build_list(ctx: Dict[str, Any]) -> List[Any]:
+            count = gen.line_count() if name == "orderLines" else gen._random.randint(1, 3)
+            items = []
+            for line in range(count):
+                ctx["line"] = line
+                items.append(item(ctx))
+            return items
+
+        return build_list
+
+    spec = str(schema)
+    nullable = "null" in spec
+    value = fields.get(name) or _fallback(spec.split("|")[0].strip(), name)
+
+    if not nullable:
+        return lambda ctx: value(gen, ctx)
+
+    return lambda ctx: None if gen._random.random() < gen.null_rate else value(gen, ctx)
+
+
+def _fallback(kind: str, name: str) -> Field:
+    """Campos sin valor conocido: valor genérico según el tipo"""
+    if kind.startswith("number"):
+        return lambda gen, ctx: round(gen._random.uniform(0, 100), 2)
+    if kind.startswith("boolean"):
+        return lambda gen, ctx: gen._random.random() < 0.5
+    if kind.startswith("string[]"):
+        return lambda gen, ctx: [f"{name}-{gen._random.randint(1, 9)}"]
+    if "ISO 8601" in kind:
+        return lambda gen, ctx: _iso(ctx["date"])
+    return lambda gen, ctx: f"{name}-{gen._random.randrange(10 ** 6)}"
+
+
+# -------------------------------------------------
+# JSONL
+# -------------------------------------------------
+def write_jsonl(records: Iterable[Dict[str, Any]], out: IO[str]) -> int:
+    """Escribe un registro por línea. Devuelve la cantidad."""
+    count = 0
+    for record in records:
+        out.write(json.dumps(record, separators=(",", ":")))
+        out.write("\n")
+        count += 1
+    return count
+
+
+def read_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """Lee un JSONL en streaming (para alimentar mappers / servicios)"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+def _iso_datetime(value: str) -> datetime:
+    """ISO 8601 (acepta Z); sin zona horaria se asume UTC"""
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid ISO 8601 date: {value}")
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+
+    return parsed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("kind", choices=("orders", "products"))
+    parser.add_argument("--count", type=int, help="default: 1000 órdenes / catalog-size productos")
+    parser.add_argument("--out", default="-", help="archivo de salida (- = stdout)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--catalog-size", type=int, default=10000)
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf, 0 = uniforme")
+    parser.add_argument("--min-lines", type=int, default=1)
+    parser.add_argument("--mean-lines", type=float, default=1.8)
+    parser.add_argument("--max-lines", type=int, default=10)
+    parser.add_argument("--null-rate", type=float, default=0.1)
+    parser.add_argument("--days", type=float, default=30, help="rango de orderDate hasta --end")
+    parser.add_argument(
+        "--end",
+        type=_iso_datetime,
+        default=DEFAULT_CREATED_TO,
+        help=f"fin del rango de orderDate, ISO 8601 (default: {DEFAULT_CREATED_TO.date()})",
+    )
+    args = parser.parse_args(argv)
+
+    created_to = args.end
+    gen = SyntheticGenerator(
+        seed=args.seed,
+        catalog_size=args.catalog_size,
+        skew=args.skew,
+        min_lines=args.min_lines,
+        mean_lines=args.mean_lines,
+        max_lines=args.max_lines,
+        null_rate=args.null_rate,
+        created_from=created_to - timedelta(days=args.days),
+        created_to=created_to,
+    )
+
+    if args.kind == "orders":
+        records = gen.iter_orders(args.count or 1000)
+    else:
+        records = gen.iter_products(args.count)
+
+    if args.out == "-":
+        write_jsonl(records, sys.stdout)
+    else:
+        with open(args.out, "w", encoding="utf-8") as f:
+            count = write_jsonl(records, f)
+        print(f"{count} {args.kind} → {args.out}", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+import asyncio
+import json
+import os
+import time
+import weakref
+from typing import Any, Awaitable, Callable, AsyncIterator, Dict, List, Optional
+
+import aiohttp
+import requests
+
+from clients.base_client import (
+    HTTP_PAGE_FANOUT,
+    HTTP_TIMEOUT,
+    IDEMPOTENT_METHODS,
+    PageWalk,
+    _log_reauth,
+    _log_retry,
+    retry_policy,
+)
+from clients.rate_limiter import get_rate_limiter
+from loggers import metrics
+
+
+# -------------------------------------------------
+# Configuración
+# -------------------------------------------------
+# Conexiones abiertas en total / por host (un solo event loop
+# puede tener cientos de requests en vuelo)
+HTTP_ASYNC_POOL_SIZE = int(os.getenv("HTTP_ASYNC_POOL_SIZE", 200))
+HTTP_ASYNC_POOL_PER_HOST = int(os.getenv("HTTP_ASYNC_POOL_PER_HOST", 100))
+
+
+# -------------------------------------------------
+# Respuesta (misma interfaz que requests.Response)
+# -------------------------------------------------
+class AsyncResponse:
+    """
+    Respuesta ya leída, con la interfaz de requests.Response
+    que usan los clientes (status_code, ok, text, json,
+    raise_for_status). El body se lee completo al recibirla
+    y la conexión vuelve al pool enseguida.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        status_code: int,
+        reason: Optional[str],
+        headers: Dict[str, str],
+        content: bytes,
+    ):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason or ""
+        self.headers = headers
+        self.content = content
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.ok:
+            return
+
+        kind = "Client" if self.status_code < 500 else "Server"
+        raise requests.exceptions.HTTPError(
+            f"{self.status_code} {kind} Error: {self.reason} for url: {self.url}",
+            response=self,
+        )
+
+
+# -------------------------------------------------
+# Sesión compartida por event loop
+# -------------------------------------------------
+# Una ClientSession no se puede usar desde otro loop:
+# se guarda una por loop (se libera cuando el loop muere)
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_session() -> aiohttp.ClientSession:
+    """
+    Devuelve la sesión del event loop actual.
+    Un solo pool de conexiones (keep-alive) para todos
+    los clientes async.
+    """
+    loop = asyncio.get_running_loop()
+
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=HTTP_ASYNC_POOL_SIZE,
+                limit_per_host=HTTP_ASYNC_POOL_PER_HOST,
+            ),
+        )
+        _sessions[loop] = session
+
+    return session
+
+
+async def close_async_sessions() -> None:
+    """Cierra la sesión del loop actual (fin del run)"""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+# -------------------------------------------------
+# Request
+# -------------------------------------------------
+async def async_request(
+    method: str,
+    url: str,
+    *,
+    retry: Optional[bool] = None,
+    **kwargs: Any,
+) -> AsyncResponse:
+    """
+    Versión async de base_client.request:
+    mismo rate limit por host, misma política de
+    reintentos y mismo presupuesto de reintentos.
+
+    Acepta los kwargs de requests (headers, params,
+    json, data, timeout). Los errores de conexión se
+    re-lanzan como requests.exceptions.* para que el
+    manejo de errores sea el mismo que en los clientes sync.
+    """
+    method = method.upper()
+    retryable = method in IDEMPOTENT_METHODS if retry is None else retry
+
+    timeout = kwargs.pop("timeout", HTTP_TIMEOUT)
+    kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+    if kwargs.get("params"):
+        kwargs["params"] = _query_params(kwargs["params"])
+
+    session = get_async_session()
+    limiter = get_rate_limiter(url)
+
+    attempt = 0
+    while True:
+        attempt += 1
+
+        # Cada intento (incluidos los reintentos) consume un token
+        if limiter is not None:
+            wait = limiter.reserve()
+            if wait:
+                await asyncio.sleep(wait)
+
+        start = time.perf_counter()
+        try:
+            async with session.request(method, url, **kwargs) as r:
+                response = AsyncResponse(
+                    method,
+                    str(r.url),
+                    r.status,
+                    r.reason,
+                    dict(r.headers),
+                    await r.read(),
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            metrics.record_http(method, url, "error", time.perf_counter() - start)
+            error = _as_requests_error(e)
+            if not retry_policy.should_retry(attempt, retryable, error=error):
+                raise error from e
+            _log_retry(method, url, attempt, str(error))
+            await asyncio.sleep(retry_policy.delay(attempt))
+            continue
+
+        metrics.record_http(
+            method,
+            url,
+            response.status_code,
+            time.perf_counter() - start,
+        )
+
+        if response.status_code < 400:
+            return response
+
+        if not retry_policy.should_retry(attempt, retryable, response=response):
+            return response
+
+        wait = retry_policy.delay(attempt, response)
+        _log_retry(method, url, attempt, f"HTTP {response.status_code}", wait)
+        await asyncio.sleep(wait)
+
+
+def _query_params(params: Dict[str, Any]) -> Dict[str, str]:
+    """Query string con las mismas reglas que requests"""
+    return {
+        key: str(value)
+        for key, value in params.items()
+        if value is not None
+    }
+
+
+def _as_requests_error(error: BaseException) -> requests.exceptions.RequestException:
+    # La conexión no llegó a establecerse: el request no se envió
+    if isinstance(error, getattr(aiohttp, "ConnectionTimeoutError", ())):
+        return requests.exceptions.ConnectTimeout(str(error))
+
+    if isinstance(error, (asyncio.TimeoutError, aiohttp.ServerTimeoutError)):
+        return requests.exceptions.ReadTimeout(str(error) or "Read timed out")
+
+    if isinstance(error, aiohttp.ClientConnectionError):
+        return requests.exceptions.ConnectionError(str(error))
+
+    return requests.exceptions.RequestException(str(error))
+
+
+# -------------------------------------------------
+# Base client
+# -------------------------------------------------
+class AsyncBaseClient:
+    """
+    Transporte HTTP común para los clientes async
+    DSCO / Mintsoft (aiohttp, una sesión por event loop)
+    """
+
+    TIMEOUT = HTTP_TIMEOUT
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        retry: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> AsyncResponse:
+        kwargs.setdefault("timeout", self.TIMEOUT)
+
+        response = await async_request(method, url, retry=retry, **kwargs)
+
+        if response.status_code != 401:
+            return response
+
+        # Ver BaseClient._request: se renuevan credenciales
+        # y se repite el request una sola vez
+        headers = await self._reauthenticate(kwargs.get("headers"))
+        if headers is None:
+            return response
+
+        _log_reauth(method, url)
+        kwargs["headers"] = headers
+
+        return await async_request(method, url, retry=retry, **kwargs)
+
+    async def _reauthenticate(
+        self,
+        headers: Optional[Dict[str, str]],
+    ) -> Optional[Dict[str, str]]:
+        """Hook ante un 401 (ver BaseClient._reauthenticate)"""
+        return None
+
+    async def _iter_pages(
+        self,
+        fetch_page: Callable[[int, int], Awaitable[List[Any]]],
+        page_size: int,
+        max_pages: int,
+        fanout: Optional[int] = None,
+        walk: Optional[PageWalk] = None,
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Igual que BaseClient._iter_pages: ventanas de
+        `fanout` páginas pedidas a la vez, entregadas
+        en orden, hasta la primera página vacía
+        """
+
+        fanout = max(1, fanout or HTTP_PAGE_FANOUT)
+        walk = walk or PageWalk()
+        page = 1
+
+        while page <= max_pages:
+            window = range(page, min(page + fanout, max_pages + 1))
+            tasks = [
+                asyncio.ensure_future(fetch_page(p, page_size))
+                for p in window
+            ]
+
+            try:
+                for task in tasks:
+                    batch = await task
+                    walk.add_page(batch, page_size)
+
+                    if not batch:
+                        return
+
+                    yield batch
+            finally:
+                # Páginas de la ventana que ya no se necesitan
+                for task in tasks:
+                    task.cancel()
+
+            page = window.stop
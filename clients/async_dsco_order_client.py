@@ -0,0 +1,212 @@
+import os
+from typing import AsyncIterator, Dict, List, Optional
+
+from clients.async_base_client import AsyncBaseClient
+from clients.dsco_auth import get_token_provider
+from clients.dsco_order_client import DscoOrderClient
+
+
+class AsyncDscoOrderClient(AsyncBaseClient):
+    """
+    Cliente DSCO – Orders API (asyncio)
+    Mismos métodos que DscoOrderClient, como corutinas
+    """
+
+    AUTH_URL = DscoOrderClient.AUTH_URL
+    BASE_URL = DscoOrderClient.BASE_URL
+
+    def __init__(self):
+        self.client_id = os.getenv("DSCO_CLIENT_ID")
+        self.client_secret = os.getenv("DSCO_CLIENT_SECRET")
+
+        if not self.client_id or not self.client_secret:
+            raise RuntimeError("Missing DSCO_CLIENT_ID or DSCO_CLIENT_SECRET")
+
+        # Mismo provider que el cliente sync (token y cache compartidos)
+        self._token_provider = get_token_provider(
+            self.client_id,
+            self.client_secret,
+            self.AUTH_URL,
+        )
+
+    # -------------------------------------------------
+    # OAuth
+    # -------------------------------------------------
+    async def _get_access_token(self) -> str:
+        return await self._token_provider.get_token_async()
+
+    async def _reauthenticate(
+        self,
+        headers: Optional[Dict[str, str]],
+    ) -> Optional[Dict[str, str]]:
+        # 401: el token venció antes de tiempo o fue rotado
+        return await self._token_provider.renewed_headers_async(headers)
+
+    async def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {await self._get_access_token()}",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+
+    # -------------------------------------------------
+    # Low level request
+    # -------------------------------------------------
+    async def _get(self, path: str, params: Optional[Dict] = None) -> Dict:
+        url = f"{self.BASE_URL}{path}"
+
+        r = await self._request(
+            "GET",
+            url,
+            headers=await self._headers(),
+            params=params,
+            timeout=30,
+        )
+        r.raise_for_status()
+        return r.json()
+
+    # ------------------------------------------------
+    # Get single order
+    # -----------------------------------------------
+    async def get_order(
+        self,
+        *,
+        order_key: str,
+        value: str,
+        dsco_account_id: Optional[str] = None,
+        dsco_trading_partner_id: Optional[str] = None,
+        return_multiple: bool = False,
+    ) -> Dict:
+        params = {
+            "orderKey": order_key,
+            "value": value,
+        }
+
+        if return_multiple:
+            params["returnMultiple"] = True
+
+        if dsco_account_id:
+            params["dscoAccountId"] = dsco_account_id
+
+        if dsco_trading_partner_id:
+            params["dscoTradingPartnerId"] = dsco_trading_partner_id
+
+        return await self._get("/order/", params)
+
+    # -------------------------------------------------
+    # Orders – paginated
+    # -------------------------------------------------
+    async def get_orders_page(
+        self,
+        *,
+        orders_created_since: str,
+        until: str,
+        limit: int = 100,
+        scroll_id: Optional[str] = None,
+    ) -> Dict:
+        """
+        Ver DscoOrderClient.get_orders_page
+        """
+        payload = {}
+        if scroll_id:
+            payload["scrollId"] = scroll_id
+        else:
+            payload = {
+                "ordersCreatedSince": orders_created_since,
+                "until": until,
+                "limit": limit
+            }
+
+        r = await self._request(
+            "POST",
+            f"{self.BASE_URL}/order/page",
+            headers=await self._headers(),
+            json=payload,
+            timeout=30,
+            retry=True,  # POST de lectura, seguro de repetir
+        )
+
+        r.raise_for_status()
+        return r.json()
+
+    # -------------------------------------------------
+    # Orders – all (auto scroll)
+    # -------------------------------------------------
+    async def get_all_orders(
+        self,
+        *,
+        orders_updated_since: str,
+        until: str,
+    ) -> List[Dict]:
+        """
+        Descarga todas las órdenes usando scrollId
+        """
+
+        return [
+            order
+            async for order in self.iter_all_orders(
+                orders_created_since=orders_updated_since,
+                until=until,
+            )
+        ]
+
+    async def iter_all_orders(
+        self,
+        *,
+        orders_created_since: str,
+        until: str,
+        limit: int = 100,
+    ) -> AsyncIterator[Dict]:
+        async for batch in self.iter_order_pages(
+            orders_created_since=orders_created_since,
+            until=until,
+            limit=limit,
+        ):
+            for order in batch:
+                yield order
+
+    async def iter_order_pages(
+        self,
+        *,
+        orders_created_since: str,
+        until: str,
+        limit: int = 100,
+        scroll_id: Optional[str] = None,
+    ) -> AsyncIterator[List[Dict]]:
+        async for data in self.iter_order_responses(
+            orders_created_since=orders_created_since,
+            until=until,
+            limit=limit,
+            scroll_id=scroll_id,
+        ):
+            yield data["orders"]
+
+    async def iter_order_responses(
+        self,
+        *,
+        orders_created_since: str,
+        until: str,
+        limit: int = 100,
+        scroll_id: Optional[str] = None,
+    ) -> AsyncIterator[Dict]:
+        """
+        Respuestas completas de /order/page
+        (orders + scrollId de la página siguiente)
+        """
+
+        while True:
+            data = await self.get_orders_page(
+                orders_created_since=orders_created_since,
+                until=until,
+                limit=limit,
+                scroll_id=scroll_id,
+            )
+
+            if not data.get("orders"):
+                break
+
+            yield data
+            scroll_id = data.get("scrollId")
+
+            if not scroll_id:
+                break
@@ -0,0 +1,192 @@
+import os
+from typing import AsyncIterator, Dict, List, Optional, Union
+
+from clients.async_base_client import AsyncBaseClient
+from clients.dsco_auth import get_token_provider
+from clients.dsco_product_client import DscoProductClient
+
+
+class AsyncDscoProductClient(AsyncBaseClient):
+    """
+    Cliente DSCO – Catalog / Products API (asyncio)
+    Mismos métodos que DscoProductClient, como corutinas
+    """
+
+    BASE_URL = DscoProductClient.BASE_URL
+    TOKEN_URL = DscoProductClient.TOKEN_URL
+
+    def __init__(self):
+        self.client_id = os.getenv("DSCO_CLIENT_ID")
+        self.client_secret = os.getenv("DSCO_CLIENT_SECRET")
+
+        if not self.client_id or not self.client_secret:
+            raise RuntimeError("Missing DSCO_CLIENT_ID or DSCO_CLIENT_SECRET")
+
+        # Mismo provider que el cliente sync (token y cache compartidos)
+        self._token_provider = get_token_provider(
+            self.client_id,
+            self.client_secret,
+            self.TOKEN_URL,
+        )
+
+    # -------------------------------------------------
+    # OAuth
+    # -------------------------------------------------
+    async def _get_oauth_token(self) -> str:
+        return await self._token_provider.get_token_async()
+
+    async def _reauthenticate(
+        self,
+        headers: Optional[Dict[str, str]],
+    ) -> Optional[Dict[str, str]]:
+        # 401: el token venció antes de tiempo o fue rotado
+        return await self._token_provider.renewed_headers_async(headers)
+
+    async def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"bearer {await self._get_oauth_token()}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+
+    # -------------------------------------------------
+    # Low level requests
+    # -------------------------------------------------
+    async def _get(self, path: str, params: Optional[Dict] = None) -> Dict:
+        url = f"{self.BASE_URL}{path}"
+
+        r = await self._request(
+            "GET",
+            url,
+            headers=await self._headers(),
+            params=params,
+            timeout=30,
+        )
+        r.raise_for_status()
+        return r.json()
+
+    async def _post(self, path: str, payload: Union[Dict, List[Dict]]) -> Dict:
+        url = f"{self.BASE_URL}{path}"
+
+        r = await self._request(
+            "POST",
+            url,
+            headers=await self._headers(),
+            json=payload,
+            timeout=60,
+            retry=True,  # updates de catálogo idempotentes
+        )
+        r.raise_for_status()
+        return r.json()
+
+    # -------------------------------------------------
+    # Catalog – single item lookup
+    # -------------------------------------------------
+    async def get_catalog_item(
+        self,
+        *,
+        item_key: str,
+        value: str,
+        dsco_retailer_id: Optional[str] = None,
+        dsco_trading_partner_id: Optional[str] = None,
+        return_multiple: bool = False,
+    ) -> Dict:
+        """
+        GET /catalog
+        item_key: sku | partnerSku | upc | ean | mpn | gtin | dscoItemId
+        """
+
+        params: Dict[str, Union[str, bool]] = {
+            item_key: value,
+        }
+
+        if return_multiple:
+            params["returnMultiple"] = True
+
+        if dsco_retailer_id:
+            params["dscoRetailerId"] = dsco_retailer_id
+
+        if dsco_trading_partner_id:
+            params["dscoTradingPartnerId"] = dsco_trading_partner_id
+
+        return await self._get("/catalog", params=params)
+
+    # -------------------------------------------------
+    # Catalog – paginated
+    # -------------------------------------------------
+    async def get_products_page(
+        self,
+        *,
+        page: int,
+        size: int = 100,
+        created_at_min: Optional[str] = None,
+        created_at_max: Optional[str] = None,
+        updated_at_min: Optional[str] = None,
+        updated_at_max: Optional[str] = None,
+    ) -> Dict:
+        """
+        Ver DscoProductClient.get_products_page
+        """
+
+        params: Dict[str, Union[str, int]] = {
+            "page": page,
+            "size": size,
+        }
+
+        if created_at_min:
+            params["createdAtMin"] = created_at_min
+        if created_at_max:
+            params["createdAtMax"] = created_at_max
+        if updated_at_min:
+            params["updatedAtMin"] = updated_at_min
+        if updated_at_max:
+            params["updatedAtMax"] = updated_at_max
+
+        return await self._get("/catalog", params=params)
+
+    async def iter_product_pages(
+        self,
+        *,
+        size: int = 100,
+        start_page: int = 0,
+        **filters: Optional[str],
+    ) -> AsyncIterator[List[Dict]]:
+        page = start_page
+
+        while True:
+            page_data = await self.get_products_page(
+                page=page,
+                size=size,
+                **filters,
+            )
+
+            products = (
+                page_data.get("content")
+                or page_data.get("items")
+                or page_data.get("products")
+                or []
+            )
+
+            if not products:
+                break
+
+            yield products
+
+            total_pages = page_data.get("totalPages")
+            if total_pages is not None and page >= total_pages - 1:
+                break
+
+            page += 1
+
+    # -------------------------------------------------
+    # Catalog – update small batch
+    # -------------------------------------------------
+    async def update_catalog_small_batch(self, items: List[Dict]) -> Dict:
+        """
+        POST /catalog/batch/small
+        """
+
+        if not isinstance(items, list) or not items:
+            raise ValueError("items must be a non-empty list")
+
+        return await self._post("/catalog/batch/small", items)
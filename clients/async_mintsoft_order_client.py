@@ -0,0 +1,258 @@
+import asyncio
+import os
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from clients.async_base_client import AsyncBaseClient
+from clients.mintsoft_auth import get_api_key_provider
+from clients.mintsoft_order_client import MintsoftOrderClient
+from stores.order_index import OrderIndex
+
+
+class AsyncMintsoftOrderClient(AsyncBaseClient):
+    """
+    Cliente Mintsoft – Orders API (asyncio)
+    Mismos métodos que MintsoftOrderClient, como corutinas.
+    La API key se pide en el primer request (el constructor
+    no puede esperar).
+    """
+
+    BASE_URL = MintsoftOrderClient.BASE_URL
+
+    def __init__(self):
+        self.username = os.getenv("MINTSOFT_USERNAME")
+        self.password = os.getenv("MINTSOFT_PASSWORD")
+        self.client_id = os.getenv("MINTSOFT_CLIENT_ID")
+
+        if not all([self.username, self.password, self.client_id]):
+            raise RuntimeError(
+                "Missing Mintsoft credentials "
+                "(MINTSOFT_USERNAME / MINTSOFT_PASSWORD / MINTSOFT_CLIENT_ID)"
+            )
+
+        # Mismo provider que los clientes sync (key y cache compartidas)
+        self._auth = get_api_key_provider(
+            self.username,
+            self.password,
+            f"{self.BASE_URL}/api/Auth",
+        )
+
+        # Mismo índice OrderNumber → OrderId que el cliente sync
+        self.index = OrderIndex()
+        self._index_loaded = False
+        self._index_lock = asyncio.Lock()
+
+    # -------------------------------------------------
+    # Auth
+    # -------------------------------------------------
+    async def _ensure_auth(self) -> str:
+        # Un solo login aunque haya cientos de requests esperando
+        return await self._auth.get_key_async()
+
+    async def _reauthenticate(
+        self,
+        headers: Optional[Dict[str, str]],
+    ) -> Optional[Dict[str, str]]:
+        # 401: la key venció o fue revocada
+        return await self._auth.renewed_headers_async(headers)
+
+    # -------------------------------------------------
+    # Headers
+    # -------------------------------------------------
+    async def _headers(self) -> Dict[str, str]:
+        return {
+            "ms-apikey": await self._ensure_auth(),
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+
+    # -------------------------------------------------
+    # Orders – Create
+    # -------------------------------------------------
+    async def create_order(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        url = f"{self.BASE_URL}/api/Order"
+
+        r = await self._request(
+            "PUT",
+            url,
+            headers=await self._headers(),
+            json=payload,
+            timeout=30,
+        )
+        r.raise_for_status()
+        response = r.json() if r.text else {}
+
+        order_number = payload.get("OrderNumber")
+        if order_number:
+            self.index.record_created(
+                order_number,
+                MintsoftOrderClient._extract_order_id(response),
+            )
+
+        return response
+
+    # -------------------------------------------------
+    # Orders – Update
+    # -------------------------------------------------
+    async def update_order(
+        self,
+        order_id: int,
+        payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+
+        url = f"{self.BASE_URL}/api/Order/{order_id}"
+
+        r = await self._request(
+            "POST",
+            url,
+            headers=await self._headers(),
+            json=payload,
+            timeout=30,
+            retry=True,  # update por ID, idempotente
+        )
+        r.raise_for_status()
+
+        return r.json() if r.text else {}
+
+    # -------------------------------------------------
+    # Orders – Get all (auto pagination)
+    # -------------------------------------------------
+    async def get_orders(
+        self,
+        page_size: int = 100,
+        max_pages: int = 100
+    ) -> List[Dict[str, Any]]:
+
+        return [order async for order in self.iter_orders(page_size, max_pages)]
+
+    async def iter_orders(
+        self,
+        page_size: int = 100,
+        max_pages: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        async for batch in self._iter_order_batches(page_size, max_pages):
+            for order in batch:
+                yield order
+
+    def _iter_order_batches(
+        self,
+        page_size: int = 100,
+        max_pages: int = 100
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        return self._iter_pages(self._get_orders_page, page_size, max_pages)
+
+    # -------------------------------------------------
+    # Orders – Get page
+    # -------------------------------------------------
+    async def _get_orders_page(
+        self,
+        page: int,
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        GET /api/Order/List
+        """
+
+        url = f"{self.BASE_URL}/api/Order/List"
+
+        params = {
+            "ClientId": self.client_id,
+            "PageNo": page,
+            "Limit": limit,
+        }
+
+        r = await self._request(
+            "GET",
+            url,
+            headers=await self._headers(),
+            params=params,
+            timeout=30,
+        )
+        r.raise_for_status()
+
+        return r.json()
+
+    # -------------------------------------------------
+    # OrderNumber index
+    # -------------------------------------------------
+    async def refresh_index(self) -> int:
+        """
+        Recorre /api/Order/List una vez y actualiza
+        el índice local OrderNumber → OrderId
+        """
+
+        loaded = 0
+        async for batch in self._iter_order_batches():
+            loaded += self.index.load_orders(batch)
+
+        self._index_loaded = True
+
+        return loaded
+
+    async def ensure_index(self) -> None:
+        """Ver MintsoftOrderClient.ensure_index"""
+        if self._index_loaded:
+            return
+
+        async with self._index_lock:
+            if not self._index_loaded:
+                await self.refresh_index()
+
+    def is_known_order(self, order_number: str) -> bool:
+        """
+        True si la orden ya está en el índice local.
+        No hace llamadas HTTP: llamar antes a ensure_index.
+        """
+        return order_number in self.index
+
+    # -------------------------------------------------
+    # Orders – Get by ID
+    # -------------------------------------------------
+    async def get_order(self, order_id: int) -> Dict[str, Any]:
+        url = f"{self.BASE_URL}/api/Order/{order_id}"
+
+        r = await self._request(
+            "GET",
+            url,
+            headers=await self._headers(),
+            timeout=30,
+        )
+        r.raise_for_status()
+
+        return r.json()
+
+    # -------------------------------------------------
+    # Orders – Get by OrderNumber
+    # -------------------------------------------------
+    async def lookup_order_number(
+        self,
+        order_number: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Entrada del índice local, ver
+        MintsoftOrderClient.lookup_order_number
+        """
+
+        await self.ensure_index()
+
+        return self.index.get(order_number)
+
+    async def get_order_by_number(
+        self,
+        order_number: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Ver MintsoftOrderClient.get_order_by_number
+        """
+
+        entry = await self.lookup_order_number(order_number)
+        if not entry:
+            return None
+
+        if entry.get("ID"):
+            return await self.get_order(entry["ID"])
+
+        async for order in self.iter_orders():
+            if order.get("OrderNumber") == order_number:
+                return order
+
+        return None
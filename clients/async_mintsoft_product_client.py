@@ -0,0 +1,250 @@
+import asyncio
+import os
+import time
+from typing import AsyncIterator, Dict, List, Optional
+
+from clients.async_base_client import AsyncBaseClient
+from clients.base_client import PageWalk, _log_truncated_walk
+from clients.mintsoft_auth import get_api_key_provider
+from clients.mintsoft_product_client import MintsoftProductClient
+from stores.product_index import ProductIndex
+
+
+class AsyncMintsoftProductClient(AsyncBaseClient):
+    """
+    Cliente Mintsoft – Products API (asyncio)
+    Mismos métodos que MintsoftProductClient, como corutinas.
+    La API key se pide en el primer request.
+    """
+
+    BASE_URL = MintsoftProductClient.BASE_URL
+
+    def __init__(self):
+        self.username = os.getenv("MINTSOFT_USERNAME")
+        self.password = os.getenv("MINTSOFT_PASSWORD")
+        self.client_id = os.getenv("MINTSOFT_CLIENT_ID")
+
+        if not all([self.username, self.password, self.client_id]):
+            raise RuntimeError("Missing Mintsoft credentials")
+
+        # Mismo provider que los clientes sync (key y cache compartidas)
+        self._auth = get_api_key_provider(
+            self.username,
+            self.password,
+            f"{self.BASE_URL}/Auth",
+        )
+
+        # Mismo índice SKU → ID que el cliente sync
+        self.index = ProductIndex()
+        self._index_loaded = False
+        self._index_lock = asyncio.Lock()
+
+    # -------------------------------------------------
+    # Auth
+    # -------------------------------------------------
+    async def _ensure_auth(self) -> str:
+        # Un solo login aunque haya cientos de requests esperando
+        return await self._auth.get_key_async()
+
+    async def _reauthenticate(
+        self,
+        headers: Optional[Dict[str, str]],
+    ) -> Optional[Dict[str, str]]:
+        # 401: la key venció o fue revocada
+        return await self._auth.renewed_headers_async(headers)
+
+    # -------------------------------------------------
+    # Headers
+    # -------------------------------------------------
+    async def _headers(self) -> dict:
+        return {
+            "ms-apikey": await self._ensure_auth(),
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+
+    # -------------------------------------------------
+    # Create product
+    # -------------------------------------------------
+    async def create_product(self, payload: Dict) -> Dict:
+        url = f"{self.BASE_URL}/Product"
+
+        r = await self._request(
+            "PUT",
+            url,
+            headers=await self._headers(),
+            json=payload,
+            timeout=30
+        )
+
+        r.raise_for_status()
+        response = r.json() if r.text else {}
+
+        if isinstance(response, dict) and response.get("ID"):
+            self.index.upsert(payload.get("SKU"), response["ID"], payload)
+
+        return response
+
+    # -------------------------------------------------
+    # Update product
+    # -------------------------------------------------
+    async def update_product(self, product_id: int, payload: Dict) -> Dict:
+        body = dict(payload)
+        body["ID"] = product_id
+
+        url = f"{self.BASE_URL}/Product"
+
+        r = await self._request(
+            "POST",
+            url,
+            headers=await self._headers(),
+            json=body,
+            timeout=30,
+            retry=True,  # update por ID, idempotente
+        )
+
+        r.raise_for_status()
+
+        if payload.get("SKU"):
+            self.index.upsert(payload["SKU"], product_id, payload)
+
+        return r.json() if r.text else {}
+
+    # -------------------------------------------------
+    # Get all products (auto pagination)
+    # -------------------------------------------------
+    async def get_all_products(
+        self,
+        page_size: int = 100,
+        max_pages: int = 200
+    ) -> List[Dict]:
+
+        return [
+            product
+            async for product in self.iter_all_products(page_size, max_pages)
+        ]
+
+    async def iter_all_products(
+        self,
+        page_size: int = 100,
+        max_pages: int = 200
+    ) -> AsyncIterator[Dict]:
+        async for batch in self._iter_product_batches(page_size, max_pages):
+            for product in batch:
+                yield product
+
+    def _iter_product_batches(
+        self,
+        page_size: int = 100,
+        max_pages: int = 200,
+        walk: Optional[PageWalk] = None,
+    ) -> AsyncIterator[List[Dict]]:
+        return self._iter_pages(
+            self._get_products_page,
+            page_size,
+            max_pages,
+            walk=walk,
+        )
+
+    # -------------------------------------------------
+    # Get products page
+    # -------------------------------------------------
+    async def _get_products_page(
+        self,
+        page: int,
+        limit: int
+    ) -> List[Dict]:
+
+        url = f"{self.BASE_URL}/Product/List"
+
+        params = {
+            "PageNo": page,
+            "Limit": limit,
+            "ClientId": self.client_id,
+        }
+
+        r = await self._request(
+            "GET",
+            url,
+            headers=await self._headers(),
+            params=params,
+            timeout=30
+        )
+
+        r.raise_for_status()
+        return r.json()
+
+    # -------------------------------------------------
+    # SKU index
+    # -------------------------------------------------
+    async def refresh_index(self) -> int:
+        """
+        Recorre el catálogo completo una vez y
+        actualiza el índice local SKU → ID
+        """
+
+        walk_started = time.time()
+        walk = PageWalk()
+
+        loaded = 0
+        async for batch in self._iter_product_batches(walk=walk):
+            loaded += self.index.load_catalog(batch)
+
+        # Sólo con el recorrido completo (ver MintsoftProductClient.refresh_index)
+        if walk.complete:
+            self.index.remove_unseen(walk_started)
+        else:
+            _log_truncated_walk("Mintsoft products", walk)
+
+        self._index_loaded = True
+
+        return loaded
+
+    async def _ensure_index(self) -> None:
+        if self._index_loaded:
+            return
+
+        async with self._index_lock:
+            if not self._index_loaded:
+                await self.refresh_index()
+
+    # -------------------------------------------------
+    # Get product
+    # -------------------------------------------------
+    async def get_product(self, product_id: int) -> Dict:
+        url = f"{self.BASE_URL}/Product/{product_id}"
+
+        r = await self._request(
+            "GET",
+            url,
+            headers=await self._headers(),
+            timeout=30
+        )
+
+        r.raise_for_status()
+        return r.json()
+
+    # -------------------------------------------------
+    # Get product by SKU
+    # -------------------------------------------------
+    async def lookup_sku(self, sku: str) -> Optional[Dict]:
+        """
+        Entrada del índice local {"ID", "SKU", "hash"},
+        ver MintsoftProductClient.lookup_sku
+        """
+
+        await self._ensure_index()
+
+        return self.index.get(sku)
+
+    async def get_product_by_sku(self, sku: str) -> Optional[Dict]:
+        """
+        Producto Mintsoft por SKU (ID del índice local
+        + GET /Product/{id})
+        """
+
+        entry = await self.lookup_sku(sku)
+        if not entry:
+            return None
+
+        return await self.get_product(entry["ID"])
@@ -0,0 +1,439 @@
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from clients.rate_limiter import get_rate_limiter
+from loggers import metrics
+
+
+# -------------------------------------------------
+# Configuración global
+# -------------------------------------------------
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", 10))
+HTTP_TIMEOUT = int(os.getenv("HTTP_TIMEOUT", 30))
+
+HTTP_RETRY_MAX_ATTEMPTS = int(os.getenv("HTTP_RETRY_MAX_ATTEMPTS", 5))
+HTTP_RETRY_BASE_DELAY = float(os.getenv("HTTP_RETRY_BASE_DELAY", 0.5))
+HTTP_RETRY_MAX_DELAY = float(os.getenv("HTTP_RETRY_MAX_DELAY", 30))
+HTTP_RETRY_AFTER_MAX = float(os.getenv("HTTP_RETRY_AFTER_MAX", 120))
+HTTP_RETRY_BUDGET = int(os.getenv("HTTP_RETRY_BUDGET", 500))
+
+# Páginas PageNo/Limit pedidas en paralelo por ventana
+HTTP_PAGE_FANOUT = int(os.getenv("HTTP_PAGE_FANOUT", 4))
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+# -------------------------------------------------
+# Sesiones compartidas por host (keep-alive)
+# -------------------------------------------------
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _new_session(pool_size: int) -> requests.Session:
+    session = requests.Session()
+
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+def get_session(url: str, pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """
+    Devuelve la sesión compartida para el host de la URL.
+    Las conexiones TCP/TLS se reutilizan entre requests.
+    """
+    parts = urlsplit(url)
+    key = f"{parts.scheme}://{parts.netloc}"
+
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _new_session(pool_size)
+            _sessions[key] = session
+
+        return session
+
+
+def close_sessions() -> None:
+    """Cierra todas las sesiones (fin de proceso / tests)"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+# -------------------------------------------------
+# Retry con backoff
+# -------------------------------------------------
+class RetryBudget:
+    """
+    Cantidad máxima de reintentos por ejecución.
+    Evita que un upstream caído multiplique los requests.
+    """
+
+    def __init__(self, budget: int):
+        self.budget = budget
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def consume(self) -> bool:
+        with self._lock:
+            if self.used >= self.budget:
+                return False
+            self.used += 1
+            return True
+
+    def reset(self, budget: Optional[int] = None) -> None:
+        with self._lock:
+            if budget is not None:
+                self.budget = budget
+            self.used = 0
+
+
+class RetryPolicy:
+    """
+    Backoff exponencial con jitter (full jitter),
+    respetando Retry-After cuando viene en la respuesta.
+
+    Lecturas (GET) y escrituras marcadas retry=True se
+    reintentan ante 429 / 5xx / errores de conexión.
+    El resto de las escrituras sólo ante 429 o
+    ConnectTimeout (el request no llegó a procesarse).
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = HTTP_RETRY_MAX_ATTEMPTS,
+        base_delay: float = HTTP_RETRY_BASE_DELAY,
+        max_delay: float = HTTP_RETRY_MAX_DELAY,
+        budget: Optional[RetryBudget] = None,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget or RetryBudget(HTTP_RETRY_BUDGET)
+
+    def should_retry(
+        self,
+        attempt: int,
+        retryable: bool,
+        response: Optional[requests.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> bool:
+        if attempt >= self.max_attempts:
+            return False
+
+        if response is not None:
+            if response.status_code == 429:
+                pass
+            elif not (retryable and response.status_code in RETRYABLE_STATUS):
+                return False
+        elif error is not None:
+            if isinstance(error, requests.exceptions.ConnectTimeout):
+                pass
+            elif not (
+                retryable
+                and isinstance(
+                    error,
+                    (requests.exceptions.ConnectionError, requests.exceptions.Timeout),
+                )
+            ):
+                return False
+
+        return self.budget.consume()
+
+    def delay(
+        self,
+        attempt: int,
+        response: Optional[requests.Response] = None,
+    ) -> float:
+        retry_after = _retry_after(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, HTTP_RETRY_AFTER_MAX)
+
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+retry_policy = RetryPolicy()
+
+
+def reset_retry_budget() -> None:
+    """
+    Presupuesto de reintentos nuevo. Lo llama cada run
+    (sync / backfill / replay / push) al empezar: un proceso
+    que ejecuta varios runs no hereda el gastado por otro.
+    """
+    retry_policy.budget.reset()
+
+
+# -------------------------------------------------
+# Request
+# -------------------------------------------------
+def request(
+    method: str,
+    url: str,
+    *,
+    retry: Optional[bool] = None,
+    pool_size: int = HTTP_POOL_SIZE,
+    **kwargs: Any,
+) -> requests.Response:
+    """
+    Request HTTP con sesión compartida, rate limit
+    por host y reintentos.
+
+    retry: None = sólo métodos idempotentes,
+    True = la escritura es segura de repetir.
+    Devuelve la última respuesta (el caller hace
+    raise_for_status) o re-lanza el último error.
+    """
+    method = method.upper()
+    retryable = method in IDEMPOTENT_METHODS if retry is None else retry
+
+    kwargs.setdefault("timeout", HTTP_TIMEOUT)
+    session = get_session(url, pool_size)
+    limiter = get_rate_limiter(url)
+
+    attempt = 0
+    while True:
+        attempt += 1
+
+        # Cada intento (incluidos los reintentos) consume un token
+        if limiter is not None:
+            limiter.acquire()
+
+        start = time.perf_counter()
+        try:
+            response = session.request(method, url, **kwargs)
+        except requests.exceptions.RequestException as e:
+            metrics.record_http(method, url, "error", time.perf_counter() - start)
+            if not retry_policy.should_retry(attempt, retryable, error=e):
+                raise
+            _log_retry(method, url, attempt, str(e))
+            time.sleep(retry_policy.delay(attempt))
+            continue
+
+        metrics.record_http(
+            method,
+            url,
+            response.status_code,
+            time.perf_counter() - start,
+        )
+
+        if response.status_code < 400:
+            return response
+
+        if not retry_policy.should_retry(attempt, retryable, response=response):
+            return response
+
+        wait = retry_policy.delay(attempt, response)
+        _log_retry(method, url, attempt, f"HTTP {response.status_code}", wait)
+        response.close()
+        time.sleep(wait)
+
+
+def _log_retry(
+    method: str,
+    url: str,
+    attempt: int,
+    reason: str,
+    wait: Optional[float] = None,
+) -> None:
+    from loggers.order_logger import get_logger
+
+    metrics.record_retry(method, url)
+
+    path = urlsplit(url).path
+    delay = f" | wait={wait:.2f}s" if wait is not None else ""
+
+    get_logger("http_client", "http.log").warning(
+        f"[HTTP] Retry {attempt} | {method} {path} | {reason}{delay}"
+    )
+
+
+def _log_reauth(method: str, url: str) -> None:
+    from loggers.order_logger import get_logger
+
+    get_logger("http_client", "http.log").warning(
+        f"[HTTP] 401 | {method} {urlsplit(url).path} | re-authenticating"
+    )
+
+
+def _log_truncated_walk(name: str, walk: "PageWalk") -> None:
+    from loggers.order_logger import get_logger
+
+    get_logger("http_client", "http.log").warning(
+        f"[HTTP] {name}: walk stopped at max_pages={walk.pages} "
+        f"without reaching the last page | skipping prune"
+    )
+
+
+# -------------------------------------------------
+# Recorridos paginados
+# -------------------------------------------------
+class PageWalk:
+    """
+    Estado de un recorrido de _iter_pages.
+    complete = terminó en una página corta o vacía
+    (se vio el listado entero); False si cortó por
+    max_pages o si el recorrido no llegó al final.
+    """
+
+    def __init__(self):
+        self.pages = 0
+        self.complete = False
+
+    def add_page(self, batch: List[Any], page_size: int) -> None:
+        self.pages += 1
+        if len(batch) < page_size:
+            self.complete = True
+
+
+class BaseClient:
+    """
+    Transporte HTTP común para los clientes DSCO / Mintsoft
+    Sesiones con pool por host, keep-alive,
+    rate limit por host y reintentos
+    """
+
+    POOL_SIZE = HTTP_POOL_SIZE
+    TIMEOUT = HTTP_TIMEOUT
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        retry: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        kwargs.setdefault("timeout", self.TIMEOUT)
+
+        response = request(
+            method,
+            url,
+            retry=retry,
+            pool_size=self.POOL_SIZE,
+            **kwargs,
+        )
+
+        if response.status_code != 401:
+            return response
+
+        # Credenciales vencidas / revocadas: se renuevan
+        # y el request se repite una sola vez
+        headers = self._reauthenticate(kwargs.get("headers"))
+        if headers is None:
+            return response
+
+        _log_reauth(method, url)
+        response.close()
+        kwargs["headers"] = headers
+
+        return request(
+            method,
+            url,
+            retry=retry,
+            pool_size=self.POOL_SIZE,
+            **kwargs,
+        )
+
+    def _reauthenticate(self, headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """
+        Hook ante un 401: el cliente descarta sus credenciales y
+        devuelve `headers` con las nuevas (None = no reintentar)
+        """
+        return None
+
+    def _iter_pages(
+        self,
+        fetch_page: Callable[[int, int], List[Any]],
+        page_size: int,
+        max_pages: int,
+        fanout: Optional[int] = None,
+        walk: Optional[PageWalk] = None,
+    ) -> Iterator[List[Any]]:
+        """
+        Recorre un listado paginado por número de página (1..max_pages).
+
+        Las páginas son independientes: se piden en ventanas de
+        `fanout` páginas en paralelo y se entregan en orden.
+        Corta en la primera página vacía (fanout=1 → secuencial).
+        Con `walk`, informa si se llegó al final del listado.
+        """
+
+        fanout = max(1, min(fanout or HTTP_PAGE_FANOUT, self.POOL_SIZE))
+        walk = walk or PageWalk()
+
+        if fanout == 1:
+            for page in range(1, max_pages + 1):
+                batch = fetch_page(page, page_size)
+                walk.add_page(batch, page_size)
+                if not batch:
+                    return
+                yield batch
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=fanout,
+            thread_name_prefix="page-fetch",
+        ) as executor:
+            page = 1
+
+            while page <= max_pages:
+                window = range(page, min(page + fanout, max_pages + 1))
+                futures = [
+                    executor.submit(fetch_page, p, page_size)
+                    for p in window
+                ]
+
+                for future in futures:
+                    batch = future.result()
+                    walk.add_page(batch, page_size)
+
+                    if not batch:
+                        # Las páginas siguientes de la ventana
+                        # ya están en vuelo: se descartan
+                        return
+
+                    yield batch
+
+                page = window.stop
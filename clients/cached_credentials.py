@@ -0,0 +1,241 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from clients.base_client import request
+
+
+class CachedCredentialProvider:
+    """
+    Base de los providers de credenciales (token DSCO,
+    API key Mintsoft):
+    - Se pide recién en el primer request que la necesita
+    - Cache en memoria hasta expires_at - refresh_margin
+    - Un solo refresh a la vez (lock entre threads / por event loop)
+    - Cache opcional en archivo entre procesos
+    - invalidate() ante un 401: el próximo get re-autentica
+
+    Cada provider define el request de auth (_auth_request),
+    cómo leer la respuesta (_parse_response) y los nombres
+    de los campos del archivo de cache.
+    """
+
+    # Campos del archivo de cache: quién se autenticó / la credencial
+    IDENTITY_FIELD = "identity"
+    CREDENTIAL_FIELD = "credential"
+
+    def __init__(
+        self,
+        identity: str,
+        secret: str,
+        url: str,
+        cache_file: Optional[str] = None,
+        refresh_margin: float = 0,
+    ):
+        self.identity = identity
+        self.secret = secret
+        self.url = url
+        self.cache_file = cache_file
+        self.refresh_margin = refresh_margin
+
+        # (credencial, expires_at): se reemplaza entera, así una lectura
+        # sin lock nunca ve la credencial de un estado y el vencimiento de otro
+        self._cached: Tuple[Optional[str], float] = (None, 0.0)
+        self._lock = threading.Lock()
+
+        # Credencial rechazada con un 401: no se vuelve a tomar del archivo
+        self._rejected: Optional[str] = None
+
+        # asyncio.Lock no se comparte entre loops: uno por loop
+        self._async_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    # -------------------------------------------------
+    # A definir por cada provider
+    # -------------------------------------------------
+    def _auth_request(self) -> Dict[str, Any]:
+        """kwargs del POST de autenticación (headers / data / json...)"""
+        raise NotImplementedError
+
+    def _parse_response(self, response) -> Tuple[str, float]:
+        """(credencial, segundos de validez) de la respuesta OK"""
+        raise NotImplementedError
+
+    def _check_response(self, response) -> None:
+        """Default: HTTPError si la autenticación falló"""
+        response.raise_for_status()
+
+    # -------------------------------------------------
+    # Public
+    # -------------------------------------------------
+    def get(self) -> str:
+        credential = self._valid_credential()
+        if credential:
+            return credential
+
+        with self._lock:
+            # Otro thread pudo haberla renovado mientras esperábamos
+            credential = self._valid_credential() or self._load_from_file()
+            if credential:
+                return credential
+
+            return self._refresh()
+
+    async def get_async(self) -> str:
+        """
+        Igual que get, para clientes async:
+        un solo refresh a la vez por event loop,
+        sin bloquear el loop durante el request
+        """
+        credential = self._valid_credential()
+        if credential:
+            return credential
+
+        async with self._async_lock():
+            credential = self._valid_credential() or self._load_from_file()
+            if credential:
+                return credential
+
+            return await self._refresh_async()
+
+    def invalidate(self, credential: Optional[str] = None) -> None:
+        """
+        Descarta la credencial actual. Con `credential` (la que
+        recibió el 401), sólo si sigue siendo la vigente: muchos
+        requests rechazados a la vez terminan en un solo refresh.
+        """
+        with self._lock:
+            current, _ = self._cached
+            if credential is not None and credential != current:
+                return
+
+            self._rejected = current
+            self._cached = (None, 0.0)
+
+    # -------------------------------------------------
+    # Internals
+    # -------------------------------------------------
+    def _valid_credential(self) -> Optional[str]:
+        """Credencial vigente o None (lee el estado una sola vez)"""
+        credential, expires_at = self._cached
+
+        if credential and time.time() < expires_at - self.refresh_margin:
+            return credential
+
+        return None
+
+    def _async_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+
+        lock = self._async_locks.get(loop)
+        if lock is None:
+            lock = self._async_locks[loop] = asyncio.Lock()
+
+        return lock
+
+    def _refresh(self) -> str:
+        response = request("POST", self.url, **self._auth_request())
+        return self._store(response)
+
+    async def _refresh_async(self) -> str:
+        # aiohttp sólo se importa si se usan los clientes async
+        from clients.async_base_client import async_request
+
+        response = await async_request("POST", self.url, **self._auth_request())
+        return self._store(response)
+
+    def _store(self, response) -> str:
+        self._check_response(response)
+
+        credential, expires_in = self._parse_response(response)
+        self._cached = (credential, time.time() + expires_in)
+        self._rejected = None
+
+        self._save_to_file()
+        return credential
+
+    def _load_from_file(self) -> Optional[str]:
+        """Credencial vigente del archivo de cache (None si no hay)"""
+        if not self.cache_file:
+            return None
+
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if data.get(self.IDENTITY_FIELD) != self.identity:
+            return None
+
+        if data.get(self.CREDENTIAL_FIELD) == self._rejected:
+            return None
+
+        self._cached = (
+            data.get(self.CREDENTIAL_FIELD),
+            float(data.get("expires_at", 0)),
+        )
+
+        return self._valid_credential()
+
+    def _save_to_file(self) -> None:
+        if not self.cache_file:
+            return
+
+        credential, expires_at = self._cached
+
+        directory = os.path.dirname(self.cache_file) or "."
+        os.makedirs(directory, exist_ok=True)
+
+        # Nombre temporal único por escritura (0600): los refresh sync
+        # y async usan locks distintos y pueden escribir a la vez
+        fd, tmp_path = tempfile.mkstemp(
+            dir=directory,
+            prefix=f"{os.path.basename(self.cache_file)}.",
+            suffix=".tmp",
+        )
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        self.IDENTITY_FIELD: self.identity,
+                        self.CREDENTIAL_FIELD: credential,
+                        "expires_at": expires_at,
+                    },
+                    f,
+                )
+
+            # Escritura atómica
+            os.replace(tmp_path, self.cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+# -------------------------------------------------
+# Providers compartidos por proceso
+# -------------------------------------------------
+P = TypeVar("P", bound=CachedCredentialProvider)
+
+_providers: Dict[Tuple[Any, ...], CachedCredentialProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def shared_provider(key: Tuple[Any, ...], secret: str, factory: Callable[[], P]) -> P:
+    """
+    Provider compartido por `key` (ej: clase + usuario + URL).
+    Si cambió el secreto se crea uno nuevo.
+    """
+    with _providers_lock:
+        provider = _providers.get(key)
+        if provider is None or provider.secret != secret:
+            provider = _providers[key] = factory()
+
+        return provider
@@ -0,0 +1,134 @@
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from clients.cached_credentials import CachedCredentialProvider, shared_provider
+
+
+DSCO_TOKEN_URL = "https://api.dsco.io/api/v3/oauth2/token"
+
+# Segundos antes del vencimiento en los que ya se renueva el token
+TOKEN_REFRESH_MARGIN = int(os.getenv("DSCO_TOKEN_REFRESH_MARGIN", 300))
+
+# Cache opcional en disco (ej: state/dsco_token.json) para compartir
+# el token entre ejecuciones de cron
+TOKEN_CACHE_FILE = os.getenv("DSCO_TOKEN_CACHE_FILE")
+
+# Header con el que viaja el token ("Bearer <token>")
+TOKEN_HEADER = "Authorization"
+
+
+class DscoTokenProvider(CachedCredentialProvider):
+    """
+    Provee el token OAuth2 (client_credentials) de DSCO
+    - Vence según expires_in, se renueva refresh_margin antes
+    - Cache / locks / archivo: ver CachedCredentialProvider
+    """
+
+    IDENTITY_FIELD = "client_id"
+    CREDENTIAL_FIELD = "access_token"
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        token_url: str = DSCO_TOKEN_URL,
+        cache_file: Optional[str] = TOKEN_CACHE_FILE,
+        refresh_margin: int = TOKEN_REFRESH_MARGIN,
+    ):
+        super().__init__(client_id, client_secret, token_url, cache_file, refresh_margin)
+
+    @property
+    def client_id(self) -> str:
+        return self.identity
+
+    @property
+    def client_secret(self) -> str:
+        return self.secret
+
+    @property
+    def token_url(self) -> str:
+        return self.url
+
+    # -------------------------------------------------
+    # Public
+    # -------------------------------------------------
+    def get_token(self) -> str:
+        return self.get()
+
+    async def get_token_async(self) -> str:
+        return await self.get_async()
+
+    def renewed_headers(self, headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """
+        Headers de un request que recibió 401, con un token nuevo
+        (None si el request no llevaba token: no se reintenta)
+        """
+        stale = _bearer_token(headers)
+        if not stale:
+            return None
+
+        self.invalidate(stale)
+        return _with_token(headers, self.get_token())
+
+    async def renewed_headers_async(
+        self,
+        headers: Optional[Dict[str, str]],
+    ) -> Optional[Dict[str, str]]:
+        stale = _bearer_token(headers)
+        if not stale:
+            return None
+
+        self.invalidate(stale)
+        return _with_token(headers, await self.get_token_async())
+
+    # -------------------------------------------------
+    # OAuth2
+    # -------------------------------------------------
+    def _auth_request(self) -> Dict[str, Any]:
+        return {
+            "headers": {
+                "Content-Type": "application/x-www-form-urlencoded",
+                "Accept": "application/json",
+            },
+            "data": {
+                "grant_type": "client_credentials",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+            },
+            "timeout": 30,
+            "retry": True,
+        }
+
+    def _check_response(self, response) -> None:
+        if not response.ok:
+            raise RuntimeError(
+                f"OAuth failed {response.status_code}: {response.text}"
+            )
+
+    def _parse_response(self, response) -> Tuple[str, float]:
+        data = response.json()
+        return data["access_token"], int(data.get("expires_in", 3600))
+
+
+def _bearer_token(headers: Optional[Dict[str, str]]) -> Optional[str]:
+    value = (headers or {}).get(TOKEN_HEADER) or ""
+    return value.split(" ", 1)[-1] or None
+
+
+def _with_token(headers: Dict[str, str], token: str) -> Dict[str, str]:
+    # Mismo esquema que el request original ("Bearer" / "bearer")
+    scheme = headers[TOKEN_HEADER].split(" ", 1)[0]
+    return {**headers, TOKEN_HEADER: f"{scheme} {token}"}
+
+
+def get_token_provider(
+    client_id: str,
+    client_secret: str,
+    token_url: str = DSCO_TOKEN_URL,
+) -> DscoTokenProvider:
+    """Devuelve el provider compartido para estas credenciales"""
+    return shared_provider(
+        (DscoTokenProvider, client_id, token_url),
+        client_secret,
+        lambda: DscoTokenProvider(client_id, client_secret, token_url),
+    )
@@ -1,14 +1,11 @@
 import os
-import requests
-from typing import Dict, Optional, List
-from dotenv import load_dotenv
-import time
+from typing import Dict, Iterator, Optional, List
 
+from clients.base_client import BaseClient
+from clients.dsco_auth import get_token_provider
 
-load_dotenv()
 
-
-class DscoOrderClient:
+class DscoOrderClient(BaseClient):
     """
     Cliente DSCO – Orders API
     OAuth2 client_credentials
@@ -24,43 +21,25 @@ class DscoOrderClient:
         if not self.client_id or not self.client_secret:
             raise RuntimeError("Missing DSCO_CLIENT_ID or DSCO_CLIENT_SECRET")
 
-        self._access_token: Optional[str] = None
+        # Token compartido entre clientes, threads y (opcional) procesos
+        self._token_provider = get_token_provider(
+            self.client_id,
+            self.client_secret,
+            self.AUTH_URL,
+        )
 
     # -------------------------------------------------
     # OAuth
     # -------------------------------------------------
     def _get_access_token(self) -> str:
-        if self._access_token and self._token_expiry and time.time() < self._token_expiry:
-            return self._access_token
+        return self._token_provider.get_token()
 
-        response = requests.post(
-            self.AUTH_URL,
-            headers={
-                "Content-Type": "application/x-www-form-urlencoded",
-                "Accept": "application/json",
-            },
-            data={
-                "grant_type": "client_credentials",
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-            },
-            timeout=30,
-        )
-
-        if not response.ok:
-            raise RuntimeError(
-                f"OAuth failed {response.status_code}: {response.text}"
-            )
-
-        data = response.json()
-        self._access_token = data["access_token"]
-        self._token_expiry = time.time() + data.get("expires_in", 3600) - 60
-
-        return self._access_token
+    def _reauthenticate(self, headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        # 401: el token venció antes de tiempo o fue rotado
+        return self._token_provider.renewed_headers(headers)
 
     def _headers(self) -> Dict[str, str]:
         token = self._get_access_token()
-        print(f"Access token: {repr(token)}")  # <-- Aquí verificás el token
         return {
             "Authorization": f"Bearer {token}",
             "Accept": "application/json",
@@ -82,7 +61,8 @@ class DscoOrderClient:
     def _get(self, path: str, params: Optional[Dict] = None) -> Dict:
         url = f"{self.BASE_URL}{path}"
 
-        r = requests.get(
+        r = self._request(
+            "GET",
             url,
             headers=self._headers(),
             params=params,
@@ -148,11 +128,13 @@ class DscoOrderClient:
                 "limit": limit
             }
 
-        r = requests.post(
-            url=f"{self.BASE_URL}/order/page",
+        r = self._request(
+            "POST",
+            f"{self.BASE_URL}/order/page",
             headers=self._headers(),
             json=payload,  # body JSON, no query string
-            timeout=30
+            timeout=30,
+            retry=True,  # POST de lectura, seguro de repetir
         )
 
         r.raise_for_status()
@@ -211,24 +193,78 @@ class DscoOrderClient:
         Descarga todas las órdenes usando scrollId
         """
 
-        orders: List[Dict] = []
-        scroll_id: Optional[str] = None
+        return list(
+            self.iter_all_orders(
+                orders_created_since=orders_updated_since,
+                until=until,
+            )
+        )
+
+    def iter_all_orders(
+        self,
+        *,
+        orders_created_since: str,
+        until: str,
+        limit: int = 100,
+    ) -> Iterator[Dict]:
+        """
+        Igual que get_all_orders pero como generador
+        """
+
+        for batch in self.iter_order_pages(
+            orders_created_since=orders_created_since,
+            until=until,
+            limit=limit,
+        ):
+            yield from batch
+
+    def iter_order_pages(
+        self,
+        *,
+        orders_created_since: str,
+        until: str,
+        limit: int = 100,
+        scroll_id: Optional[str] = None,
+    ) -> Iterator[List[Dict]]:
+        """
+        Recorre el scroll de /order/page y entrega
+        cada página (lista de órdenes) apenas llega
+        """
+
+        for data in self.iter_order_responses(
+            orders_created_since=orders_created_since,
+            until=until,
+            limit=limit,
+            scroll_id=scroll_id,
+        ):
+            yield data["orders"]
+
+    def iter_order_responses(
+        self,
+        *,
+        orders_created_since: str,
+        until: str,
+        limit: int = 100,
+        scroll_id: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        """
+        Igual que iter_order_pages pero entrega la respuesta
+        completa (orders + scrollId de la página siguiente)
+        """
 
         while True:
             data = self.get_orders_page(
-                orders_updated_since=orders_updated_since,
+                orders_created_since=orders_created_since,
                 until=until,
+                limit=limit,
                 scroll_id=scroll_id,
             )
 
-            batch = data.get("orders", [])
-            if not batch:
+            if not data.get("orders"):
                 break
 
-            orders.extend(batch)
+            yield data
             scroll_id = data.get("scrollId")
 
             if not scroll_id:
                 break
-
-        return orders
@@ -1,13 +1,11 @@
 import os
-import time
-import requests
-from typing import List, Dict, Optional, Union
-from dotenv import load_dotenv
+from typing import Iterator, List, Dict, Optional, Union
 
-load_dotenv()
+from clients.base_client import BaseClient
+from clients.dsco_auth import get_token_provider
 
 
-class DscoProductClient:
+class DscoProductClient(BaseClient):
     """
     Cliente DSCO – Catalog / Products API
     Autenticación OAuth2 (client_credentials)
@@ -24,28 +22,22 @@ class DscoProductClient:
         if not self.client_id or not self.client_secret:
             raise RuntimeError("Missing DSCO_CLIENT_ID or DSCO_CLIENT_SECRET")
 
-        self._access_token: Optional[str] = None
+        # Token compartido entre clientes, threads y (opcional) procesos
+        self._token_provider = get_token_provider(
+            self.client_id,
+            self.client_secret,
+            self.TOKEN_URL,
+        )
 
     # -------------------------------------------------
     # OAuth
     # -------------------------------------------------
     def _get_oauth_token(self) -> str:
+        return self._token_provider.get_token()
 
-        r = requests.post(
-            self.TOKEN_URL,
-            data={
-                "grant_type": "client_credentials",
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-            },
-            timeout=30,
-        )
-        r.raise_for_status()
-
-        data = r.json()
-        self._access_token = data["access_token"]
-
-        return self._access_token
+    def _reauthenticate(self, headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        # 401: el token venció antes de tiempo o fue rotado
+        return self._token_provider.renewed_headers(headers)
 
     def _headers(self) -> Dict[str, str]:
         return {
@@ -60,24 +52,26 @@ class DscoProductClient:
     def _get(self, path: str, params: Optional[Dict] = None) -> Dict:
         url = f"{self.BASE_URL}{path}"
 
-        r = requests.get(
+        r = self._request(
+            "GET",
             url,
             headers=self._headers(),
             params=params,
             timeout=30,
         )
         r.raise_for_status()
-        print(r.json())
         return r.json()
 
     def _post(self, path: str, payload: Union[Dict, List[Dict]]) -> Dict:
         url = f"{self.BASE_URL}{path}"
 
-        r = requests.post(
+        r = self._request(
+            "POST",
             url,
             headers=self._headers(),
             json=payload,
             timeout=60,
+            retry=True,  # updates de catálogo idempotentes
         )
         r.raise_for_status()
         return r.json()
@@ -114,6 +108,76 @@ class DscoProductClient:
 
         return self._get("/catalog", params=params)
 
+    # -------------------------------------------------
+    # Catalog – paginated
+    # -------------------------------------------------
+    def get_products_page(
+        self,
+        *,
+        page: int,
+        size: int = 100,
+        created_at_min: Optional[str] = None,
+        created_at_max: Optional[str] = None,
+        updated_at_min: Optional[str] = None,
+        updated_at_max: Optional[str] = None,
+    ) -> Dict:
+        """
+        GET /catalog paginado por fechas
+        (page empieza en 0, respuesta con content / items
+        / products y totalPages opcional)
+        """
+
+        params: Dict[str, Union[str, int]] = {
+            "page": page,
+            "size": size,
+        }
+
+        if created_at_min:
+            params["createdAtMin"] = created_at_min
+        if created_at_max:
+            params["createdAtMax"] = created_at_max
+        if updated_at_min:
+            params["updatedAtMin"] = updated_at_min
+        if updated_at_max:
+            params["updatedAtMax"] = updated_at_max
+
+        return self._get("/catalog", params=params)
+
+    def iter_product_pages(
+        self,
+        *,
+        size: int = 100,
+        start_page: int = 0,
+        **filters: Optional[str],
+    ) -> Iterator[List[Dict]]:
+        """
+        Recorre get_products_page y entrega cada
+        página (lista de productos) apenas llega
+        """
+
+        page = start_page
+
+        while True:
+            page_data = self.get_products_page(page=page, size=size, **filters)
+
+            products = (
+                page_data.get("content")
+                or page_data.get("items")
+                or page_data.get("products")
+                or []
+            )
+
+            if not products:
+                break
+
+            yield products
+
+            total_pages = page_data.get("totalPages")
+            if total_pages is not None and page >= total_pages - 1:
+                break
+
+            page += 1
+
     # -------------------------------------------------
     # Catalog – update small batch
     # -------------------------------------------------
@@ -0,0 +1,114 @@
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from clients.cached_credentials import CachedCredentialProvider, shared_provider
+
+
+MINTSOFT_AUTH_URL = "https://api.mintsoft.co.uk/api/Auth"
+
+# Mintsoft no informa el vencimiento de la API key:
+# se renueva pasado este tiempo (y siempre ante un 401)
+API_KEY_TTL = int(os.getenv("MINTSOFT_API_KEY_TTL", 23 * 3600))
+
+# Cache opcional en disco (ej: state/mintsoft_api_key.json) para
+# compartir la key entre ejecuciones de cron
+API_KEY_CACHE_FILE = os.getenv("MINTSOFT_API_KEY_CACHE_FILE")
+
+# Header con el que viaja la key
+API_KEY_HEADER = "ms-apikey"
+
+
+class MintsoftApiKeyProvider(CachedCredentialProvider):
+    """
+    Provee la API key de Mintsoft (POST /api/Auth),
+    compartida por los clientes de órdenes y productos.
+    Cache / locks / archivo: ver CachedCredentialProvider
+    """
+
+    IDENTITY_FIELD = "username"
+    CREDENTIAL_FIELD = "api_key"
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        auth_url: str = MINTSOFT_AUTH_URL,
+        cache_file: Optional[str] = API_KEY_CACHE_FILE,
+        ttl: int = API_KEY_TTL,
+    ):
+        super().__init__(username, password, auth_url, cache_file)
+        self.ttl = ttl
+
+    @property
+    def username(self) -> str:
+        return self.identity
+
+    @property
+    def password(self) -> str:
+        return self.secret
+
+    @property
+    def auth_url(self) -> str:
+        return self.url
+
+    # -------------------------------------------------
+    # Public
+    # -------------------------------------------------
+    def get_key(self) -> str:
+        return self.get()
+
+    async def get_key_async(self) -> str:
+        return await self.get_async()
+
+    def renewed_headers(self, headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """
+        Headers de un request que recibió 401, con una key nueva
+        (None si el request no llevaba key: no se reintenta)
+        """
+        stale = (headers or {}).get(API_KEY_HEADER)
+        if not stale:
+            return None
+
+        self.invalidate(stale)
+        return {**headers, API_KEY_HEADER: self.get_key()}
+
+    async def renewed_headers_async(
+        self,
+        headers: Optional[Dict[str, str]],
+    ) -> Optional[Dict[str, str]]:
+        stale = (headers or {}).get(API_KEY_HEADER)
+        if not stale:
+            return None
+
+        self.invalidate(stale)
+        return {**headers, API_KEY_HEADER: await self.get_key_async()}
+
+    # -------------------------------------------------
+    # Auth
+    # -------------------------------------------------
+    def _auth_request(self) -> Dict[str, Any]:
+        return {
+            "json": {
+                "Username": self.username,
+                "Password": self.password,
+            },
+            "timeout": 30,
+            "retry": True,
+        }
+
+    def _parse_response(self, response) -> Tuple[str, float]:
+        # Mintsoft devuelve directamente la API key como string
+        return response.json(), self.ttl
+
+
+def get_api_key_provider(
+    username: str,
+    password: str,
+    auth_url: str = MINTSOFT_AUTH_URL,
+) -> MintsoftApiKeyProvider:
+    """Devuelve el provider compartido para estas credenciales"""
+    return shared_provider(
+        (MintsoftApiKeyProvider, username, auth_url),
+        password,
+        lambda: MintsoftApiKeyProvider(username, password, auth_url),
+    )
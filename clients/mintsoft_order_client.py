@@ -1,12 +1,13 @@
 import os
-import requests
-from typing import Optional, Dict, Any, List
-from dotenv import load_dotenv
+import threading
+from typing import Optional, Dict, Any, Iterator, List
 
-load_dotenv()
+from clients.base_client import BaseClient
+from clients.mintsoft_auth import get_api_key_provider
+from stores.order_index import OrderIndex
 
 
-class MintsoftOrderClient:
+class MintsoftOrderClient(BaseClient):
     """
     Cliente Mintsoft – Orders API
     """
@@ -24,24 +25,29 @@ class MintsoftOrderClient:
                 "(MINTSOFT_USERNAME / MINTSOFT_PASSWORD / MINTSOFT_CLIENT_ID)"
             )
 
-        self.api_key = self._authenticate()
+        # API key compartida entre clientes (y procesos, con
+        # MINTSOFT_API_KEY_CACHE_FILE); se pide en el primer request
+        self._auth = get_api_key_provider(
+            self.username,
+            self.password,
+            f"{self.BASE_URL}/api/Auth",
+        )
+
+        # Índice OrderNumber → OrderId persistido en state/
+        self.index = OrderIndex()
+        self._index_loaded = False
+        self._index_lock = threading.Lock()
 
     # -------------------------------------------------
     # Auth
     # -------------------------------------------------
-    def _authenticate(self) -> str:
-        url = f"{self.BASE_URL}/api/Auth"
-
-        payload = {
-            "Username": self.username,
-            "Password": self.password,
-        }
-
-        r = requests.post(url, json=payload, timeout=30)
-        r.raise_for_status()
+    @property
+    def api_key(self) -> str:
+        return self._auth.get_key()
 
-        # Mintsoft devuelve directamente la API key como string
-        return r.json()
+    def _reauthenticate(self, headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        # 401: la key venció o fue revocada
+        return self._auth.renewed_headers(headers)
 
     # -------------------------------------------------
     # Headers
@@ -60,15 +66,35 @@ class MintsoftOrderClient:
     def create_order(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         url = f"{self.BASE_URL}/api/Order"
 
-        r = requests.put(
+        r = self._request(
+            "PUT",
             url,
             headers=self.headers,
             json=payload,
             timeout=30,
         )
         r.raise_for_status()
+        response = r.json() if r.text else {}
 
-        return r.json() if r.text else {}
+        order_number = payload.get("OrderNumber")
+        if order_number:
+            self.index.record_created(
+                order_number,
+                self._extract_order_id(response),
+            )
+
+        return response
+
+    @staticmethod
+    def _extract_order_id(response: Any) -> Optional[int]:
+        """Mintsoft puede devolver un dict o una lista de resultados"""
+        if isinstance(response, list):
+            response = response[0] if response else {}
+
+        if not isinstance(response, dict):
+            return None
+
+        return response.get("OrderId") or response.get("ID")
 
     # -------------------------------------------------
     # Orders – Update
@@ -81,11 +107,13 @@ class MintsoftOrderClient:
 
         url = f"{self.BASE_URL}/api/Order/{order_id}"
 
-        r = requests.post(
+        r = self._request(
+            "POST",
             url,
             headers=self.headers,
             json=payload,
             timeout=30,
+            retry=True,  # update por ID, idempotente
         )
         r.raise_for_status()
 
@@ -104,19 +132,25 @@ class MintsoftOrderClient:
         usando /api/Order/List (el endpoint real)
         """
 
-        orders: List[Dict[str, Any]] = []
-        page = 1
-
-        while page <= max_pages:
-            batch = self._get_orders_page(page, page_size)
+        return list(self.iter_orders(page_size, max_pages))
 
-            if not batch:
-                break
-
-            orders.extend(batch)
-            page += 1
+    def iter_orders(
+        self,
+        page_size: int = 100,
+        max_pages: int = 100
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Igual que get_orders pero como generador:
+        entrega las órdenes página a página
+        (páginas pedidas en paralelo, ver BaseClient._iter_pages)
+        """
 
-        return orders
+        for batch in self._iter_pages(
+            self._get_orders_page,
+            page_size,
+            max_pages,
+        ):
+            yield from batch
 
     # -------------------------------------------------
     # Orders – Get page
@@ -138,7 +172,8 @@ class MintsoftOrderClient:
             "Limit": limit,
         }
 
-        r = requests.get(
+        r = self._request(
+            "GET",
             url,
             headers=self.headers,
             params=params,
@@ -148,19 +183,98 @@ class MintsoftOrderClient:
 
         return r.json()
 
+    # -------------------------------------------------
+    # OrderNumber index
+    # -------------------------------------------------
+    def refresh_index(self) -> int:
+        """
+        Recorre /api/Order/List una vez y actualiza
+        el índice local OrderNumber → OrderId
+        """
+
+        loaded = self.index.load_orders(self.iter_orders())
+        self._index_loaded = True
+
+        return loaded
+
+    def ensure_index(self) -> None:
+        """
+        Carga el índice con un recorrido de /api/Order/List la
+        primera vez (una por cliente / run): así is_known_order
+        también ve las órdenes que ya estaban en Mintsoft
+        """
+        if self._index_loaded:
+            return
+
+        # Un solo recorrido aunque haya varios workers
+        with self._index_lock:
+            if not self._index_loaded:
+                self.refresh_index()
+
+    def is_known_order(self, order_number: str) -> bool:
+        """
+        True si la orden ya está en el índice local
+        (creada por nosotros o vista en un recorrido).
+        No hace llamadas HTTP: llamar antes a ensure_index.
+        """
+        return order_number in self.index
+
+    # -------------------------------------------------
+    # Orders – Get by ID
+    # -------------------------------------------------
+    def get_order(self, order_id: int) -> Dict[str, Any]:
+        """
+        GET /api/Order/{id}
+        """
+
+        url = f"{self.BASE_URL}/api/Order/{order_id}"
+
+        r = self._request(
+            "GET",
+            url,
+            headers=self.headers,
+            timeout=30,
+        )
+        r.raise_for_status()
+
+        return r.json()
+
     # -------------------------------------------------
     # Orders – Get by OrderNumber
     # -------------------------------------------------
+    def lookup_order_number(
+        self,
+        order_number: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Entrada del índice local para la orden:
+        {"ID": OrderId (puede faltar), "OrderNumber",
+        "source": "create" / "walk"}
+        """
+
+        self.ensure_index()
+
+        return self.index.get(order_number)
+
     def get_order_by_number(
         self,
         order_number: str
     ) -> Optional[Dict[str, Any]]:
         """
         Busca una orden en Mintsoft por OrderNumber
-        (Mintsoft NO tiene endpoint directo por número)
+        (Mintsoft NO tiene endpoint directo por número:
+        el ID sale del índice local)
         """
 
-        for order in self.get_orders():
+        entry = self.lookup_order_number(order_number)
+        if not entry:
+            return None
+
+        if entry.get("ID"):
+            return self.get_order(entry["ID"])
+
+        # Creada sin OrderId en la respuesta: se busca en el listado
+        for order in self.iter_orders():
             if order.get("OrderNumber") == order_number:
                 return order
 
@@ -1,12 +1,14 @@
 import os
-import requests
-from typing import List, Dict, Optional
-from dotenv import load_dotenv
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
 
-load_dotenv()
+from clients.base_client import BaseClient, PageWalk, _log_truncated_walk
+from clients.mintsoft_auth import get_api_key_provider
+from stores.product_index import ProductIndex
 
 
-class MintsoftProductClient:
+class MintsoftProductClient(BaseClient):
     """
     Cliente Mintsoft – Products API
     """
@@ -21,23 +23,29 @@ class MintsoftProductClient:
         if not all([self.username, self.password, self.client_id]):
             raise RuntimeError("Missing Mintsoft credentials")
 
-        self.api_key = self._authenticate()
+        # API key compartida entre clientes (y procesos, con
+        # MINTSOFT_API_KEY_CACHE_FILE); se pide en el primer request
+        self._auth = get_api_key_provider(
+            self.username,
+            self.password,
+            f"{self.BASE_URL}/Auth",
+        )
+
+        # Índice SKU → ID persistido en state/
+        self.index = ProductIndex()
+        self._index_loaded = False
+        self._index_lock = threading.Lock()
 
     # -------------------------------------------------
     # Auth
     # -------------------------------------------------
-    def _authenticate(self) -> str:
-        url = f"{self.BASE_URL}/Auth"
-
-        payload = {
-            "Username": self.username,
-            "Password": self.password,
-        }
-
-        r = requests.post(url, json=payload, timeout=30)
-        r.raise_for_status()
+    @property
+    def api_key(self) -> str:
+        return self._auth.get_key()
 
-        return r.json()
+    def _reauthenticate(self, headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        # 401: la key venció o fue revocada
+        return self._auth.renewed_headers(headers)
 
     # -------------------------------------------------
     # Headers
@@ -55,7 +63,8 @@ class MintsoftProductClient:
     def create_product(self, payload: Dict) -> Dict:
         url = f"{self.BASE_URL}/Product"
 
-        r = requests.put(
+        r = self._request(
+            "PUT",
             url,
             headers=self._headers(),
             json=payload,
@@ -63,7 +72,12 @@ class MintsoftProductClient:
         )
 
         r.raise_for_status()
-        return r.json() if r.text else {}
+        response = r.json() if r.text else {}
+
+        if isinstance(response, dict) and response.get("ID"):
+            self.index.upsert(payload.get("SKU"), response["ID"], payload)
+
+        return response
 
     # -------------------------------------------------
     # Update product
@@ -74,14 +88,20 @@ class MintsoftProductClient:
 
         url = f"{self.BASE_URL}/Product"
 
-        r = requests.post(
+        r = self._request(
+            "POST",
             url,
             headers=self._headers(),
             json=body,
-            timeout=30
+            timeout=30,
+            retry=True,  # update por ID, idempotente
         )
 
         r.raise_for_status()
+
+        if payload.get("SKU"):
+            self.index.upsert(payload["SKU"], product_id, payload)
+
         return r.json() if r.text else {}
 
     # -------------------------------------------------
@@ -93,19 +113,27 @@ class MintsoftProductClient:
         max_pages: int = 200
     ) -> List[Dict]:
 
-        products: List[Dict] = []
-        page = 1
-
-        while page <= max_pages:
-            batch = self._get_products_page(page, page_size)
-
-            if not batch:
-                break
+        return list(self.iter_all_products(page_size, max_pages))
 
-            products.extend(batch)
-            page += 1
+    def iter_all_products(
+        self,
+        page_size: int = 100,
+        max_pages: int = 200,
+        walk: Optional[PageWalk] = None,
+    ) -> Iterator[Dict]:
+        """
+        Igual que get_all_products pero como generador:
+        entrega los productos página a página
+        (páginas pedidas en paralelo, ver BaseClient._iter_pages)
+        """
 
-        return products
+        for batch in self._iter_pages(
+            self._get_products_page,
+            page_size,
+            max_pages,
+            walk=walk,
+        ):
+            yield from batch
 
     # -------------------------------------------------
     # Get products page
@@ -124,7 +152,8 @@ class MintsoftProductClient:
             "ClientId": self.client_id,
         }
 
-        r = requests.get(
+        r = self._request(
+            "GET",
             url,
             headers=self._headers(),
             params=params,
@@ -134,17 +163,80 @@ class MintsoftProductClient:
         r.raise_for_status()
         return r.json()
 
+    # -------------------------------------------------
+    # SKU index
+    # -------------------------------------------------
+    def refresh_index(self) -> int:
+        """
+        Recorre el catálogo completo una vez y
+        actualiza el índice local SKU → ID
+        """
+
+        walk_started = time.time()
+        walk = PageWalk()
+
+        loaded = self.index.load_catalog(self.iter_all_products(walk=walk))
+
+        # Sólo con el recorrido completo: SKUs que ya no están en Mintsoft.
+        # Si cortó por max_pages, las filas no vistas pueden existir todavía
+        if walk.complete:
+            self.index.remove_unseen(walk_started)
+        else:
+            _log_truncated_walk("Mintsoft products", walk)
+
+        self._index_loaded = True
+
+        return loaded
+
+    def _ensure_index(self) -> None:
+        if self._index_loaded:
+            return
+
+        # Un solo recorrido aunque haya varios workers
+        with self._index_lock:
+            if not self._index_loaded:
+                self.refresh_index()
+
+    # -------------------------------------------------
+    # Get product
+    # -------------------------------------------------
+    def get_product(self, product_id: int) -> Dict:
+        url = f"{self.BASE_URL}/Product/{product_id}"
+
+        r = self._request(
+            "GET",
+            url,
+            headers=self._headers(),
+            timeout=30
+        )
+
+        r.raise_for_status()
+        return r.json()
+
     # -------------------------------------------------
     # Get product by SKU
     # -------------------------------------------------
+    def lookup_sku(self, sku: str) -> Optional[Dict]:
+        """
+        Entrada del índice local para el SKU, sin llamadas
+        a Mintsoft salvo el primer recorrido del catálogo:
+        {"ID": product_id, "SKU": sku, "hash": hash del último
+        payload enviado (None si no lo enviamos nosotros)}
+        """
+
+        self._ensure_index()
+
+        return self.index.get(sku)
+
     def get_product_by_sku(self, sku: str) -> Optional[Dict]:
         """
         Mintsoft no tiene endpoint directo por SKU,
-        así que buscamos en memoria.
+        así que buscamos el ID en el índice local
+        y pedimos el producto por ID.
         """
 
-        for product in self.get_all_products():
-            if product.get("SKU") == sku:
-                return product
+        entry = self.lookup_sku(sku)
+        if not entry:
+            return None
 
-        return None
+        return self.get_product(entry["ID"])
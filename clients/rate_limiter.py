@@ -0,0 +1,201 @@
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from stores.sqlite_store import SqliteStore
+
+
+# -------------------------------------------------
+# Configuración
+# -------------------------------------------------
+# "host=requests_por_segundo:burst,..." ej:
+# HTTP_RATE_LIMITS="api.dsco.io=10:20,api.mintsoft.co.uk=5:10"
+HTTP_RATE_LIMITS = os.getenv("HTTP_RATE_LIMITS", "")
+
+# Si se define, los buckets se comparten entre procesos
+# (ej: state/rate_limits.sqlite)
+HTTP_RATE_LIMIT_DB = os.getenv("HTTP_RATE_LIMIT_DB")
+
+
+class TokenBucket:
+    """
+    Token bucket en memoria (compartido entre threads)
+    rate: requests por segundo, burst: tamaño del bucket
+    """
+
+    def __init__(self, rate: float, burst: int):
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+
+        self.rate = rate
+        self.burst = max(1, burst)
+
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Reserva un token; bloquea lo necesario.
+        Devuelve los segundos esperados.
+        """
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+        return wait
+
+    def reserve(self) -> float:
+        """
+        Reserva un token sin bloquear.
+        Devuelve los segundos que el caller debe esperar
+        (los clientes async esperan con asyncio.sleep).
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._updated_at) * self.rate,
+            )
+            self._updated_at = now
+
+            # Reserva: el saldo puede quedar negativo y
+            # cada caller espera su turno
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+
+class SqliteTokenBucket(SqliteStore):
+    """
+    Token bucket persistido en SQLite:
+    varios procesos (crons de órdenes y productos)
+    comparten el mismo límite por host
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS buckets (
+        host TEXT PRIMARY KEY,
+        tokens REAL NOT NULL,
+        updated_at REAL NOT NULL
+    );
+    """
+
+    def __init__(self, host: str, rate: float, burst: int, path: str):
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+
+        super().__init__("rate_limits.sqlite", path)
+        self.host = host
+        self.rate = rate
+        self.burst = max(1, burst)
+
+    def acquire(self) -> float:
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+        return wait
+
+    def reserve(self) -> float:
+        with self._lock:
+            # BEGIN IMMEDIATE serializa entre procesos
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT tokens, updated_at FROM buckets WHERE host = ?",
+                    (self.host,),
+                ).fetchone()
+
+                now = time.time()
+                if row is None:
+                    tokens = float(self.burst)
+                else:
+                    tokens = min(
+                        self.burst,
+                        row[0] + max(0.0, now - row[1]) * self.rate,
+                    )
+
+                tokens -= 1
+                self._conn.execute(
+                    """
+                    INSERT INTO buckets (host, tokens, updated_at)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(host) DO UPDATE SET
+                        tokens = excluded.tokens,
+                        updated_at = excluded.updated_at
+                    """,
+                    (self.host, tokens, now),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return max(0.0, -tokens / self.rate)
+
+
+Limiter = Union[TokenBucket, SqliteTokenBucket]
+
+
+# -------------------------------------------------
+# Registro por host (compartido en el proceso)
+# -------------------------------------------------
+_limits: Dict[str, Tuple[float, int]] = {}
+_limiters: Dict[str, Limiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def _parse_limits(raw: str) -> Dict[str, Tuple[float, int]]:
+    limits: Dict[str, Tuple[float, int]] = {}
+
+    for entry in filter(None, (e.strip() for e in raw.split(","))):
+        host, _, spec = entry.partition("=")
+        rate, _, burst = spec.partition(":")
+
+        if not host or not rate:
+            raise ValueError(f"Invalid HTTP_RATE_LIMITS entry: {entry!r}")
+
+        rate_value = float(rate)
+        limits[host.strip().lower()] = (
+            rate_value,
+            int(burst) if burst else max(1, int(rate_value)),
+        )
+
+    return limits
+
+
+_limits.update(_parse_limits(HTTP_RATE_LIMITS))
+
+
+def configure_rate_limit(host: str, rate: float, burst: Optional[int] = None) -> None:
+    """Define (o reemplaza) el límite de un host en runtime"""
+    host = host.lower()
+
+    with _limiters_lock:
+        _limits[host] = (rate, burst or max(1, int(rate)))
+        _limiters.pop(host, None)
+
+
+def get_rate_limiter(url: str) -> Optional[Limiter]:
+    """Limiter del host de la URL, o None si no tiene límite"""
+    host = (urlsplit(url).hostname or "").lower()
+
+    limiter = _limiters.get(host)
+    if limiter is not None or host not in _limits:
+        return limiter
+
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None and host in _limits:
+            rate, burst = _limits[host]
+
+            if HTTP_RATE_LIMIT_DB:
+                limiter = SqliteTokenBucket(host, rate, burst, HTTP_RATE_LIMIT_DB)
+            else:
+                limiter = TokenBucket(rate, burst)
+
+            _limiters[host] = limiter
+
+        return limiter
@@ -0,0 +1,123 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import List
+
+
+# -------------------------------------------------
+# Configuración global
+# -------------------------------------------------
+# 1 = los handlers (archivo / consola) corren en un thread
+# aparte; el loop de sync sólo encola el record
+LOG_ASYNC = int(os.getenv("LOG_ASYNC", 0))
+
+# Fracción de logs por item (INFO / DEBUG) que se escriben.
+# WARNING o mayor siempre se escriben.
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", 1.0))
+
+# Prefijos de los mensajes por item (los de batch / página
+# no se muestrean)
+SAMPLED_PREFIXES = ("[ORDER]", "[PRODUCT]")
+
+
+_listeners: List[QueueListener] = []
+_listeners_lock = threading.Lock()
+
+
+class ItemSampleFilter(logging.Filter):
+    """
+    Deja pasar sólo una fracción de los logs por item.
+    Va en el logger (no en el handler): lo descartado
+    no llega a encolarse ni a formatearse.
+    """
+
+    def __init__(self, rate: float, prefixes=SAMPLED_PREFIXES):
+        super().__init__()
+        self.rate = rate
+        self.prefixes = tuple(prefixes)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.rate >= 1:
+            return True
+
+        if not isinstance(record.msg, str) or not record.msg.startswith(self.prefixes):
+            return True
+
+        return random.random() < self.rate
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler que no formatea al encolar: el record viaja
+    tal cual (mismo proceso) y el formateo lo hace el
+    handler real en el thread del listener
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class lazy_json:
+    """
+    JSON indentado que se arma recién al formatear el record:
+    logger.info("%s", lazy_json(order)) no serializa nada si
+    el nivel está deshabilitado, y con LOG_ASYNC lo hace el
+    listener (el objeto no debe mutarse después de loguearlo)
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self) -> str:
+        return json.dumps(self.value, indent=2, default=str)
+
+
+def attach_handlers(logger: logging.Logger, handlers: List[logging.Handler]) -> None:
+    """
+    Agrega los handlers al logger:
+    - LOG_ASYNC=0: directo (escritura en el thread que loguea)
+    - LOG_ASYNC=1: detrás de una cola + listener en background
+    Con LOG_SAMPLE_RATE < 1 se muestrean los logs por item.
+    """
+
+    if LOG_SAMPLE_RATE < 1:
+        logger.addFilter(ItemSampleFilter(LOG_SAMPLE_RATE))
+
+    if not LOG_ASYNC:
+        for handler in handlers:
+            logger.addHandler(handler)
+        return
+
+    records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+    listener = QueueListener(records, *handlers, respect_handler_level=True)
+    listener.start()
+
+    with _listeners_lock:
+        _listeners.append(listener)
+
+    logger.addHandler(_DeferredQueueHandler(records))
+
+
+def stop_log_listeners() -> None:
+    """
+    Vacía las colas y detiene los listeners
+    (se llama solo al salir del proceso)
+    """
+    with _listeners_lock:
+        listeners = list(_listeners)
+        _listeners.clear()
+
+    for listener in listeners:
+        listener.stop()
+
+
+atexit.register(stop_log_listeners)
+
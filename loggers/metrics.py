@@ -0,0 +1,433 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlsplit
+
+
+# -------------------------------------------------
+# Configuración
+# -------------------------------------------------
+# Puerto del endpoint Prometheus (0 = deshabilitado)
+METRICS_PORT = int(os.getenv("METRICS_PORT", 0))
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+
+# Límites (segundos) de los buckets de latencia
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# Nombres de las métricas que escriben clientes y servicios
+HTTP_REQUESTS = "http_requests_total"
+HTTP_LATENCY = "http_request_seconds"
+HTTP_RETRIES = "http_retries_total"
+STAGE_LATENCY = "sync_stage_seconds"
+STAGE_ERRORS = "sync_stage_errors_total"
+
+# Etapas de un item dentro de un batch
+STAGE_FETCH = "fetch"
+STAGE_MAP = "map"
+STAGE_LOOKUP = "lookup"
+STAGE_WRITE = "write"
+
+Labels = Tuple[Tuple[str, str], ...]
+
+# Último status HTTP visto por el thread / task actual
+# (el journal lo registra junto al resultado del item)
+_last_status: ContextVar[Optional[int]] = ContextVar("last_http_status", default=None)
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        # Un contador por bucket + el de +Inf
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        index = 0
+        for bound in LATENCY_BUCKETS:
+            if value <= bound:
+                break
+            index += 1
+
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def copy(self) -> "_Histogram":
+        other = _Histogram()
+        other.counts = list(self.counts)
+        other.count = self.count
+        other.sum = self.sum
+        other.max = self.max
+        return other
+
+
+class MetricsRegistry:
+    """
+    Registro en proceso de contadores e histogramas
+    de latencia, identificados por nombre + labels.
+
+    Thread-safe; lo comparten clientes (por endpoint
+    y status) y servicios (por etapa).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], _Histogram] = {}
+
+    # -------------------------------------------------
+    # Escritura
+    # -------------------------------------------------
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        key = (name, _labels(labels))
+
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        key = (name, _labels(labels))
+
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram()
+            histogram.observe(seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    # -------------------------------------------------
+    # Lectura
+    # -------------------------------------------------
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Copia del estado actual (para comparar contra
+        una copia anterior: ver summary)
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "histograms": {
+                    key: histogram.copy()
+                    for key, histogram in self._histograms.items()
+                },
+            }
+
+    def summary(self, since: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Resumen legible (una línea por serie).
+        since: snapshot previo → sólo lo ocurrido desde entonces
+        """
+        current = self.snapshot()
+        before_counters = since["counters"] if since else {}
+        before_histograms = since["histograms"] if since else {}
+
+        lines: List[str] = []
+
+        for (name, labels), histogram in sorted(current["histograms"].items()):
+            before = before_histograms.get((name, labels))
+            count = histogram.count - (before.count if before else 0)
+            if not count:
+                continue
+
+            total = histogram.sum - (before.sum if before else 0.0)
+            counts = [
+                c - (before.counts[i] if before else 0)
+                for i, c in enumerate(histogram.counts)
+            ]
+
+            line = (
+                f"{name}{_format_labels(labels)} | "
+                f"count={count} | total={total:.2f}s | "
+                f"avg={total / count * 1000:.1f}ms | "
+                f"p50<={_quantile(counts, count, 0.50)} | "
+                f"p95<={_quantile(counts, count, 0.95)}"
+            )
+            # El máximo es de todo el proceso: sólo sin baseline
+            if before is None:
+                line += f" | max={histogram.max * 1000:.1f}ms"
+
+            lines.append(line)
+
+        for (name, labels), value in sorted(current["counters"].items()):
+            value -= before_counters.get((name, labels), 0.0)
+            if not value:
+                continue
+
+            lines.append(f"{name}{_format_labels(labels)} | {value:g}")
+
+        return lines
+
+    def render_prometheus(self) -> str:
+        """Formato de texto de Prometheus (exposition 0.0.4)"""
+        current = self.snapshot()
+        out: List[str] = []
+
+        for name in sorted({n for n, _ in current["counters"]}):
+            out.append(f"# TYPE {name} counter")
+            for (n, labels), value in sorted(current["counters"].items()):
+                if n == name:
+                    out.append(f"{name}{_format_labels(labels)} {value:g}")
+
+        for name in sorted({n for n, _ in current["histograms"]}):
+            out.append(f"# TYPE {name} histogram")
+            for (n, labels), histogram in sorted(current["histograms"].items()):
+                if n != name:
+                    continue
+
+                cumulative = 0
+                for bound, count in zip(
+                    LATENCY_BUCKETS + (float("inf"),),
+                    histogram.counts,
+                ):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    bucket_labels = labels + (("le", le),)
+                    out.append(
+                        f"{name}_bucket{_format_labels(bucket_labels)} {cumulative}"
+                    )
+
+                out.append(f"{name}_sum{_format_labels(labels)} {histogram.sum:.6f}")
+                out.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+        return "\n".join(out) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+# -------------------------------------------------
+# Helpers para clientes / servicios
+# -------------------------------------------------
+def inc(name: str, value: float = 1.0, **labels: Any) -> None:
+    registry.inc(name, value, **labels)
+
+
+def observe(name: str, seconds: float, **labels: Any) -> None:
+    registry.observe(name, seconds, **labels)
+
+
+def record_http(
+    method: str,
+    url: str,
+    status: Any,
+    seconds: float,
+) -> None:
+    """
+    Un intento HTTP: status es el código o "error"
+    (excepción de conexión / timeout)
+    """
+    endpoint = endpoint_label(url)
+
+    _last_status.set(status if isinstance(status, int) else None)
+
+    registry.inc(HTTP_REQUESTS, method=method, endpoint=endpoint, status=status)
+    registry.observe(HTTP_LATENCY, seconds, method=method, endpoint=endpoint)
+
+
+def last_http_status() -> Optional[int]:
+    """Status del último request hecho desde este thread / task"""
+    return _last_status.get()
+
+
+def record_retry(method: str, url: str) -> None:
+    registry.inc(HTTP_RETRIES, method=method, endpoint=endpoint_label(url))
+
+
+@contextmanager
+def stage(entity: str, name: str) -> Iterator[None]:
+    """
+    Mide una etapa (fetch / map / lookup / write) de un item.
+    Si la etapa lanza, cuenta el error y lo re-lanza.
+    """
+    start = time.perf_counter()
+
+    try:
+        yield
+    except BaseException:
+        registry.inc(STAGE_ERRORS, entity=entity, stage=name)
+        raise
+    finally:
+        registry.observe(
+            STAGE_LATENCY,
+            time.perf_counter() - start,
+            entity=entity,
+            stage=name,
+        )
+
+
+def timed_iter(items: Iterable[Any], entity: str, name: str) -> Iterator[Any]:
+    """Mide cuánto tarda en llegar cada elemento (páginas)"""
+    iterator = iter(items)
+
+    while True:
+        with stage(entity, name):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+
+        yield item
+
+
+async def atimed_iter(
+    items: AsyncIterable[Any],
+    entity: str,
+    name: str,
+) -> AsyncIterator[Any]:
+    """Versión async de timed_iter"""
+    iterator = items.__aiter__()
+
+    while True:
+        with stage(entity, name):
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+
+        yield item
+
+
+def log_summary(logger, title: str, since: Optional[Dict[str, Any]] = None) -> None:
+    """Escribe el resumen de métricas al final de un batch"""
+    lines = registry.summary(since)
+
+    logger.info(f"[METRICS] {title} | series={len(lines)}")
+    for line in lines:
+        logger.info(f"[METRICS] {line}")
+
+
+def endpoint_label(url: str) -> str:
+    """
+    Path sin query ni IDs (/api/Order/123/... → /api/Order/{id}/...)
+    para no abrir una serie por cada recurso
+    """
+    path = urlsplit(url).path or "/"
+
+    return "/".join(
+        "{id}" if segment.isdigit() else segment
+        for segment in path.split("/")
+    )
+
+
+# -------------------------------------------------
+# Endpoint Prometheus (opcional)
+# -------------------------------------------------
+_server: Optional[ThreadingHTTPServer] = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(
+    port: Optional[int] = None,
+    host: Optional[str] = None,
+) -> Optional[ThreadingHTTPServer]:
+    """
+    Sirve GET /metrics en un thread daemon.
+    Sin port se usa METRICS_PORT (leído al llamar: el .env
+    se carga en el entry point); 0 no levanta nada.
+    Idempotente: un solo servidor por proceso.
+    """
+    global _server
+
+    if port is None:
+        port = int(os.getenv("METRICS_PORT", METRICS_PORT))
+    if host is None:
+        host = os.getenv("METRICS_HOST", METRICS_HOST)
+
+    if not port:
+        return None
+
+    with _server_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            _server.daemon_threads = True
+
+            threading.Thread(
+                target=_server.serve_forever,
+                name="metrics-server",
+                daemon=True,
+            ).start()
+
+        return _server
+
+
+def stop_metrics_server() -> None:
+    global _server
+
+    with _server_lock:
+        if _server is not None:
+            _server.shutdown()
+            _server.server_close()
+            _server = None
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if urlsplit(self.path).path != "/metrics":
+            self.send_error(404)
+            return
+
+        data = registry.render_prometheus().encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+# -------------------------------------------------
+# Helpers internos
+# -------------------------------------------------
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+
+    body = ",".join(
+        '{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"'))
+        for k, v in labels
+    )
+    return "{" + body + "}"
+
+
+def _quantile(counts: List[int], total: int, q: float) -> str:
+    """Cota superior del bucket donde cae el cuantil q"""
+    rank = q * total
+    cumulative = 0
+
+    for bound, count in zip(LATENCY_BUCKETS, counts):
+        cumulative += count
+        if cumulative >= rank:
+            return f"{bound * 1000:g}ms"
+
+    return f">{LATENCY_BUCKETS[-1]:g}s"
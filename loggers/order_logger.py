@@ -2,6 +2,8 @@ import logging
 import os
 from logging.handlers import RotatingFileHandler
 
+from loggers.log_queue import attach_handlers
+
 # -------------------------------------------------
 # Configuración global
 # -------------------------------------------------
@@ -21,6 +23,8 @@ def get_logger(name: str, filename: str) -> logging.Logger:
     - Rotación de archivos
     - Console output
     - Nivel configurable por ENV
+    - Escritura en background / muestreo opcionales
+      (LOG_ASYNC / LOG_SAMPLE_RATE, ver loggers.log_queue)
     """
 
     _ensure_log_dir()
@@ -52,7 +56,6 @@ def get_logger(name: str, filename: str) -> logging.Logger:
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
+    attach_handlers(logger, [file_handler, stream_handler])
 
     return logger
@@ -2,6 +2,8 @@ import logging
 import os
 from logging.handlers import RotatingFileHandler
 
+from loggers.log_queue import attach_handlers
+
 # -------------------------------------------------
 # Configuración
 # -------------------------------------------------
@@ -51,7 +53,7 @@ def get_product_logger():
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
+    # Directo o vía cola en background (LOG_ASYNC)
+    attach_handlers(logger, [file_handler, stream_handler])
 
     return logger
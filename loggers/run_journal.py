@@ -0,0 +1,256 @@
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional
+
+from loggers.order_logger import LOG_DIR
+
+
+# -------------------------------------------------
+# Configuración global
+# -------------------------------------------------
+JOURNAL_DIR = os.getenv("JOURNAL_DIR", os.path.join(LOG_DIR, "journal"))
+
+# Records en buffer antes de escribir al archivo del run
+JOURNAL_FLUSH_EVERY = int(os.getenv("JOURNAL_FLUSH_EVERY", 100))
+
+# Índice con un resumen por run (una línea cada uno)
+RUNS_INDEX = "runs.jsonl"
+
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+STATUS_NOT_FOUND = "not_found"
+STATUS_INVALID = "invalid"
+
+
+class RunJournal:
+    """
+    Journal JSONL append-only de un run de sync.
+
+    journal/<entity>/<YYYY-MM-DD>/<run_id>.jsonl
+      {"type": "item", "key", "action", "status", "ms", "http", ...}
+      ...
+      {"type": "summary", ...}
+
+    journal/runs.jsonl
+      una línea "summary" por run: throughput y tasa de fallos
+      de miles de runs sin abrir sus archivos (ver iter_runs)
+
+    Thread-safe; también se comparte entre tasks de un event loop.
+    """
+
+    def __init__(
+        self,
+        entity: str,
+        kind: str = "sync",
+        directory: Optional[str] = None,
+        **context: Any,
+    ):
+        self.entity = entity
+        self.kind = kind
+        self.directory = directory or JOURNAL_DIR
+        self.context = context
+
+        self.started_at = datetime.now(timezone.utc)
+        self._start = time.perf_counter()
+
+        self.run_id = (
+            f"{self.started_at.strftime('%Y%m%dT%H%M%S')}-"
+            f"{entity}-{kind}-{uuid.uuid4().hex[:8]}"
+        )
+        self.path = os.path.join(
+            self.directory,
+            entity,
+            self.started_at.strftime("%Y-%m-%d"),
+            f"{self.run_id}.jsonl",
+        )
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._closed = False
+        self.summary: Optional[Dict[str, Any]] = None
+
+        self.total = 0
+        self.latency_ms = 0.0
+        self.by_status: Dict[str, int] = {}
+        self.by_action: Dict[str, int] = {}
+
+    # -------------------------------------------------
+    # Items
+    # -------------------------------------------------
+    def record(
+        self,
+        key: Optional[str],
+        action: Optional[str],
+        started: float,
+        status: Optional[str] = None,
+        http_status: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Un item resuelto.
+        started: time.perf_counter() al empezar el item
+        status: default ok / failed según haya error
+        http_status: default el de la respuesta del error
+        """
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        if status is None:
+            status = STATUS_FAILED if error is not None else STATUS_OK
+
+        if http_status is None and error is not None:
+            response = getattr(error, "response", None)
+            http_status = getattr(response, "status_code", None)
+
+        entry = {
+            "type": "item",
+            "ts": round(time.time(), 3),
+            "key": key,
+            "action": action,
+            "status": status,
+            "ms": elapsed_ms,
+            "http": http_status,
+        }
+        if error is not None:
+            entry["error"] = str(error)[:500]
+
+        line = json.dumps(entry, separators=(",", ":"))
+
+        with self._lock:
+            self.total += 1
+            self.latency_ms += elapsed_ms
+            self.by_status[status] = self.by_status.get(status, 0) + 1
+            if action:
+                self.by_action[action] = self.by_action.get(action, 0) + 1
+
+            self._buffer.append(line)
+            if len(self._buffer) >= JOURNAL_FLUSH_EVERY:
+                self._flush()
+
+    # -------------------------------------------------
+    # Cierre
+    # -------------------------------------------------
+    def close(self, **extra: Any) -> Dict[str, Any]:
+        """
+        Escribe el resumen del run (en su archivo y en el
+        índice runs.jsonl) y lo devuelve. Idempotente.
+        """
+        with self._lock:
+            if self._closed:
+                return self.summary
+
+            seconds = time.perf_counter() - self._start
+            failed = self.total - self.by_status.get(STATUS_OK, 0)
+
+            self.summary = {
+                "type": "summary",
+                "run_id": self.run_id,
+                "entity": self.entity,
+                "kind": self.kind,
+                "started_at": self.started_at.isoformat(),
+                "finished_at": datetime.now(timezone.utc).isoformat(),
+                "seconds": round(seconds, 3),
+                "total": self.total,
+                "failed": failed,
+                "failure_rate": round(failed / self.total, 4) if self.total else 0.0,
+                "items_per_sec": round(self.total / seconds, 2) if seconds else 0.0,
+                "avg_ms": round(self.latency_ms / self.total, 1) if self.total else 0.0,
+                "by_status": dict(self.by_status),
+                "by_action": dict(self.by_action),
+                "path": os.path.relpath(self.path, self.directory),
+                **self.context,
+                **extra,
+            }
+
+            line = json.dumps(self.summary, separators=(",", ":"), default=str)
+
+            self._buffer.append(line)
+            self._flush()
+            self._closed = True
+
+        _append_line(os.path.join(self.directory, RUNS_INDEX), line)
+
+        return self.summary
+
+    def __enter__(self) -> "RunJournal":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc is not None:
+            self.close(error=repr(exc))
+        else:
+            self.close()
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+
+        _append_line(self.path, "\n".join(self._buffer))
+        self._buffer.clear()
+
+
+# -------------------------------------------------
+# Lectura
+# -------------------------------------------------
+def iter_runs(
+    entity: Optional[str] = None,
+    since: Optional[str] = None,
+    directory: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Resúmenes de runs desde el índice (más viejos primero).
+    since: ISO 8601, compara contra started_at
+    """
+    path = os.path.join(directory or JOURNAL_DIR, RUNS_INDEX)
+
+    try:
+        f = open(path, "r", encoding="utf-8")
+    except OSError:
+        return
+
+    with f:
+        for line in f:
+            try:
+                run = json.loads(line)
+            except ValueError:
+                # Línea cortada por un proceso que murió escribiendo
+                continue
+
+            if entity and run.get("entity") != entity:
+                continue
+            if since and run.get("started_at", "") < since:
+                continue
+
+            yield run
+
+
+def iter_items(run: Dict[str, Any], directory: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Records por item de un run (resumen de iter_runs)"""
+    path = os.path.join(directory or JOURNAL_DIR, run["path"])
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+
+            if entry.get("type") == "item":
+                yield entry
+
+
+# -------------------------------------------------
+# Helpers
+# -------------------------------------------------
+def _append_line(path: str, data: str) -> None:
+    # Un solo write en modo append: las líneas de distintos
+    # procesos no se intercalan
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, (data + "\n").encode("utf-8"))
+    finally:
+        os.close(fd)
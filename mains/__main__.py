@@ -0,0 +1,6 @@
+import sys
+
+from mains.cli import main
+
+
+sys.exit(main())
@@ -0,0 +1,327 @@
+"""
+CLI única de DscoMintsoft
+
+    python -m mains orders sync [--from ISO] [--to ISO] [--workers N] [--async]
+    python -m mains products sync [--created-from ISO] [--updated-from ISO] ...
+    python -m mains backfill --from ISO --to ISO [--shards N] [--parallel N]
+    python -m mains replay orders|products [--limit N] [--rate N] [--async]
+    python -m mains catalog push FILE.jsonl [--max-items N] [--max-wait S] [--async]
+    python -m mains bench [argumentos de bench.run_bench]
+
+Los servicios / clientes se importan recién al ejecutar el
+comando (después de cargar el .env): --help y los comandos
+que no tocan las APIs arrancan sin ese costo.
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+# -------------------------------------------------
+# Comandos
+# -------------------------------------------------
+def _orders_sync(args: argparse.Namespace) -> int:
+    window = _drop_none({
+        "updated_from": args.date_from,
+        "updated_to": args.date_to,
+        "workers": args.workers,
+        "prefetch_depth": args.prefetch,
+    })
+
+    if args.use_async:
+        from services.async_order_service import AsyncOrderSyncService
+
+        _run_async(AsyncOrderSyncService, lambda s: s.sync_all_orders(**window))
+    else:
+        from services.order_service import OrderSyncService
+
+        OrderSyncService().sync_all_orders(**window)
+
+    return 0
+
+
+def _products_sync(args: argparse.Namespace) -> int:
+    window = _drop_none({
+        "page_size": args.page_size,
+        "created_from": args.created_from,
+        "created_to": args.created_to,
+        "updated_from": args.updated_from,
+        "updated_to": args.updated_to,
+        "workers": args.workers,
+        "prefetch_depth": args.prefetch,
+    })
+
+    if args.use_async:
+        from services.async_product_service import AsyncProductSyncService
+
+        _run_async(AsyncProductSyncService, lambda s: s.sync_all_products(**window))
+    else:
+        from services.product_service import ProductSyncService
+
+        ProductSyncService().sync_all_products(**window)
+
+    return 0
+
+
+def _backfill(args: argparse.Namespace) -> int:
+    options = _drop_none({
+        "created_from": args.date_from,
+        "created_to": args.date_to,
+        "shards": args.shards,
+        "parallel": args.parallel,
+        "workers": args.workers,
+    })
+
+    if args.use_async:
+        from services.async_order_service import AsyncOrderSyncService
+
+        result = _run_async(AsyncOrderSyncService, lambda s: s.backfill_orders(**options))
+    else:
+        from services.order_service import OrderSyncService
+
+        result = OrderSyncService().backfill_orders(**options)
+
+    return 1 if result["failed_windows"] else 0
+
+
+def _replay(args: argparse.Namespace) -> int:
+    options = _drop_none({
+        "limit": args.limit,
+        "workers": args.workers,
+        "rate": args.rate,
+        "max_attempts": args.max_attempts,
+    })
+
+    # La cola se mira antes de levantar servicios / clientes
+    from stores.dead_letter_store import DeadLetterStore
+
+    entity = "order" if args.entity == "orders" else "product"
+    if not DeadLetterStore().count(entity):
+        print(f"No failed {args.entity} to replay")
+        return 0
+
+    if args.entity == "orders":
+        if args.use_async:
+            from services.async_order_service import AsyncOrderSyncService as service
+        else:
+            from services.order_service import OrderSyncService as service
+    else:
+        if args.use_async:
+            from services.async_product_service import AsyncProductSyncService as service
+        else:
+            from services.product_service import ProductSyncService as service
+
+    if args.use_async:
+        result = _run_async(service, lambda s: s.replay_dead_letters(**options))
+    else:
+        result = service().replay_dead_letters(**options)
+
+    print(
+        f"{args.entity}: replayed={result['replayed']} "
+        f"failed={result['failed']} remaining={result['remaining']}"
+    )
+    return 1 if result["failed"] else 0
+
+
+def _catalog_push(args: argparse.Namespace) -> int:
+    options = _drop_none({
+        "max_items": args.max_items,
+        "max_wait": args.max_wait,
+    })
+    items = _read_jsonl(args.file)
+
+    if args.use_async:
+        from services.async_product_service import AsyncProductSyncService
+
+        result = _run_async(
+            AsyncProductSyncService,
+            lambda s: s.push_catalog_updates(items, **options),
+        )
+    else:
+        from services.product_service import ProductSyncService
+
+        result = ProductSyncService().push_catalog_updates(items, **options)
+
+    # submitted: aceptados por DSCO, el resultado por item llega después
+    print(
+        f"catalog: submitted={result['submitted']} "
+        f"failed={result['failed']}"
+    )
+    return 1 if result["failed"] else 0
+
+
+def _bench(args: argparse.Namespace) -> int:
+    from bench.run_bench import main as bench_main
+
+    return bench_main(args.bench_args)
+
+
+# -------------------------------------------------
+# Helpers
+# -------------------------------------------------
+def _run_async(service_class, call: Callable[[Any], Any]) -> Any:
+    import asyncio
+
+    async def _main() -> Any:
+        service = service_class()
+        try:
+            return await call(service)
+        finally:
+            await service.aclose()
+
+    return asyncio.run(_main())
+
+
+def _drop_none(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Lo que no se pasó por CLI queda con el default del servicio"""
+    return {k: v for k, v in options.items() if v is not None}
+
+
+def _read_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """Un item por línea (JSON); "-" = stdin. Se lee a medida que se envía."""
+    source = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+
+    try:
+        for line in source:
+            if line.strip():
+                yield json.loads(line)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+def _iso_datetime(value: str) -> datetime:
+    """ISO 8601 (acepta Z); sin zona horaria se asume UTC"""
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid ISO 8601 date: {value}")
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+
+    return parsed
+
+
+def _add_run_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--workers", type=int, help="items en paralelo")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="servicio asyncio")
+
+
+# -------------------------------------------------
+# Parser
+# -------------------------------------------------
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m mains",
+        description="DSCO ↔ Mintsoft sync",
+    )
+    parser.add_argument("--env-file", help=".env a cargar (default: el del directorio)")
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    # orders sync
+    orders = commands.add_parser("orders", help="órdenes DSCO → Mintsoft")
+    orders_commands = orders.add_subparsers(dest="action", required=True)
+    orders_sync = orders_commands.add_parser("sync", help="sync por ventana de fechas")
+    orders_sync.add_argument("--from", dest="date_from", type=_iso_datetime)
+    orders_sync.add_argument("--to", dest="date_to", type=_iso_datetime)
+    orders_sync.add_argument("--prefetch", type=int, help="páginas por adelantado")
+    _add_run_options(orders_sync)
+    orders_sync.set_defaults(handler=_orders_sync, title="ORDER SYNC")
+
+    # products sync
+    products = commands.add_parser("products", help="productos DSCO → Mintsoft")
+    products_commands = products.add_subparsers(dest="action", required=True)
+    products_sync = products_commands.add_parser("sync", help="sync por ventana de fechas")
+    products_sync.add_argument("--created-from", type=_iso_datetime)
+    products_sync.add_argument("--created-to", type=_iso_datetime)
+    products_sync.add_argument("--updated-from", type=_iso_datetime)
+    products_sync.add_argument("--updated-to", type=_iso_datetime)
+    products_sync.add_argument("--page-size", type=int, default=100)
+    products_sync.add_argument("--prefetch", type=int, help="páginas por adelantado")
+    _add_run_options(products_sync)
+    products_sync.set_defaults(handler=_products_sync, title="PRODUCT SYNC")
+
+    # backfill
+    backfill = commands.add_parser("backfill", help="backfill de órdenes por sub-ventanas")
+    backfill.add_argument("--from", dest="date_from", type=_iso_datetime, required=True)
+    backfill.add_argument("--to", dest="date_to", type=_iso_datetime, required=True)
+    backfill.add_argument("--shards", type=int)
+    backfill.add_argument("--parallel", type=int)
+    _add_run_options(backfill)
+    backfill.set_defaults(handler=_backfill, title="ORDER BACKFILL")
+
+    # replay
+    replay = commands.add_parser("replay", help="re-enviar items fallidos (dead letters)")
+    replay.add_argument("entity", choices=("orders", "products"))
+    replay.add_argument("--limit", type=int)
+    replay.add_argument("--rate", type=float, help="items por segundo (0 = sin límite)")
+    replay.add_argument("--max-attempts", type=int)
+    _add_run_options(replay)
+    replay.set_defaults(handler=_replay, title="DEAD LETTER REPLAY")
+
+    # catalog push
+    catalog = commands.add_parser("catalog", help="updates de catálogo Mintsoft → DSCO")
+    catalog_commands = catalog.add_subparsers(dest="action", required=True)
+    catalog_push = catalog_commands.add_parser(
+        "push",
+        help="envía items (JSON lines) por /catalog/batch/small",
+    )
+    catalog_push.add_argument("file", help="archivo JSON lines (- = stdin)")
+    catalog_push.add_argument("--max-items", type=int, help="items por batch")
+    catalog_push.add_argument("--max-wait", type=float, help="segundos máximos por batch")
+    catalog_push.add_argument("--async", dest="use_async", action="store_true", help="servicio asyncio")
+    catalog_push.set_defaults(handler=_catalog_push, title="DSCO CATALOG PUSH")
+
+    # bench
+    # (sólo para --help; main() le pasa los argumentos a bench.run_bench)
+    commands.add_parser("bench", help="benchmark contra el servidor mock")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # bench tiene su propio parser: sus opciones (--orders ...)
+    # pasan tal cual, argparse no las reconoce como REMAINDER
+    if argv[:1] == ["bench"]:
+        return _bench(argparse.Namespace(bench_args=argv[1:]))
+
+    args = build_parser().parse_args(argv)
+
+    # Antes de importar servicios / mappers: leen el entorno al importarse
+    from dotenv import load_dotenv
+
+    load_dotenv(args.env_file)
+
+    return _run_logged(args)
+
+
+def _run_logged(args: argparse.Namespace) -> int:
+    from loggers.metrics import start_metrics_server
+    from loggers.order_logger import get_logger
+
+    # GET /metrics si METRICS_PORT está definido
+    start_metrics_server()
+
+    logger = get_logger("cli", "cli.log")
+    logger.info(f"===== {args.title} STARTED =====")
+
+    try:
+        code = args.handler(args)
+    except Exception:
+        logger.exception(f"===== {args.title} FAILED =====")
+        return 1
+
+    logger.info(f"===== {args.title} FINISHED | exit={code} =====")
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
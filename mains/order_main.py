@@ -5,12 +5,17 @@ DSCO → Mintsoft
 
 from dotenv import load_dotenv
 
+# Antes de importar clientes / loggers: leen el entorno al importarse
+load_dotenv()
+
 from services.order_service import OrderSyncService
 from loggers.order_logger import get_logger
+from loggers.metrics import start_metrics_server
 
 
 def main():
-    load_dotenv()
+    # GET /metrics si METRICS_PORT está definido
+    start_metrics_server()
 
     logger = get_logger("order_main", "orders.log")
     logger.info("===== ORDER SYNC STARTED =====")
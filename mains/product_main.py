@@ -5,12 +5,17 @@ DSCO / XoroSoft → Mintsoft
 
 from dotenv import load_dotenv
 
+# Antes de importar clientes / loggers: leen el entorno al importarse
+load_dotenv()
+
 from services.product_service import ProductSyncService
 from loggers.product_logger import get_product_logger
+from loggers.metrics import start_metrics_server
 
 
 def main():
-    load_dotenv()
+    # GET /metrics si METRICS_PORT está definido
+    start_metrics_server()
 
     logger = get_product_logger()
     logger.info("===== PRODUCT SYNC STARTED =====")
@@ -6,12 +6,13 @@ import sys
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, ROOT)
 
+# Antes de importar clientes / loggers: leen el entorno al importarse
+load_dotenv()
+
 from clients.dsco_product_client import DscoProductClient
 from loggers.product_logger import get_product_logger
 
 def main():
-    load_dotenv()
-
     client = DscoProductClient()
 
     client._get_oauth_token()
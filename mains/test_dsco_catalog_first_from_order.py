@@ -1,15 +1,16 @@
 from dotenv import load_dotenv
-import json
 from datetime import datetime, timedelta, timezone
 
+# Antes de importar clientes / loggers: leen el entorno al importarse
+load_dotenv()
+
 from clients.dsco_order_client import DscoOrderClient
 from clients.dsco_product_client import DscoProductClient
 from loggers.product_logger import get_product_logger
+from loggers.log_queue import lazy_json
 
 
 def main():
-    load_dotenv()
-
     logger = get_product_logger()
     logger.info("===== DSCO CATALOG TEST FROM ORDER START =====")
 
@@ -38,7 +39,7 @@ def main():
 
 
     logger.debug("Raw orders_page response:")
-    logger.debug(json.dumps(orders_page, indent=2))
+    logger.debug("%s", lazy_json(orders_page))
 
     orders = orders_page.get("orders") or []
 
@@ -58,7 +59,7 @@ def main():
 
     if not order_lines:
         logger.warning("Order has no orderLines")
-        logger.info(json.dumps(order, indent=2))
+        logger.info("%s", lazy_json(order))
         return
 
     line = order_lines[0]
@@ -71,7 +72,7 @@ def main():
 
     if not sku:
         logger.warning("No SKU found in order line")
-        logger.info(json.dumps(line, indent=2))
+        logger.info("%s", lazy_json(line))
         return
 
     logger.info(f"Using SKU: {sku}")
@@ -89,7 +90,7 @@ def main():
         return
 
     logger.info("===== CATALOG ITEM =====")
-    logger.info(json.dumps(catalog_item, indent=2))
+    logger.info("%s", lazy_json(catalog_item))
 
     logger.info("===== DSCO CATALOG TEST FROM ORDER END =====")
 
@@ -1,13 +1,14 @@
 from dotenv import load_dotenv
-import json
+
+# Antes de importar clientes / loggers: leen el entorno al importarse
+load_dotenv()
 
 from clients.dsco_product_client import DscoProductClient
 from loggers.product_logger import get_product_logger
+from loggers.log_queue import lazy_json
 
 
 def main():
-    load_dotenv()
-
     logger = get_product_logger()
     logger.info("===== DSCO CATALOG PRODUCT TEST START =====")
 
@@ -24,7 +25,7 @@ def main():
             return
 
         logger.info("Product fetched successfully")
-        logger.info(json.dumps(product, indent=2))
+        logger.info("%s", lazy_json(product))
 
     except Exception as e:
         logger.exception(
@@ -1,17 +1,18 @@
 from dotenv import load_dotenv
-import json
 import os
 import sys
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, ROOT)
 
+# Antes de importar clientes / loggers: leen el entorno al importarse
+load_dotenv()
+
 from clients.dsco_order_client import DscoOrderClient
 from loggers.product_logger import get_product_logger
+from loggers.log_queue import lazy_json
 
 def main():
-    load_dotenv()
-
     logger = get_product_logger()
     logger.info("===== DSCO ORDER TEST START =====")
 
@@ -36,7 +37,7 @@ def main():
     # Imprimir JSON completo de la orden
     # -------------------------------------------------
     logger.info(f"Order fetched successfully for PO Number: {poNumber}")
-    logger.info(json.dumps(order, indent=2))
+    logger.info("%s", lazy_json(order))
 
     logger.info("===== DSCO ORDER TEST END =====")
 
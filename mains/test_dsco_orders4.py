@@ -1,5 +1,4 @@
 from dotenv import load_dotenv
-import json
 import os
 import sys
 from datetime import datetime, timedelta, timezone
@@ -7,13 +6,15 @@ from datetime import datetime, timedelta, timezone
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, ROOT)
 
+# Antes de importar clientes / loggers: leen el entorno al importarse
+load_dotenv()
+
 from clients.dsco_order_client import DscoOrderClient
 from loggers.product_logger import get_product_logger
+from loggers.log_queue import lazy_json
 import requests
 
 def main():
-    load_dotenv()
-
     logger = get_product_logger()
     logger.info("===== DSCO ORDER TEST START =====")
 
@@ -57,7 +58,7 @@ def main():
         # -------------------------------------------------
         for i, order in enumerate(orders, start=1):
             logger.info(f"--- ORDER #{i} ---")
-            logger.info(json.dumps(order, indent=2))
+            logger.info("%s", lazy_json(order))
 
     except Exception as e:
         logger.error(f"Error fetching orders: {e}")
@@ -1,17 +1,18 @@
 from dotenv import load_dotenv
-import json
 import os 
 import sys
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, ROOT)
 
+# Antes de importar clientes / loggers: leen el entorno al importarse
+load_dotenv()
+
 from clients.dsco_product_client import DscoProductClient
 from loggers.product_logger import get_product_logger
+from loggers.log_queue import lazy_json
 
 def main():
-    load_dotenv()
-
     logger = get_product_logger()
     logger.info("===== DSCO PRODUCT TEST START =====")
 
@@ -36,7 +37,7 @@ def main():
 
     for i, product in enumerate(products, start=1):
         logger.info(f"--- PRODUCT #{i} ---")
-        logger.info(json.dumps(product, indent=2))
+        logger.info("%s", lazy_json(product))
 
     logger.info("===== DSCO PRODUCT TEST END =====")
 
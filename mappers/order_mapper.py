@@ -1,6 +1,6 @@
 import os
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
 
 DEFAULT_WAREHOUSE_ID = int(os.getenv("MINTSOFT_WAREHOUSE_ID", 1))
@@ -14,12 +14,55 @@ COURIER_SERVICE_MAP = {
     "FEDEX": 1007,
 }
 
+# Valores que _remove_empty descarta (constante: no se
+# arma una lista / dict nuevos por cada campo)
+_EMPTY_VALUES = (None, "", [], {})
+
+# Tope de fechas memorizadas por lote (archivos grandes)
+_CACHE_MAX_ENTRIES = 50_000
+
 
 def map_dsco_order_to_mintsoft(dsco_order: Dict[str, Any]) -> Dict[str, Any]:
     """
     DSCO → Mintsoft Order mapper (production ready)
     """
+    return _map_order(dsco_order, _MapCache())
+
+
+def map_many(
+    dsco_orders: Iterable[Dict[str, Any]],
+) -> Tuple[List[Optional[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """
+    Mapea un lote (página o archivo) de órdenes DSCO.
+    No lanza excepciones: devuelve (payloads, errores).
+    payloads tiene un lugar por registro de entrada, en el
+    mismo orden (None si ese registro falló);
+    errores = [{"index", "orderNumber", "error"}].
 
+    Cada fecha distinta se parsea una sola vez por lote.
+    """
+    cache = _MapCache()
+    payloads: List[Optional[Dict[str, Any]]] = []
+    errors: List[Dict[str, Any]] = []
+
+    for index, dsco_order in enumerate(dsco_orders):
+        try:
+            payloads.append(_map_order(dsco_order, cache))
+        except Exception as e:
+            payloads.append(None)
+            errors.append({
+                "index": index,
+                "orderNumber": (
+                    dsco_order.get("orderNumber")
+                    if isinstance(dsco_order, dict) else None
+                ),
+                "error": str(e),
+            })
+
+    return payloads, errors
+
+
+def _map_order(dsco_order: Dict[str, Any], cache: "_MapCache") -> Dict[str, Any]:
     order_number = str(dsco_order.get("orderNumber", "")).strip()
     if not order_number:
         raise ValueError("DSCO order missing orderNumber")
@@ -63,8 +106,8 @@ def map_dsco_order_to_mintsoft(dsco_order: Dict[str, Any]) -> Dict[str, Any]:
         "ClientId": DEFAULT_CLIENT_ID,
         "CourierServiceId": courier_service_id,
 
-        "RequiredDespatchDate": _format_date(dsco_order.get("shipByDate")),
-        "RequiredDeliveryDate": _format_date(dsco_order.get("deliverByDate")),
+        "RequiredDespatchDate": cache.date(dsco_order.get("shipByDate")),
+        "RequiredDeliveryDate": cache.date(dsco_order.get("deliverByDate")),
 
         "OrderItems": order_items,
 
@@ -78,6 +121,34 @@ def map_dsco_order_to_mintsoft(dsco_order: Dict[str, Any]) -> Dict[str, Any]:
 # -------------------------------------------------
 # Helpers
 # -------------------------------------------------
+class _MapCache:
+    """
+    Fechas ya formateadas dentro de un lote:
+    las órdenes de una página suelen repetir
+    shipByDate / deliverByDate
+    """
+
+    __slots__ = ("dates",)
+
+    def __init__(self):
+        self.dates: Dict[str, Optional[str]] = {}
+
+    def date(self, value: Any) -> Optional[str]:
+        if not isinstance(value, str):
+            return _format_date(value)
+
+        try:
+            return self.dates[value]
+        except KeyError:
+            pass
+
+        if len(self.dates) >= _CACHE_MAX_ENTRIES:
+            self.dates.clear()
+
+        result = self.dates[value] = _format_date(value)
+        return result
+
+
 def _map_order_items(lines: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     items: List[Dict[str, Any]] = []
 
@@ -130,5 +201,5 @@ def _remove_empty(data: Dict[str, Any]) -> Dict[str, Any]:
     return {
         k: v
         for k, v in data.items()
-        if v not in (None, "", [], {})
+        if v not in _EMPTY_VALUES
     }
@@ -1,16 +1,61 @@
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
 
 DEFAULT_WAREHOUSE_ID = int(os.getenv("MINTSOFT_WAREHOUSE_ID", 1))
 DEFAULT_CLIENT_ID = int(os.getenv("MINTSOFT_CLIENT_ID", 1))
 
+# Valores que _remove_empty descarta (constante: no se
+# arma una lista / dict nuevos por cada campo)
+_EMPTY_VALUES = (None, "", [], {})
+
+# Tope de conversiones memorizadas por lote (archivos grandes)
+_CACHE_MAX_ENTRIES = 50_000
+
 
 def map_dsco_product_to_mintsoft(dsco_product: Dict[str, Any]) -> Dict[str, Any]:
     """
     DSCO → Mintsoft Product mapper
     Safe for create & update
     """
+    return _map_product(dsco_product, _MapCache())
+
+
+def map_many(
+    dsco_products: Iterable[Dict[str, Any]],
+) -> Tuple[List[Optional[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """
+    Mapea un lote (página o archivo) de productos DSCO.
+    No lanza excepciones: devuelve (payloads, errores).
+    payloads tiene un lugar por registro de entrada, en el
+    mismo orden (None si ese registro falló);
+    errores = [{"index", "sku", "error"}].
+
+    Precios / pesos / medidas que vienen como texto se
+    convierten una sola vez por lote.
+    """
+    cache = _MapCache()
+    payloads: List[Optional[Dict[str, Any]]] = []
+    errors: List[Dict[str, Any]] = []
+
+    for index, dsco_product in enumerate(dsco_products):
+        try:
+            payloads.append(_map_product(dsco_product, cache))
+        except Exception as e:
+            payloads.append(None)
+            errors.append({
+                "index": index,
+                "sku": (
+                    dsco_product.get("sku")
+                    if isinstance(dsco_product, dict) else None
+                ),
+                "error": str(e),
+            })
+
+    return payloads, errors
+
+
+def _map_product(dsco_product: Dict[str, Any], cache: "_MapCache") -> Dict[str, Any]:
 
     sku = _clean_str(dsco_product.get("sku"))
     if not sku:
@@ -24,15 +69,15 @@ def map_dsco_product_to_mintsoft(dsco_product: Dict[str, Any]) -> Dict[str, Any]
 
     barcode = _clean_str(dsco_product.get("barcode"))
 
-    price = _to_float(dsco_product.get("price"))
-    weight = _to_float(dsco_product.get("weight"))
+    price = cache.number(dsco_product.get("price"))
+    weight = cache.number(dsco_product.get("weight"))
 
     # Dimensiones
     dims = dsco_product.get("dimensions") or {}
 
-    length = _to_float(dims.get("length"))
-    width = _to_float(dims.get("width"))
-    height = _to_float(dims.get("height"))
+    length = cache.number(dims.get("length"))
+    width = cache.number(dims.get("width"))
+    height = cache.number(dims.get("height"))
 
     # Sólo enviar dimensiones completas
     has_dimensions = all(v is not None for v in (length, width, height))
@@ -67,6 +112,34 @@ def map_dsco_product_to_mintsoft(dsco_product: Dict[str, Any]) -> Dict[str, Any]
 # -------------------------------------------------
 # Helpers
 # -------------------------------------------------
+class _MapCache:
+    """
+    Conversiones a float ya hechas dentro de un lote:
+    precios y medidas en texto se repiten mucho
+    entre productos de un mismo catálogo
+    """
+
+    __slots__ = ("numbers",)
+
+    def __init__(self):
+        self.numbers: Dict[str, Optional[float]] = {}
+
+    def number(self, value: Any) -> Optional[float]:
+        if not isinstance(value, str):
+            return _to_float(value)
+
+        try:
+            return self.numbers[value]
+        except KeyError:
+            pass
+
+        if len(self.numbers) >= _CACHE_MAX_ENTRIES:
+            self.numbers.clear()
+
+        result = self.numbers[value] = _to_float(value)
+        return result
+
+
 def _clean_str(value: Any) -> Optional[str]:
     if not value:
         return None
@@ -87,5 +160,5 @@ def _remove_empty(data: Dict[str, Any]) -> Dict[str, Any]:
     return {
         k: v
         for k, v in data.items()
-        if v not in (None, "", [], {})
+        if v not in _EMPTY_VALUES
     }
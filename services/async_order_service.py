@@ -0,0 +1,453 @@
+import asyncio
+import os
+from datetime import datetime
+from time import perf_counter
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from loggers import metrics
+from loggers.order_logger import get_logger
+from loggers.run_journal import RunJournal, STATUS_INVALID
+from clients.base_client import reset_retry_budget
+from clients.async_base_client import close_async_sessions
+from clients.async_dsco_order_client import AsyncDscoOrderClient
+from clients.async_mintsoft_order_client import AsyncMintsoftOrderClient
+from services.order_service import (
+    OrderSyncService,
+    ORDER_BACKFILL_SHARDS,
+    ORDER_BACKFILL_PARALLEL,
+)
+from services.dead_letter_replay import areplay
+from services.prefetch import aprefetch, SYNC_PREFETCH_DEPTH
+from stores.checkpoint_store import CheckpointStore
+from stores.dead_letter_store import DeadLetterStore
+
+
+# Máximo de órdenes en vuelo en el event loop
+ORDER_ASYNC_WORKERS = int(os.getenv("ORDER_ASYNC_WORKERS", 100))
+
+
+class AsyncOrderSyncService(OrderSyncService):
+    """
+    Versión asyncio de OrderSyncService:
+    mismos métodos como corutinas, un solo event loop
+    y un semáforo en lugar del pool de threads.
+    Ventanas, checkpoints y logs son los mismos.
+    """
+
+    def __init__(self):
+        self.logger = get_logger("order_service", "orders.log")
+        self.dsco_client = AsyncDscoOrderClient()
+        self.mintsoft_client = AsyncMintsoftOrderClient()
+        self.checkpoints = CheckpointStore("order")
+        self.dead_letters = DeadLetterStore()
+        self.journal: Optional[RunJournal] = None
+
+    async def aclose(self) -> None:
+        """Cierra el pool de conexiones del event loop"""
+        await close_async_sessions()
+
+    # -------------------------------------------------
+    # Single order sync
+    # -------------------------------------------------
+    async def sync_one_order(
+        self,
+        order_number: str,
+        dsco_order: Optional[Dict] = None,
+    ) -> bool:
+        """Ver OrderSyncService.sync_one_order (mismos pasos)"""
+        self.logger.info("[ORDER] Sync start | order=%s", order_number)
+        started = perf_counter()
+        payload: Optional[Dict] = None
+
+        try:
+            # La primera orden del run carga el índice con las
+            # órdenes que ya existen en Mintsoft (un solo recorrido)
+            await self.mintsoft_client.ensure_index()
+
+            if self._skip_known(order_number, started):
+                return True
+
+            if dsco_order is None:
+                with metrics.stage("order", metrics.STAGE_FETCH):
+                    dsco_order = self._unwrap_order(
+                        await self.dsco_client.get_order(**self._order_lookup(order_number))
+                    )
+
+            payload = self._map_order(order_number, dsco_order, started)
+            if payload is None:
+                return False
+
+            with metrics.stage("order", metrics.STAGE_WRITE):
+                response = await self.mintsoft_client.create_order(payload)
+
+            return self._order_created(order_number, response, started)
+
+        except Exception as e:
+            return self._order_failed(order_number, dsco_order, payload, e, started)
+
+    # -------------------------------------------------
+    # Dead letters (items fallidos)
+    # -------------------------------------------------
+    async def replay_dead_letters(
+        self,
+        limit: Optional[int] = None,
+        workers: Optional[int] = None,
+        rate: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """Ver OrderSyncService.replay_dead_letters"""
+
+        self.logger.info(
+            "[DLQ] Async order replay started | "
+            f"pending={self.dead_letters.count('order')}"
+        )
+
+        reset_retry_budget()
+        self.journal = RunJournal("order", kind="replay", mode="async")
+
+        try:
+            summary = await areplay(
+                self.dead_letters,
+                "order",
+                lambda item: self.sync_one_order(item["key"], item["source"]),
+                limit=limit,
+                workers=workers,
+                rate=rate,
+                max_attempts=max_attempts,
+            )
+        finally:
+            self._close_journal()
+
+        self.logger.info(
+            "[DLQ] Async order replay finished | "
+            f"Total={summary['total']} | Replayed={summary['replayed']} | "
+            f"Failed={summary['failed']} | Remaining={summary['remaining']}"
+        )
+
+        return summary
+
+    # -------------------------------------------------
+    # Batch sync con fechas
+    # -------------------------------------------------
+    async def sync_all_orders(
+        self,
+        status: str = "released",
+        updated_from: Optional[datetime] = None,
+        updated_to: Optional[datetime] = None,
+        workers: Optional[int] = None,
+        prefetch_depth: Optional[int] = None,
+    ):
+        """
+        Ver OrderSyncService.sync_all_orders.
+        workers: órdenes en vuelo a la vez
+        (default ORDER_ASYNC_WORKERS)
+        """
+
+        workers = max(1, workers or ORDER_ASYNC_WORKERS)
+        if prefetch_depth is None:
+            prefetch_depth = SYNC_PREFETCH_DEPTH
+
+        checkpoints = self._window_checkpoints(
+            updated_from,
+            updated_to,
+        )
+        updated_from_iso, updated_to_iso, scroll_id = self._resolve_window(
+            updated_from,
+            updated_to,
+        )
+
+        checkpoints.start_window({
+            "from": updated_from_iso,
+            "to": updated_to_iso,
+        })
+
+        self.logger.info(
+            "[BATCH] Async order sync started | "
+            f"status={status} | "
+            f"from={updated_from_iso} | "
+            f"to={updated_to_iso} | "
+            f"workers={workers} | "
+            f"prefetch={prefetch_depth}"
+        )
+
+        total = success = failed = 0
+        slots = asyncio.Semaphore(workers)
+        baseline = metrics.registry.snapshot()
+
+        reset_retry_budget()
+        self.journal = RunJournal(
+            "order",
+            kind="sync",
+            mode="async",
+            window={"from": updated_from_iso, "to": updated_to_iso},
+            workers=workers,
+        )
+        completed = False
+
+        try:
+            pages = aprefetch(
+                metrics.atimed_iter(
+                    self._iter_order_responses(
+                        updated_from_iso,
+                        updated_to_iso,
+                        scroll_id,
+                    ),
+                    "order",
+                    metrics.STAGE_FETCH,
+                ),
+                depth=prefetch_depth,
+            )
+
+            page = 0
+            async for response in pages:
+                orders: List[Dict] = response.get("orders") or []
+
+                self.logger.info(
+                    f"[BATCH] Page {page} fetched | orders={len(orders)}"
+                )
+
+                pending: Dict[str, Dict] = {}
+
+                for order in orders:
+                    order_number = order.get("orderNumber")
+
+                    if not order_number:
+                        self.logger.warning(
+                            "[BATCH] Skipping order without orderNumber"
+                        )
+                        self._record(
+                            None,
+                            None,
+                            perf_counter(),
+                            status=STATUS_INVALID,
+                        )
+                        failed += 1
+                        continue
+
+                    pending.setdefault(order_number, order)
+
+                # Se espera a que toda la página esté resuelta
+                results = await self._sync_page(pending, slots)
+                synced = sum(1 for ok in results if ok)
+
+                total += len(results)
+                success += synced
+                failed += len(results) - synced
+
+                checkpoints.save_cursor(response.get("scrollId"))
+                page += 1
+
+            checkpoints.complete_window({"createdAt": updated_to_iso})
+            completed = True
+
+        finally:
+            self._close_journal(completed=completed)
+
+        self.logger.info(
+            "[BATCH] Async order sync finished | "
+            f"Total={total} | Success={success} | Failed={failed}"
+        )
+        metrics.log_summary(self.logger, "Async order sync", since=baseline)
+
+    # -------------------------------------------------
+    # Backfill en paralelo por sub-ventanas
+    # -------------------------------------------------
+    async def backfill_orders(
+        self,
+        created_from: datetime,
+        created_to: datetime,
+        shards: int = ORDER_BACKFILL_SHARDS,
+        parallel: int = ORDER_BACKFILL_PARALLEL,
+        workers: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Ver OrderSyncService.backfill_orders
+        (mismo registro de sub-ventanas completas)
+        """
+
+        if created_to <= created_from:
+            raise ValueError("created_to must be after created_from")
+
+        shards = max(1, shards)
+        parallel = max(1, parallel)
+        workers = max(1, workers or ORDER_ASYNC_WORKERS)
+
+        job, store, windows = self._backfill_plan(created_from, created_to, shards)
+
+        self.logger.info(
+            "[BACKFILL] Async order backfill started | "
+            f"from={self._iso(created_from)} | "
+            f"to={self._iso(created_to)} | "
+            f"shards={shards} | pending={len(windows)} | "
+            f"parallel={parallel} | workers={workers}"
+        )
+
+        seen: Set[str] = set()
+        slots = asyncio.Semaphore(workers)
+        baseline = metrics.registry.snapshot()
+
+        reset_retry_budget()
+        self.journal = RunJournal(
+            "order",
+            kind="backfill",
+            mode="async",
+            window={"from": self._iso(created_from), "to": self._iso(created_to)},
+            shards=shards,
+            workers=workers,
+        )
+        window_slots = asyncio.Semaphore(parallel)
+
+        async def _run(window: Tuple[datetime, datetime]) -> Optional[Dict[str, int]]:
+            key = self._window_key(window)
+
+            async with window_slots:
+                try:
+                    counts = await self._backfill_window(window, seen, slots)
+                except Exception:
+                    self.logger.exception(
+                        f"[BACKFILL] Window failed | window={key}"
+                    )
+                    return None
+
+            store.mark_window_completed(job, key)
+            self.logger.info(
+                f"[BACKFILL] Window done | window={key} | "
+                f"orders={counts['total']}"
+            )
+            return counts
+
+        try:
+            results = await asyncio.gather(*(_run(w) for w in windows))
+        except BaseException:
+            # Cancelado: el journal queda cerrado igual
+            self._close_journal(completed=False)
+            raise
+
+        totals = {"total": 0, "success": 0, "failed": 0, "duplicates": 0}
+        failed_windows = 0
+
+        for counts in results:
+            if counts is None:
+                failed_windows += 1
+                continue
+
+            for name, value in counts.items():
+                totals[name] += value
+
+        self._close_journal(failed_windows=failed_windows)
+
+        self.logger.info(
+            "[BACKFILL] Async order backfill finished | "
+            f"Total={totals['total']} | Success={totals['success']} | "
+            f"Failed={totals['failed']} | "
+            f"Duplicates={totals['duplicates']} | "
+            f"FailedWindows={failed_windows}"
+        )
+        metrics.log_summary(self.logger, "Async order backfill", since=baseline)
+
+        return {**totals, "failed_windows": failed_windows}
+
+    async def _backfill_window(
+        self,
+        window: Tuple[datetime, datetime],
+        seen: Set[str],
+        slots: asyncio.Semaphore,
+    ) -> Dict[str, int]:
+        counts = {"total": 0, "success": 0, "failed": 0, "duplicates": 0}
+
+        pages = metrics.atimed_iter(
+            self.dsco_client.iter_order_pages(
+                orders_created_since=self._iso(window[0]),
+                until=self._iso(window[1]),
+            ),
+            "order",
+            metrics.STAGE_FETCH,
+        )
+
+        async for orders in pages:
+            pending: Dict[str, Dict] = {}
+
+            for order in orders:
+                order_number = order.get("orderNumber")
+
+                if not order_number:
+                    self._record(None, None, perf_counter(), status=STATUS_INVALID)
+                    counts["failed"] += 1
+                    continue
+
+                # Un solo loop: no hace falta lock para el set
+                if order_number in seen:
+                    counts["duplicates"] += 1
+                    continue
+                seen.add(order_number)
+
+                pending[order_number] = order
+
+            results = await self._sync_page(pending, slots)
+            synced = sum(1 for ok in results if ok)
+
+            counts["total"] += len(results)
+            counts["success"] += synced
+            counts["failed"] += len(results) - synced
+
+        return counts
+
+    # -------------------------------------------------
+    # Scroll DSCO (con reanudación)
+    # -------------------------------------------------
+    async def _iter_order_responses(
+        self,
+        created_since: str,
+        until: str,
+        scroll_id: Optional[str],
+    ) -> AsyncIterator[Dict]:
+        responses = self.dsco_client.iter_order_responses(
+            orders_created_since=created_since,
+            until=until,
+            limit=50,
+            scroll_id=scroll_id,
+        )
+
+        if scroll_id:
+            try:
+                first = await responses.__anext__()
+            except StopAsyncIteration:
+                return
+            except Exception:
+                self.logger.warning(
+                    "[BATCH] Stored scrollId rejected, restarting window"
+                )
+                responses = self.dsco_client.iter_order_responses(
+                    orders_created_since=created_since,
+                    until=until,
+                    limit=50,
+                )
+            else:
+                yield first
+
+        async for response in responses:
+            yield response
+
+    # -------------------------------------------------
+    # Ejecución por página
+    # -------------------------------------------------
+    async def _sync_page(
+        self,
+        orders: Dict[str, Dict],
+        slots: asyncio.Semaphore,
+    ) -> List[bool]:
+        """
+        Sincroniza las órdenes de una página a la vez
+        (limitadas por el semáforo compartido).
+        Los resultados vuelven en el orden de la página.
+        """
+
+        async def _run(order_number: str, order: Dict) -> bool:
+            async with slots:
+                return await self.sync_one_order(order_number, order)
+
+        return list(
+            await asyncio.gather(
+                *(_run(number, order) for number, order in orders.items())
+            )
+        )
@@ -0,0 +1,303 @@
+import asyncio
+import os
+from time import perf_counter
+from datetime import datetime
+from typing import Any, AsyncIterable, Dict, Iterable, List, Optional, Union
+
+from clients.base_client import reset_retry_budget
+from clients.async_base_client import close_async_sessions
+from clients.async_dsco_product_client import AsyncDscoProductClient
+from clients.async_mintsoft_product_client import AsyncMintsoftProductClient
+from services.catalog_batch_writer import (
+    AsyncCatalogBatchWriter,
+    DSCO_BATCH_MAX_ITEMS,
+    DSCO_BATCH_MAX_WAIT,
+)
+from services.dead_letter_replay import areplay
+from services.prefetch import aprefetch, SYNC_PREFETCH_DEPTH
+from services.product_service import (
+    ProductSyncService,
+    ACTION_UPDATE,
+    ACTION_SKIP,
+)
+from stores.checkpoint_store import CheckpointStore
+from stores.dead_letter_store import DeadLetterStore
+from loggers import metrics
+from loggers.product_logger import get_product_logger
+from loggers.run_journal import RunJournal
+
+
+# Máximo de productos en vuelo en el event loop
+PRODUCT_ASYNC_WORKERS = int(os.getenv("PRODUCT_ASYNC_WORKERS", 100))
+
+
+class AsyncProductSyncService(ProductSyncService):
+    """
+    Versión asyncio de ProductSyncService:
+    mismos métodos como corutinas, un solo event loop
+    y un semáforo en lugar del pool de threads.
+    Ventanas, checkpoints y logs son los mismos.
+    """
+
+    def __init__(self):
+        self.logger = get_product_logger()
+        self.dsco_client = AsyncDscoProductClient()
+        self.mintsoft_client = AsyncMintsoftProductClient()
+        self.checkpoints = CheckpointStore("product")
+        self.dead_letters = DeadLetterStore()
+        self.journal: Optional[RunJournal] = None
+
+    async def aclose(self) -> None:
+        """Cierra el pool de conexiones del event loop"""
+        await close_async_sessions()
+
+    # -------------------------------------------------
+    # Sync de un solo producto
+    # -------------------------------------------------
+    async def sync_one_product(self, dsco_product: Dict[str, Any]) -> bool:
+        return await self._sync_product(dsco_product) is not None
+
+    async def _sync_product(self, dsco_product: Dict[str, Any]) -> Optional[str]:
+        """Ver ProductSyncService._sync_product (mismos pasos)"""
+        sku = self._product_sku(dsco_product)
+        if not sku:
+            return None
+
+        started = perf_counter()
+        action: Optional[str] = None
+        payload: Optional[Dict[str, Any]] = None
+        self.logger.info("[PRODUCT] Sync started | SKU=%s", sku)
+
+        try:
+            payload = self._map_product(dsco_product)
+
+            with metrics.stage("product", metrics.STAGE_LOOKUP):
+                existing = await self.mintsoft_client.lookup_sku(sku)
+
+            if self._skip_unchanged(sku, existing, payload, started):
+                return ACTION_SKIP
+
+            action, product_id = self._plan_write(sku, existing)
+
+            with metrics.stage("product", metrics.STAGE_WRITE):
+                if action == ACTION_UPDATE:
+                    response = await self.mintsoft_client.update_product(
+                        product_id,
+                        payload
+                    )
+                else:
+                    response = await self.mintsoft_client.create_product(payload)
+
+            return self._product_synced(sku, action, response, started)
+
+        except Exception as e:
+            return self._product_failed(sku, dsco_product, payload, action, e, started)
+
+    # -------------------------------------------------
+    # Dead letters (items fallidos)
+    # -------------------------------------------------
+    async def replay_dead_letters(
+        self,
+        limit: Optional[int] = None,
+        workers: Optional[int] = None,
+        rate: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """Ver ProductSyncService.replay_dead_letters"""
+
+        self.logger.info(
+            "[DLQ] Async product replay started | "
+            f"pending={self.dead_letters.count('product')}"
+        )
+
+        reset_retry_budget()
+        self.journal = RunJournal("product", kind="replay", mode="async")
+
+        try:
+            summary = await areplay(
+                self.dead_letters,
+                "product",
+                lambda item: self.sync_one_product(item["source"]),
+                limit=limit,
+                workers=workers,
+                rate=rate,
+                max_attempts=max_attempts,
+            )
+        finally:
+            self._close_journal()
+
+        self.logger.info(
+            "[DLQ] Async product replay finished | "
+            f"Total={summary['total']} | Replayed={summary['replayed']} | "
+            f"Failed={summary['failed']} | Remaining={summary['remaining']}"
+        )
+
+        return summary
+
+    # -------------------------------------------------
+    # Sync masivo con fechas
+    # -------------------------------------------------
+    async def sync_all_products(
+        self,
+        page_size: int = 100,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        updated_from: Optional[datetime] = None,
+        updated_to: Optional[datetime] = None,
+        workers: Optional[int] = None,
+        prefetch_depth: Optional[int] = None,
+    ):
+        """
+        Ver ProductSyncService.sync_all_products.
+        workers: productos en vuelo a la vez
+        (default PRODUCT_ASYNC_WORKERS)
+        """
+
+        workers = max(1, workers or PRODUCT_ASYNC_WORKERS)
+        if prefetch_depth is None:
+            prefetch_depth = SYNC_PREFETCH_DEPTH
+
+        checkpoints = self._window_checkpoints(
+            created_from,
+            created_to,
+            updated_from,
+            updated_to,
+        )
+        window, start_page = self._resolve_window(
+            created_from,
+            created_to,
+            updated_from,
+            updated_to,
+        )
+
+        checkpoints.start_window(window)
+
+        self.logger.info(
+            "[BATCH] Async product sync started | "
+            f"createdFrom={window['createdFrom']} | "
+            f"createdTo={window['createdTo']} | "
+            f"updatedFrom={window['updatedFrom']} | "
+            f"updatedTo={window['updatedTo']} | "
+            f"workers={workers} | "
+            f"prefetch={prefetch_depth}"
+        )
+
+        total = success = failed = skipped = 0
+        baseline = metrics.registry.snapshot()
+        slots = asyncio.Semaphore(workers)
+
+        reset_retry_budget()
+        self.journal = RunJournal(
+            "product",
+            kind="sync",
+            mode="async",
+            window=window,
+            workers=workers,
+        )
+        completed = False
+
+        try:
+            pages = aprefetch(
+                metrics.atimed_iter(
+                    self.dsco_client.iter_product_pages(
+                        size=page_size,
+                        start_page=start_page,
+                        created_at_min=window["createdFrom"],
+                        created_at_max=window["createdTo"],
+                        updated_at_min=window["updatedFrom"],
+                        updated_at_max=window["updatedTo"],
+                    ),
+                    "product",
+                    metrics.STAGE_FETCH,
+                ),
+                depth=prefetch_depth,
+            )
+
+            page = start_page
+            async for products in pages:
+                self.logger.info(
+                    f"[BATCH] Page {page} fetched | products={len(products)}"
+                )
+
+                results = await self._sync_page(products, slots)
+
+                synced = sum(1 for action in results if action is not None)
+
+                total += len(results)
+                success += synced
+                failed += len(results) - synced
+                skipped += results.count(ACTION_SKIP)
+
+                checkpoints.save_cursor(page + 1)
+                page += 1
+
+            checkpoints.complete_window({
+                "createdAt": window["createdTo"],
+                "updatedAt": window["updatedTo"],
+            })
+            completed = True
+
+        finally:
+            self._close_journal(completed=completed)
+
+        self.logger.info(
+            "[BATCH] Async product sync finished | "
+            f"Total={total} | Success={success} | "
+            f"Skipped={skipped} | Failed={failed}"
+        )
+        metrics.log_summary(self.logger, "Async product sync", since=baseline)
+
+    # -------------------------------------------------
+    # Ejecución por página
+    # -------------------------------------------------
+    async def _sync_page(
+        self,
+        products: List[Dict[str, Any]],
+        slots: asyncio.Semaphore,
+    ) -> List[Optional[str]]:
+        """
+        Sincroniza una página a la vez (limitada por el
+        semáforo compartido). Devuelve la acción de cada
+        producto (None = falló).
+        """
+
+        async def _run(product: Dict[str, Any]) -> Optional[str]:
+            async with slots:
+                return await self._sync_product(product)
+
+        return list(await asyncio.gather(*(_run(p) for p in products)))
+
+    # -------------------------------------------------
+    # Mintsoft → DSCO (inventario / estado) en batches
+    # -------------------------------------------------
+    async def push_catalog_updates(
+        self,
+        items: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+        max_items: int = DSCO_BATCH_MAX_ITEMS,
+        max_wait: float = DSCO_BATCH_MAX_WAIT,
+    ) -> Dict[str, int]:
+        """
+        Ver ProductSyncService.push_catalog_updates
+        (items puede ser un iterable sync o async)
+        """
+
+        reset_retry_budget()
+
+        self.logger.info(
+            "[BATCH] DSCO catalog push started | "
+            f"maxItems={max_items} | maxWait={max_wait}s"
+        )
+
+        async with AsyncCatalogBatchWriter(
+            self.dsco_client,
+            max_items=max_items,
+            max_wait=max_wait,
+        ) as writer:
+            if hasattr(items, "__aiter__"):
+                async for item in items:
+                    await writer.add(item)
+            else:
+                for item in items:
+                    await writer.add(item)
+
+        return self._catalog_push_finished(writer)
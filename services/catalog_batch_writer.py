@@ -0,0 +1,271 @@
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from clients.dsco_product_client import DscoProductClient
+
+
+# Límites del acumulador (DSCO /catalog/batch/small)
+DSCO_BATCH_MAX_ITEMS = int(os.getenv("DSCO_BATCH_MAX_ITEMS", 500))
+DSCO_BATCH_MAX_WAIT = float(os.getenv("DSCO_BATCH_MAX_WAIT", 5))
+
+# Estado por item. DSCO acepta el batch y procesa los items
+# después: "submitted" = aceptado con requestId, todavía sin
+# resultado propio (no es un éxito confirmado)
+STATUS_SUBMITTED = "submitted"
+STATUS_FAILED = "failed"
+
+
+class CatalogBatchWriter:
+    """
+    Acumula updates de catálogo (inventario, estado, ...)
+    y los envía a DSCO con update_catalog_small_batch:
+    - flush por tamaño (max_items)
+    - flush por tiempo (max_wait segundos desde el primer item)
+    - resultado por item en self.results
+      (submitted con el requestId del batch, o failed)
+    """
+
+    def __init__(
+        self,
+        client: DscoProductClient,
+        max_items: int = DSCO_BATCH_MAX_ITEMS,
+        max_wait: float = DSCO_BATCH_MAX_WAIT,
+        auto_flush: bool = True,
+    ):
+        if max_items <= 0:
+            raise ValueError("max_items must be > 0")
+
+        self.client = client
+        self.max_items = max_items
+        self.max_wait = max_wait
+
+        self.results: List[Dict[str, Any]] = []
+
+        self._pending: List[Dict[str, Any]] = []
+        self._first_added: Optional[float] = None
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+
+        # Flush por tiempo aunque no lleguen más items
+        self._timer: Optional[threading.Thread] = None
+        if auto_flush and max_wait > 0:
+            self._timer = threading.Thread(
+                target=self._flush_on_timer,
+                name="dsco-batch-flush",
+                daemon=True,
+            )
+            self._timer.start()
+
+    # -------------------------------------------------
+    # Public
+    # -------------------------------------------------
+    def add(self, item: Dict[str, Any]) -> None:
+        if self._closed.is_set():
+            raise RuntimeError("CatalogBatchWriter is closed")
+
+        with self._lock:
+            if not self._pending:
+                self._first_added = time.monotonic()
+            self._pending.append(item)
+
+            ready = len(self._pending) >= self.max_items or self._expired()
+
+        if ready:
+            self.flush()
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """Envía lo acumulado. Devuelve el resultado por item."""
+        with self._lock:
+            batch = self._pending
+            self._pending = []
+            self._first_added = None
+
+        if not batch:
+            return []
+
+        results = self._send(batch)
+
+        with self._lock:
+            self.results.extend(results)
+
+        return results
+
+    def close(self) -> List[Dict[str, Any]]:
+        self._closed.set()
+        if self._timer:
+            self._timer.join(timeout=self.max_wait + 1)
+        return self.flush()
+
+    def summary(self) -> Dict[str, int]:
+        with self._lock:
+            return summarize(self.results)
+
+    def __enter__(self) -> "CatalogBatchWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -------------------------------------------------
+    # Internals
+    # -------------------------------------------------
+    def _expired(self) -> bool:
+        return (
+            self._first_added is not None
+            and time.monotonic() - self._first_added >= self.max_wait
+        )
+
+    def _flush_on_timer(self) -> None:
+        interval = min(self.max_wait, 1.0)
+
+        while not self._closed.wait(interval):
+            with self._lock:
+                expired = self._expired()
+
+            if expired:
+                try:
+                    self.flush()
+                except Exception:
+                    # _send ya registra el error por item
+                    pass
+
+    def _send(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        try:
+            response = self.client.update_catalog_small_batch(batch) or {}
+        except Exception as e:
+            return [_item_result(item, error=str(e)) for item in batch]
+
+        return batch_results(batch, response)
+
+
+class AsyncCatalogBatchWriter:
+    """
+    Igual que CatalogBatchWriter para AsyncDscoProductClient.
+    Sin thread de timer: el flush por tiempo se evalúa en
+    cada add() y close() envía el resto.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_items: int = DSCO_BATCH_MAX_ITEMS,
+        max_wait: float = DSCO_BATCH_MAX_WAIT,
+    ):
+        if max_items <= 0:
+            raise ValueError("max_items must be > 0")
+
+        self.client = client
+        self.max_items = max_items
+        self.max_wait = max_wait
+
+        self.results: List[Dict[str, Any]] = []
+
+        self._pending: List[Dict[str, Any]] = []
+        self._first_added: Optional[float] = None
+
+    async def add(self, item: Dict[str, Any]) -> None:
+        if not self._pending:
+            self._first_added = time.monotonic()
+        self._pending.append(item)
+
+        expired = time.monotonic() - self._first_added >= self.max_wait
+        if len(self._pending) >= self.max_items or expired:
+            await self.flush()
+
+    async def flush(self) -> List[Dict[str, Any]]:
+        batch = self._pending
+        self._pending = []
+        self._first_added = None
+
+        if not batch:
+            return []
+
+        try:
+            response = await self.client.update_catalog_small_batch(batch) or {}
+        except Exception as e:
+            results = [_item_result(item, error=str(e)) for item in batch]
+        else:
+            results = batch_results(batch, response)
+
+        self.results.extend(results)
+        return results
+
+    async def close(self) -> List[Dict[str, Any]]:
+        return await self.flush()
+
+    def summary(self) -> Dict[str, int]:
+        return summarize(self.results)
+
+    async def __aenter__(self) -> "AsyncCatalogBatchWriter":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+
+# -------------------------------------------------
+# Helpers
+# -------------------------------------------------
+def batch_results(
+    batch: List[Dict[str, Any]],
+    response: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """
+    Resultado por item de una respuesta de
+    /catalog/batch/small (status, requestId, messages).
+    Los items sin error quedan submitted: DSCO puede
+    rechazarlos más tarde al procesar el batch.
+    """
+    request_id = response.get("requestId")
+    batch_ok = str(response.get("status", "success")).lower() != "failure"
+
+    # Mensajes de DSCO asociados a un SKU puntual
+    errors_by_key: Dict[str, str] = {}
+    for message in response.get("messages") or []:
+        if not isinstance(message, dict):
+            continue
+        key = message.get("sku") or message.get("dscoItemId")
+        if key and str(message.get("type", "error")).lower() == "error":
+            errors_by_key[str(key)] = (
+                message.get("description")
+                or message.get("message")
+                or "error"
+            )
+
+    results = []
+    for item in batch:
+        error = errors_by_key.get(_item_key(item))
+        if error is None and not batch_ok:
+            error = "batch failure"
+
+        results.append(_item_result(item, request_id, error))
+
+    return results
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, int]:
+    failed = sum(1 for r in results if r["status"] == STATUS_FAILED)
+    return {
+        "total": len(results),
+        "submitted": len(results) - failed,
+        "failed": failed,
+    }
+
+
+def _item_key(item: Dict[str, Any]) -> str:
+    return str(item.get("sku") or item.get("dscoItemId") or "")
+
+
+def _item_result(
+    item: Dict[str, Any],
+    request_id: Optional[str] = None,
+    error: Optional[str] = None,
+) -> Dict[str, Any]:
+    return {
+        "key": _item_key(item),
+        "status": STATUS_SUBMITTED if error is None else STATUS_FAILED,
+        "request_id": request_id,
+        "error": error,
+    }
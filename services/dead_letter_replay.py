@@ -0,0 +1,129 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from clients.rate_limiter import TokenBucket
+from stores.dead_letter_store import DeadLetterStore
+
+
+# Items reintentados en paralelo
+DLQ_REPLAY_WORKERS = int(os.getenv("DLQ_REPLAY_WORKERS", 8))
+
+# Items por segundo al re-enviar (0 = sin límite propio;
+# el rate limit por host de los clientes aplica igual)
+DLQ_REPLAY_RATE = float(os.getenv("DLQ_REPLAY_RATE", 5))
+
+# Intentos después de los cuales un item deja de
+# reintentarse (0 = sin tope)
+DLQ_MAX_ATTEMPTS = int(os.getenv("DLQ_MAX_ATTEMPTS", 0))
+
+
+def replay(
+    store: DeadLetterStore,
+    entity: str,
+    handler: Callable[[Dict[str, Any]], bool],
+    limit: Optional[int] = None,
+    workers: Optional[int] = None,
+    rate: Optional[float] = None,
+    max_attempts: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Re-envía los items pendientes de `entity` con `handler`
+    (True = sincronizado), en paralelo y a `rate` items/seg.
+    Los que salen bien se borran del store; los que vuelven
+    a fallar los re-registra el propio servicio.
+    """
+    items, limiter, workers = _plan(store, entity, limit, workers, rate, max_attempts)
+
+    def _run(item: Dict[str, Any]) -> bool:
+        if limiter is not None:
+            limiter.acquire()
+
+        try:
+            ok = handler(item)
+        except Exception:
+            ok = False
+
+        if ok:
+            store.remove(entity, item["key"])
+        return ok
+
+    if workers == 1:
+        results = [_run(item) for item in items]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix=f"{entity}-replay",
+        ) as executor:
+            results = list(executor.map(_run, items))
+
+    return _summary(store, entity, results)
+
+
+async def areplay(
+    store: DeadLetterStore,
+    entity: str,
+    handler: Callable[[Dict[str, Any]], Awaitable[bool]],
+    limit: Optional[int] = None,
+    workers: Optional[int] = None,
+    rate: Optional[float] = None,
+    max_attempts: Optional[int] = None,
+) -> Dict[str, int]:
+    """Versión asyncio de replay (handler es una corutina)"""
+    items, limiter, workers = _plan(store, entity, limit, workers, rate, max_attempts)
+    slots = asyncio.Semaphore(workers)
+
+    async def _run(item: Dict[str, Any]) -> bool:
+        async with slots:
+            if limiter is not None:
+                wait = limiter.reserve()
+                if wait:
+                    await asyncio.sleep(wait)
+
+            try:
+                ok = await handler(item)
+            except Exception:
+                ok = False
+
+        if ok:
+            store.remove(entity, item["key"])
+        return ok
+
+    results = list(await asyncio.gather(*(_run(item) for item in items)))
+
+    return _summary(store, entity, results)
+
+
+# -------------------------------------------------
+# Helpers
+# -------------------------------------------------
+def _plan(
+    store: DeadLetterStore,
+    entity: str,
+    limit: Optional[int],
+    workers: Optional[int],
+    rate: Optional[float],
+    max_attempts: Optional[int],
+):
+    if max_attempts is None:
+        max_attempts = DLQ_MAX_ATTEMPTS
+    if rate is None:
+        rate = DLQ_REPLAY_RATE
+
+    items = store.pending(entity, limit=limit, max_attempts=max_attempts)
+    limiter = TokenBucket(rate, burst=max(1, int(rate))) if rate > 0 else None
+    workers = max(1, workers or DLQ_REPLAY_WORKERS)
+
+    return items, limiter, workers
+
+
+def _summary(store: DeadLetterStore, entity: str, results: List[bool]) -> Dict[str, int]:
+    replayed = sum(1 for ok in results if ok)
+
+    return {
+        "total": len(results),
+        "replayed": replayed,
+        "failed": len(results) - replayed,
+        "remaining": store.count(entity),
+    }
@@ -1,10 +1,33 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, List
+from time import perf_counter
+from typing import Iterator, Optional, Dict, List, Set, Tuple
 
+from loggers import metrics
 from loggers.order_logger import get_logger
+from loggers.run_journal import RunJournal, STATUS_INVALID, STATUS_NOT_FOUND
+from clients.base_client import reset_retry_budget
 from clients.dsco_order_client import DscoOrderClient
 from clients.mintsoft_order_client import MintsoftOrderClient
 from mappers.order_mapper import map_dsco_order_to_mintsoft
+from services.prefetch import prefetch, SYNC_PREFETCH_DEPTH
+from services.dead_letter_replay import replay
+from stores.checkpoint_store import CheckpointStore, parse_watermark
+from stores.dead_letter_store import DeadLetterStore
+
+
+# Máximo de create_order en paralelo (1 = serial)
+ORDER_SYNC_WORKERS = int(os.getenv("ORDER_SYNC_WORKERS", 1))
+
+# Backfill: sub-ventanas y cuántas se recorren a la vez
+ORDER_BACKFILL_SHARDS = int(os.getenv("ORDER_BACKFILL_SHARDS", 8))
+ORDER_BACKFILL_PARALLEL = int(os.getenv("ORDER_BACKFILL_PARALLEL", 4))
+
+# Acciones posibles por orden
+ACTION_CREATE = "create"
+ACTION_SKIP = "skip"
 
 
 class OrderSyncService:
@@ -17,6 +40,11 @@ class OrderSyncService:
         self.logger = get_logger("order_service", "orders.log")
         self.dsco_client = DscoOrderClient()
         self.mintsoft_client = MintsoftOrderClient()
+        self.checkpoints = CheckpointStore("order")
+        self.dead_letters = DeadLetterStore()
+
+        # Journal JSONL del run en curso (sync_all / backfill)
+        self.journal: Optional[RunJournal] = None
 
     # -------------------------------------------------
     # Utils
@@ -26,36 +54,221 @@ class OrderSyncService:
         """Convierte datetime a ISO 8601 UTC"""
         return dt.astimezone(timezone.utc).isoformat()
 
+    def _close_journal(self, **extra) -> None:
+        """Cierra el journal del run (escribe su resumen)"""
+        journal, self.journal = self.journal, None
+        if journal is None:
+            return
+
+        summary = journal.close(**extra)
+        self.logger.info(
+            f"[BATCH] Run journal | run={summary['run_id']} | "
+            f"items={summary['total']} | failed={summary['failed']} | "
+            f"{summary['items_per_sec']} items/s"
+        )
+
+    def _dead_letter(
+        self,
+        order_number: str,
+        source: Optional[Dict],
+        payload: Optional[Dict],
+        error: BaseException,
+    ) -> None:
+        """Guarda el item fallido para replay_dead_letters"""
+        try:
+            self.dead_letters.add("order", order_number, source, payload, error)
+        except Exception:
+            self.logger.exception(
+                "[DLQ] Could not store failed order | %s", order_number
+            )
+
+    def _record(
+        self,
+        order_number: Optional[str],
+        action: Optional[str],
+        started: float,
+        **kwargs,
+    ) -> None:
+        """Resultado de una orden en el journal (si hay un run abierto)"""
+        if self.journal is not None:
+            self.journal.record(order_number, action, started, **kwargs)
+
     # -------------------------------------------------
     # Single order sync
     # -------------------------------------------------
-    def sync_one_order(self, order_number: str) -> bool:
-        self.logger.info(f"[ORDER] Sync start | order={order_number}")
+    def sync_one_order(
+        self,
+        order_number: str,
+        dsco_order: Optional[Dict] = None,
+    ) -> bool:
+        """
+        Sincroniza una orden. Si ya tenemos la orden
+        DSCO (ej: viene de una página) no se vuelve a pedir.
+        """
+        self.logger.info("[ORDER] Sync start | order=%s", order_number)
+        started = perf_counter()
+        payload: Optional[Dict] = None
 
         try:
-            dsco_order = self.dsco_client.get_order(order_number)
+            # La primera orden del run carga el índice con las
+            # órdenes que ya existen en Mintsoft (un solo recorrido)
+            self.mintsoft_client.ensure_index()
 
-            if not dsco_order:
-                self.logger.warning(
-                    f"[ORDER] Not found in DSCO | order={order_number}"
-                )
+            if self._skip_known(order_number, started):
+                return True
+
+            if dsco_order is None:
+                with metrics.stage("order", metrics.STAGE_FETCH):
+                    dsco_order = self._unwrap_order(
+                        self.dsco_client.get_order(**self._order_lookup(order_number))
+                    )
+
+            payload = self._map_order(order_number, dsco_order, started)
+            if payload is None:
                 return False
 
-            payload = map_dsco_order_to_mintsoft(dsco_order)
-            response = self.mintsoft_client.create_order(payload)
+            with metrics.stage("order", metrics.STAGE_WRITE):
+                response = self.mintsoft_client.create_order(payload)
 
+            return self._order_created(order_number, response, started)
+
+        except Exception as e:
+            return self._order_failed(order_number, dsco_order, payload, e, started)
+
+    # -------------------------------------------------
+    # Pasos de sync_one_order (compartidos con la versión async)
+    # -------------------------------------------------
+    def _skip_known(self, order_number: str, started: float) -> bool:
+        """True si la orden ya está en Mintsoft (no se crea)"""
+        with metrics.stage("order", metrics.STAGE_LOOKUP):
+            known = self.mintsoft_client.is_known_order(order_number)
+
+        if known:
             self.logger.info(
-                f"[ORDER] Synced successfully | "
-                f"order={order_number} | "
-                f"mintsoft_id={response.get('OrderId')}"
+                "[ORDER] Already in Mintsoft, skipping | order=%s", order_number
             )
-            return True
+            self._record(order_number, ACTION_SKIP, started)
 
-        except Exception:
-            self.logger.exception(
-                f"[ORDER] Sync failed | order={order_number}"
+        return known
+
+    @staticmethod
+    def _order_lookup(order_number: str) -> Dict[str, str]:
+        """Parámetros de get_order para buscar por número de orden"""
+        return {"order_key": "orderNumber", "value": order_number}
+
+    @staticmethod
+    def _unwrap_order(response) -> Optional[Dict]:
+        """GET /order/ puede devolver la orden, una lista o {"orders": [...]}"""
+        if isinstance(response, dict) and "orders" in response:
+            response = response["orders"]
+
+        if isinstance(response, list):
+            response = response[0] if response else None
+
+        return response or None
+
+    def _map_order(
+        self,
+        order_number: str,
+        dsco_order: Optional[Dict],
+        started: float,
+    ) -> Optional[Dict]:
+        """Payload Mintsoft (None si la orden no existe en DSCO)"""
+        if not dsco_order:
+            self.logger.warning(
+                "[ORDER] Not found in DSCO | order=%s", order_number
+            )
+            self._record(
+                order_number,
+                None,
+                started,
+                status=STATUS_NOT_FOUND,
+            )
+            return None
+
+        with metrics.stage("order", metrics.STAGE_MAP):
+            return map_dsco_order_to_mintsoft(dsco_order)
+
+    def _order_created(self, order_number: str, response: Dict, started: float) -> bool:
+        self.logger.info(
+            "[ORDER] Synced successfully | order=%s | mintsoft_id=%s",
+            order_number,
+            response.get("OrderId"),
+        )
+        self._record(
+            order_number,
+            ACTION_CREATE,
+            started,
+            http_status=metrics.last_http_status(),
+        )
+        return True
+
+    def _order_failed(
+        self,
+        order_number: str,
+        dsco_order: Optional[Dict],
+        payload: Optional[Dict],
+        error: BaseException,
+        started: float,
+    ) -> bool:
+        """Se llama desde el except: loguea el traceback y encola la orden"""
+        self.logger.exception(
+            "[ORDER] Sync failed | order=%s", order_number
+        )
+        self._record(order_number, ACTION_CREATE, started, error=error)
+        self._dead_letter(order_number, dsco_order, payload, error)
+        return False
+
+    # -------------------------------------------------
+    # Dead letters (items fallidos)
+    # -------------------------------------------------
+    def replay_dead_letters(
+        self,
+        limit: Optional[int] = None,
+        workers: Optional[int] = None,
+        rate: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Re-sincroniza las órdenes que fallaron
+        (state/dead_letters.sqlite), en paralelo y con rate limit.
+
+        Cada orden se vuelve a mapear desde el registro DSCO
+        guardado (o se vuelve a pedir si no llegó a leerse);
+        las que salen bien se borran de la cola.
+
+        workers / rate / max_attempts: default DLQ_REPLAY_WORKERS,
+        DLQ_REPLAY_RATE (items/seg) y DLQ_MAX_ATTEMPTS
+        """
+
+        self.logger.info(
+            "[DLQ] Order replay started | "
+            f"pending={self.dead_letters.count('order')}"
+        )
+
+        reset_retry_budget()
+        self.journal = RunJournal("order", kind="replay", mode="threads")
+
+        try:
+            summary = replay(
+                self.dead_letters,
+                "order",
+                lambda item: self.sync_one_order(item["key"], item["source"]),
+                limit=limit,
+                workers=workers,
+                rate=rate,
+                max_attempts=max_attempts,
             )
-            return False
+        finally:
+            self._close_journal()
+
+        self.logger.info(
+            "[DLQ] Order replay finished | "
+            f"Total={summary['total']} | Replayed={summary['replayed']} | "
+            f"Failed={summary['failed']} | Remaining={summary['remaining']}"
+        )
+
+        return summary
 
     # -------------------------------------------------
     # Batch sync con fechas
@@ -65,79 +278,450 @@ class OrderSyncService:
         status: str = "released",
         updated_from: Optional[datetime] = None,
         updated_to: Optional[datetime] = None,
+        workers: Optional[int] = None,
+        prefetch_depth: Optional[int] = None,
     ):
         """
         Sincroniza órdenes DSCO → Mintsoft
         filtradas por fecha de actualización
+
+        workers: máximo de órdenes en vuelo por página
+        (default ORDER_SYNC_WORKERS, 1 = serial).
+        El cursor sólo avanza cuando todas las órdenes
+        de la página actual están resueltas.
+
+        prefetch_depth: páginas pedidas por adelantado
+        (default SYNC_PREFETCH_DEPTH, 0 = sin prefetch)
+
+        Sin fechas explícitas se retoma la ventana que quedó
+        a medias (scrollId guardado) o se arranca desde el
+        último watermark en state/order_sync_state.json.
+        Con fechas explícitas la ventana se guarda aparte
+        (ver _window_checkpoints).
         """
 
-        # Default: última hora → ahora
-        if not updated_to:
-            updated_to = datetime.now(timezone.utc)
+        workers = max(1, workers or ORDER_SYNC_WORKERS)
+        if prefetch_depth is None:
+            prefetch_depth = SYNC_PREFETCH_DEPTH
 
-        if not updated_from:
-            updated_from = updated_to - timedelta(hours=1)
+        checkpoints = self._window_checkpoints(
+            updated_from,
+            updated_to,
+        )
+        updated_from_iso, updated_to_iso, scroll_id = self._resolve_window(
+            updated_from,
+            updated_to,
+        )
 
-        updated_from_iso = self._iso(updated_from)
-        updated_to_iso = self._iso(updated_to)
+        checkpoints.start_window({
+            "from": updated_from_iso,
+            "to": updated_to_iso,
+        })
 
         self.logger.info(
             "[BATCH] Order sync started | "
             f"status={status} | "
             f"from={updated_from_iso} | "
-            f"to={updated_to_iso}"
+            f"to={updated_to_iso} | "
+            f"workers={workers} | "
+            f"prefetch={prefetch_depth}"
         )
 
         total = success = failed = 0
-        page = 0
-
-        while True:
-            response = self.dsco_client.get_orders_page(
-                page=page,
-                size=50,
-                status=status,
-                updated_from=updated_from_iso,
-                updated_to=updated_to_iso,
-            )
+        completed = False
+        baseline = metrics.registry.snapshot()
+
+        reset_retry_budget()
+        self.journal = RunJournal(
+            "order",
+            kind="sync",
+            mode="threads",
+            window={"from": updated_from_iso, "to": updated_to_iso},
+            workers=workers,
+        )
+
+        executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="order-sync",
+        ) if workers > 1 else None
 
-            orders: List[Dict] = (
-                response.get("content")
-                or response.get("items")
-                or response.get("orders")
-                or []
+        try:
+            # La página siguiente (scrollId) se pide mientras
+            # se procesa la actual
+            pages = prefetch(
+                metrics.timed_iter(
+                    self._iter_order_responses(
+                        updated_from_iso,
+                        updated_to_iso,
+                        scroll_id,
+                    ),
+                    "order",
+                    metrics.STAGE_FETCH,
+                ),
+                depth=prefetch_depth,
             )
 
-            if not orders:
-                break
+            for page, response in enumerate(pages):
+                orders: List[Dict] = response.get("orders") or []
+
+                self.logger.info(
+                    f"[BATCH] Page {page} fetched | orders={len(orders)}"
+                )
+
+                pending: Dict[str, Dict] = {}
+
+                for order in orders:
+                    order_number = order.get("orderNumber")
+
+                    if not order_number:
+                        self.logger.warning(
+                            "[BATCH] Skipping order without orderNumber"
+                        )
+                        self._record(
+                            None,
+                            None,
+                            perf_counter(),
+                            status=STATUS_INVALID,
+                        )
+                        failed += 1
+                        continue
+
+                    # Evita dos create_order en paralelo para la misma orden
+                    pending.setdefault(order_number, order)
+
+                # Se espera a que toda la página esté resuelta
+                results = self._sync_page(pending, executor)
+                synced = sum(1 for ok in results if ok)
+
+                total += len(results)
+                success += synced
+                failed += len(results) - synced
+
+                # Página resuelta: se guarda el scrollId de la siguiente
+                checkpoints.save_cursor(response.get("scrollId"))
+
+            checkpoints.complete_window({"createdAt": updated_to_iso})
+            completed = True
+
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+            self._close_journal(completed=completed)
+
+        self.logger.info(
+            "[BATCH] Order sync finished | "
+            f"Total={total} | Success={success} | Failed={failed}"
+        )
+        metrics.log_summary(self.logger, "Order sync", since=baseline)
+
+    def _window_checkpoints(self, *dates: Optional[datetime]) -> CheckpointStore:
+        """
+        Checkpoint de la ventana del run.
+        Con fechas explícitas (run manual) se usa
+        state/order_manual_sync_state.json: así no pisa
+        la ventana a medias del cron ni mueve sus watermarks.
+        """
+        if any(d is not None for d in dates):
+            return CheckpointStore("order_manual")
+
+        return self.checkpoints
+
+    def _resolve_window(
+        self,
+        updated_from: Optional[datetime],
+        updated_to: Optional[datetime],
+    ) -> Tuple[str, str, Optional[str]]:
+        """
+        Ventana (from, to) y scrollId desde donde seguir.
+        Sin fechas explícitas se retoma la ventana a medias
+        o se arranca desde el último watermark.
+        """
+        scroll_id: Optional[str] = None
+        in_progress = None
+
+        if updated_from is None and updated_to is None:
+            in_progress = self.checkpoints.get_in_progress()
+
+        if in_progress and in_progress.get("window"):
+            # Retoma una ejecución que no terminó
+            updated_from_iso = in_progress["window"]["from"]
+            updated_to_iso = in_progress["window"]["to"]
+            scroll_id = in_progress.get("cursor")
 
             self.logger.info(
-                f"[BATCH] Page {page} fetched | orders={len(orders)}"
+                "[BATCH] Resuming interrupted window | "
+                f"scrollId={'yes' if scroll_id else 'no'}"
             )
+        else:
+            # Default: último watermark (o última hora) → ahora
+            if not updated_to:
+                updated_to = datetime.now(timezone.utc)
+
+            if not updated_from:
+                updated_from = (
+                    parse_watermark(self.checkpoints.get_watermark("createdAt"))
+                    or updated_to - timedelta(hours=1)
+                )
+
+            updated_from_iso = self._iso(updated_from)
+            updated_to_iso = self._iso(updated_to)
+
+        return updated_from_iso, updated_to_iso, scroll_id
+
+    # -------------------------------------------------
+    # Backfill en paralelo por sub-ventanas
+    # -------------------------------------------------
+    def backfill_orders(
+        self,
+        created_from: datetime,
+        created_to: datetime,
+        shards: int = ORDER_BACKFILL_SHARDS,
+        parallel: int = ORDER_BACKFILL_PARALLEL,
+        workers: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Divide [created_from, created_to] en `shards` sub-ventanas
+        y recorre sus scrolls DSCO en paralelo (`parallel` a la vez).
+
+        - Las órdenes se deduplican por orderNumber entre ventanas
+        - Cada sub-ventana completa queda registrada en
+          state/order_backfill_sync_state.json: si el backfill
+          falla, re-ejecutarlo sólo procesa las que faltan
+        """
+
+        if created_to <= created_from:
+            raise ValueError("created_to must be after created_from")
+
+        shards = max(1, shards)
+        parallel = max(1, parallel)
+        workers = max(1, workers or ORDER_SYNC_WORKERS)
+
+        job, store, windows = self._backfill_plan(created_from, created_to, shards)
+
+        self.logger.info(
+            "[BACKFILL] Order backfill started | "
+            f"from={self._iso(created_from)} | "
+            f"to={self._iso(created_to)} | "
+            f"shards={shards} | pending={len(windows)} | "
+            f"parallel={parallel} | workers={workers}"
+        )
+
+        totals = {"total": 0, "success": 0, "failed": 0, "duplicates": 0}
+        failed_windows = 0
+
+        seen: Set[str] = set()
+        seen_lock = threading.Lock()
+        baseline = metrics.registry.snapshot()
+
+        reset_retry_budget()
+        self.journal = RunJournal(
+            "order",
+            kind="backfill",
+            mode="threads",
+            window={"from": self._iso(created_from), "to": self._iso(created_to)},
+            shards=shards,
+            workers=workers,
+        )
+
+        executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="order-sync",
+        ) if workers > 1 else None
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=min(parallel, len(windows)) or 1,
+                thread_name_prefix="order-backfill",
+            ) as shard_pool:
+                futures = {
+                    shard_pool.submit(
+                        self._backfill_window,
+                        window,
+                        seen,
+                        seen_lock,
+                        executor,
+                    ): window
+                    for window in windows
+                }
+
+                for future in as_completed(futures):
+                    key = self._window_key(futures[future])
+
+                    try:
+                        counts = future.result()
+                    except Exception:
+                        failed_windows += 1
+                        self.logger.exception(
+                            f"[BACKFILL] Window failed | window={key}"
+                        )
+                        continue
+
+                    store.mark_window_completed(job, key)
+                    for name, value in counts.items():
+                        totals[name] += value
+
+                    self.logger.info(
+                        f"[BACKFILL] Window done | window={key} | "
+                        f"orders={counts['total']}"
+                    )
+
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+            self._close_journal(failed_windows=failed_windows)
+
+        self.logger.info(
+            "[BACKFILL] Order backfill finished | "
+            f"Total={totals['total']} | Success={totals['success']} | "
+            f"Failed={totals['failed']} | "
+            f"Duplicates={totals['duplicates']} | "
+            f"FailedWindows={failed_windows}"
+        )
+        metrics.log_summary(self.logger, "Order backfill", since=baseline)
+
+        return {**totals, "failed_windows": failed_windows}
+
+    def _backfill_window(
+        self,
+        window: Tuple[datetime, datetime],
+        seen: Set[str],
+        seen_lock: threading.Lock,
+        executor: Optional[ThreadPoolExecutor],
+    ) -> Dict[str, int]:
+        counts = {"total": 0, "success": 0, "failed": 0, "duplicates": 0}
+
+        pages = metrics.timed_iter(
+            self.dsco_client.iter_order_pages(
+                orders_created_since=self._iso(window[0]),
+                until=self._iso(window[1]),
+            ),
+            "order",
+            metrics.STAGE_FETCH,
+        )
+
+        for orders in pages:
+            pending: Dict[str, Dict] = {}
 
             for order in orders:
                 order_number = order.get("orderNumber")
 
                 if not order_number:
-                    self.logger.warning(
-                        "[BATCH] Skipping order without orderNumber"
-                    )
-                    failed += 1
+                    self._record(None, None, perf_counter(), status=STATUS_INVALID)
+                    counts["failed"] += 1
                     continue
 
-                total += 1
-                if self.sync_one_order(order_number):
-                    success += 1
-                else:
-                    failed += 1
+                # Dedupe entre sub-ventanas (bordes solapados)
+                with seen_lock:
+                    if order_number in seen:
+                        counts["duplicates"] += 1
+                        continue
+                    seen.add(order_number)
 
-            # Control de última página
-            total_pages = response.get("totalPages")
-            if total_pages is not None and page >= total_pages - 1:
-                break
+                pending[order_number] = order
 
-            page += 1
+            results = self._sync_page(pending, executor)
+            synced = sum(1 for ok in results if ok)
 
-        self.logger.info(
-            "[BATCH] Order sync finished | "
-            f"Total={total} | Success={success} | Failed={failed}"
+            counts["total"] += len(results)
+            counts["success"] += synced
+            counts["failed"] += len(results) - synced
+
+        return counts
+
+    def _backfill_plan(
+        self,
+        created_from: datetime,
+        created_to: datetime,
+        shards: int,
+    ) -> Tuple[str, CheckpointStore, List[Tuple[datetime, datetime]]]:
+        """Job id, store de progreso y sub-ventanas que faltan"""
+        job = f"{self._iso(created_from)}/{self._iso(created_to)}/{shards}"
+        store = CheckpointStore("order_backfill")
+        completed = store.completed_windows(job)
+
+        windows = [
+            w for w in self._split_window(created_from, created_to, shards)
+            if self._window_key(w) not in completed
+        ]
+
+        return job, store, windows
+
+    @staticmethod
+    def _split_window(
+        start: datetime,
+        end: datetime,
+        shards: int,
+    ) -> List[Tuple[datetime, datetime]]:
+        step = (end - start) / shards
+
+        return [
+            (start + step * i, end if i == shards - 1 else start + step * (i + 1))
+            for i in range(shards)
+        ]
+
+    def _window_key(self, window: Tuple[datetime, datetime]) -> str:
+        return f"{self._iso(window[0])}/{self._iso(window[1])}"
+
+    # -------------------------------------------------
+    # Scroll DSCO (con reanudación)
+    # -------------------------------------------------
+    def _iter_order_responses(
+        self,
+        created_since: str,
+        until: str,
+        scroll_id: Optional[str],
+    ) -> Iterator[Dict]:
+        """
+        Páginas de /order/page desde el scrollId guardado.
+        Si DSCO ya no acepta ese scrollId se recorre
+        la ventana desde el principio (las órdenes ya
+        creadas se saltean por el índice local).
+        """
+
+        responses = self.dsco_client.iter_order_responses(
+            orders_created_since=created_since,
+            until=until,
+            limit=50,
+            scroll_id=scroll_id,
+        )
+
+        if scroll_id:
+            try:
+                first = next(responses, None)
+            except Exception:
+                self.logger.warning(
+                    "[BATCH] Stored scrollId rejected, restarting window"
+                )
+                responses = self.dsco_client.iter_order_responses(
+                    orders_created_since=created_since,
+                    until=until,
+                    limit=50,
+                )
+            else:
+                if first is None:
+                    return
+                yield first
+
+        yield from responses
+
+    # -------------------------------------------------
+    # Ejecución por página (serial / workers)
+    # -------------------------------------------------
+    def _sync_page(
+        self,
+        orders: Dict[str, Dict],
+        executor: Optional[ThreadPoolExecutor],
+    ) -> List[bool]:
+        """
+        Sincroniza las órdenes de una página.
+        Los resultados vuelven en el orden de la página.
+        """
+        if executor is None:
+            return [
+                self.sync_one_order(number, order)
+                for number, order in orders.items()
+            ]
+
+        return list(
+            executor.map(self.sync_one_order, orders.keys(), orders.values())
         )
@@ -0,0 +1,125 @@
+import asyncio
+import os
+import queue
+import threading
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, TypeVar
+
+
+T = TypeVar("T")
+
+# Páginas pedidas por adelantado (0 = sin prefetch)
+SYNC_PREFETCH_DEPTH = int(os.getenv("SYNC_PREFETCH_DEPTH", 1))
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def prefetch(pages: Iterable[T], depth: int = SYNC_PREFETCH_DEPTH) -> Iterator[T]:
+    """
+    Consume un iterable de páginas en un thread de fondo,
+    hasta `depth` páginas por delante del consumidor.
+
+    Mientras se procesa la página N ya se está pidiendo
+    la N+1 (o el siguiente scrollId de DSCO).
+    Los errores del fetch se re-lanzan en el consumidor.
+    """
+
+    if depth <= 0:
+        yield from pages
+        return
+
+    buffer: "queue.Queue" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _producer() -> None:
+        try:
+            for page in pages:
+                if not _put(page):
+                    return
+        except BaseException as e:
+            _put(_Failure(e))
+            return
+
+        _put(_DONE)
+
+    worker = threading.Thread(
+        target=_producer,
+        name="page-prefetch",
+        daemon=True,
+    )
+    worker.start()
+
+    try:
+        while True:
+            item = buffer.get()
+
+            if item is _DONE:
+                return
+
+            if isinstance(item, _Failure):
+                raise item.error
+
+            yield item
+
+    finally:
+        # El consumidor cortó antes (break / excepción)
+        stop.set()
+        worker.join(timeout=5)
+
+
+async def aprefetch(
+    pages: AsyncIterable[T],
+    depth: int = SYNC_PREFETCH_DEPTH,
+) -> AsyncIterator[T]:
+    """
+    Versión asyncio de prefetch: una task del mismo
+    event loop pide hasta `depth` páginas por adelantado.
+    """
+
+    if depth <= 0:
+        async for page in pages:
+            yield page
+        return
+
+    buffer: "asyncio.Queue" = asyncio.Queue(maxsize=depth)
+
+    async def _producer() -> None:
+        try:
+            async for page in pages:
+                await buffer.put(page)
+        except Exception as e:
+            await buffer.put(_Failure(e))
+            return
+
+        await buffer.put(_DONE)
+
+    task = asyncio.ensure_future(_producer())
+
+    try:
+        while True:
+            item = await buffer.get()
+
+            if item is _DONE:
+                return
+
+            if isinstance(item, _Failure):
+                raise item.error
+
+            yield item
+
+    finally:
+        # El consumidor cortó antes (break / excepción)
+        task.cancel()
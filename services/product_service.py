@@ -1,11 +1,36 @@
-from time import time
+import os
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
+from clients.base_client import reset_retry_budget
 from clients.dsco_product_client import DscoProductClient
 from clients.mintsoft_product_client import MintsoftProductClient
 from mappers.product_mapper import map_dsco_product_to_mintsoft
+from services.catalog_batch_writer import (
+    CatalogBatchWriter,
+    DSCO_BATCH_MAX_ITEMS,
+    DSCO_BATCH_MAX_WAIT,
+    STATUS_FAILED,
+)
+from services.dead_letter_replay import replay
+from services.prefetch import prefetch, SYNC_PREFETCH_DEPTH
+from stores.checkpoint_store import CheckpointStore, parse_watermark
+from stores.dead_letter_store import DeadLetterStore
+from stores.product_index import payload_hash
+from loggers import metrics
 from loggers.product_logger import get_product_logger
+from loggers.run_journal import RunJournal, STATUS_INVALID
+
+
+# Cantidad de productos sincronizados en paralelo (1 = serial)
+PRODUCT_SYNC_WORKERS = int(os.getenv("PRODUCT_SYNC_WORKERS", 1))
+
+# Acciones posibles por producto
+ACTION_CREATE = "create"
+ACTION_UPDATE = "update"
+ACTION_SKIP = "skip"
 
 
 class ProductSyncService:
@@ -18,6 +43,11 @@ class ProductSyncService:
         self.logger = get_product_logger()
         self.dsco_client = DscoProductClient()
         self.mintsoft_client = MintsoftProductClient()
+        self.checkpoints = CheckpointStore("product")
+        self.dead_letters = DeadLetterStore()
+
+        # Journal JSONL del run en curso (sync_all_products)
+        self.journal: Optional[RunJournal] = None
 
     # -------------------------------------------------
     # Utils
@@ -26,62 +56,233 @@ class ProductSyncService:
     def _iso(dt: datetime) -> str:
         return dt.astimezone(timezone.utc).isoformat()
 
+    def _dead_letter(
+        self,
+        sku: str,
+        source: Optional[Dict],
+        payload: Optional[Dict],
+        error: BaseException,
+    ) -> None:
+        """Guarda el item fallido para replay_dead_letters"""
+        try:
+            self.dead_letters.add("product", sku, source, payload, error)
+        except Exception:
+            self.logger.exception(
+                "[DLQ] Could not store failed product | %s", sku
+            )
+
+    def _record(
+        self,
+        sku: Optional[str],
+        action: Optional[str],
+        started: float,
+        **kwargs,
+    ) -> None:
+        """Resultado de un producto en el journal (si hay un run abierto)"""
+        if self.journal is not None:
+            self.journal.record(sku, action, started, **kwargs)
+
+    def _close_journal(self, **extra) -> None:
+        """Cierra el journal del run (escribe su resumen)"""
+        journal, self.journal = self.journal, None
+        if journal is None:
+            return
+
+        summary = journal.close(**extra)
+        self.logger.info(
+            f"[BATCH] Run journal | run={summary['run_id']} | "
+            f"items={summary['total']} | failed={summary['failed']} | "
+            f"{summary['items_per_sec']} items/s"
+        )
+
     # -------------------------------------------------
     # Sync de un solo producto
     # -------------------------------------------------
     def sync_one_product(self, dsco_product: Dict[str, Any]) -> bool:
-        sku = dsco_product.get("sku") or dsco_product.get("itemCode")
+        return self._sync_product(dsco_product) is not None
 
+    def _sync_product(self, dsco_product: Dict[str, Any]) -> Optional[str]:
+        """
+        Devuelve la acción realizada (create / update / skip)
+        o None si falló
+        """
+        sku = self._product_sku(dsco_product)
         if not sku:
-            self.logger.warning("[PRODUCT] Missing SKU / itemCode")
-            return False
+            return None
 
-        start = time()
-        self.logger.info(f"[PRODUCT] Sync started | SKU={sku}")
+        started = perf_counter()
+        action: Optional[str] = None
+        payload: Optional[Dict[str, Any]] = None
+        self.logger.info("[PRODUCT] Sync started | SKU=%s", sku)
 
         try:
-            payload = map_dsco_product_to_mintsoft(dsco_product)
+            payload = self._map_product(dsco_product)
+
+            with metrics.stage("product", metrics.STAGE_LOOKUP):
+                existing = self.mintsoft_client.lookup_sku(sku)
 
-            existing = self.mintsoft_client.get_product_by_sku(sku)
+            if self._skip_unchanged(sku, existing, payload, started):
+                return ACTION_SKIP
 
-            if existing:
-                product_id = existing.get("ID")
-                if not product_id:
-                    raise RuntimeError(
-                        f"Mintsoft product without ID | SKU={sku}"
+            action, product_id = self._plan_write(sku, existing)
+
+            with metrics.stage("product", metrics.STAGE_WRITE):
+                if action == ACTION_UPDATE:
+                    response = self.mintsoft_client.update_product(
+                        product_id,
+                        payload
                     )
+                else:
+                    response = self.mintsoft_client.create_product(payload)
 
-                self.logger.info(
-                    f"[PRODUCT] Updating Mintsoft product | "
-                    f"SKU={sku} | ID={product_id}"
-                )
+            return self._product_synced(sku, action, response, started)
 
-                response = self.mintsoft_client.update_product(
-                    product_id,
-                    payload
-                )
-            else:
-                self.logger.info(
-                    f"[PRODUCT] Creating Mintsoft product | SKU={sku}"
-                )
+        except Exception as e:
+            return self._product_failed(sku, dsco_product, payload, action, e, started)
+
+    # -------------------------------------------------
+    # Pasos de _sync_product (compartidos con la versión async)
+    # -------------------------------------------------
+    def _product_sku(self, dsco_product: Dict[str, Any]) -> Optional[str]:
+        """SKU del producto DSCO (None: inválido, queda en el journal)"""
+        sku = dsco_product.get("sku") or dsco_product.get("itemCode")
 
-                response = self.mintsoft_client.create_product(payload)
+        if not sku:
+            self.logger.warning("[PRODUCT] Missing SKU / itemCode")
+            self._record(None, None, perf_counter(), status=STATUS_INVALID)
 
-            elapsed = round(time() - start, 2)
-            self.logger.info(
-                f"[PRODUCT] Synced OK | "
-                f"SKU={sku} | "
-                f"ProductId={response.get('ID')} | "
-                f"{elapsed}s"
+        return sku
+
+    @staticmethod
+    def _map_product(dsco_product: Dict[str, Any]) -> Dict[str, Any]:
+        with metrics.stage("product", metrics.STAGE_MAP):
+            return map_dsco_product_to_mintsoft(dsco_product)
+
+    def _skip_unchanged(
+        self,
+        sku: str,
+        existing: Optional[Dict[str, Any]],
+        payload: Dict[str, Any],
+        started: float,
+    ) -> bool:
+        """True si el payload es el mismo que el último enviado"""
+        if not existing or existing.get("hash") != payload_hash(payload):
+            return False
+
+        self.logger.info("[PRODUCT] Unchanged, skipping | SKU=%s", sku)
+        self._record(sku, ACTION_SKIP, started)
+        return True
+
+    def _plan_write(
+        self,
+        sku: str,
+        existing: Optional[Dict[str, Any]],
+    ) -> Tuple[str, Optional[Any]]:
+        """(acción, ID Mintsoft a actualizar) según la entrada del índice"""
+        if not existing:
+            self.logger.info("[PRODUCT] Creating Mintsoft product | SKU=%s", sku)
+            return ACTION_CREATE, None
+
+        product_id = existing.get("ID")
+        if not product_id:
+            raise RuntimeError(
+                f"Mintsoft product without ID | SKU={sku}"
             )
 
-            return True
+        self.logger.info(
+            "[PRODUCT] Updating Mintsoft product | SKU=%s | ID=%s",
+            sku,
+            product_id,
+        )
+        return ACTION_UPDATE, product_id
 
-        except Exception as e:
-            self.logger.exception(
-                f"[PRODUCT] Sync FAILED | SKU={sku} | {str(e)}"
+    def _product_synced(
+        self,
+        sku: str,
+        action: str,
+        response: Dict[str, Any],
+        started: float,
+    ) -> str:
+        self.logger.info(
+            "[PRODUCT] Synced OK | SKU=%s | ProductId=%s | %.2fs",
+            sku,
+            response.get("ID"),
+            perf_counter() - started,
+        )
+        self._record(
+            sku,
+            action,
+            started,
+            http_status=metrics.last_http_status(),
+        )
+        return action
+
+    def _product_failed(
+        self,
+        sku: str,
+        dsco_product: Dict[str, Any],
+        payload: Optional[Dict[str, Any]],
+        action: Optional[str],
+        error: BaseException,
+        started: float,
+    ) -> None:
+        """Se llama desde el except: loguea el traceback y encola el producto"""
+        self.logger.exception(
+            "[PRODUCT] Sync FAILED | SKU=%s | %s", sku, error
+        )
+        self._record(sku, action, started, error=error)
+        self._dead_letter(sku, dsco_product, payload, error)
+        return None
+
+    # -------------------------------------------------
+    # Dead letters (items fallidos)
+    # -------------------------------------------------
+    def replay_dead_letters(
+        self,
+        limit: Optional[int] = None,
+        workers: Optional[int] = None,
+        rate: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Re-sincroniza los productos que fallaron
+        (state/dead_letters.sqlite), en paralelo y con rate limit.
+
+        Cada producto se vuelve a mapear desde el registro DSCO
+        guardado; los que salen bien se borran de la cola.
+
+        workers / rate / max_attempts: default DLQ_REPLAY_WORKERS,
+        DLQ_REPLAY_RATE (items/seg) y DLQ_MAX_ATTEMPTS
+        """
+
+        self.logger.info(
+            "[DLQ] Product replay started | "
+            f"pending={self.dead_letters.count('product')}"
+        )
+
+        reset_retry_budget()
+        self.journal = RunJournal("product", kind="replay", mode="threads")
+
+        try:
+            summary = replay(
+                self.dead_letters,
+                "product",
+                lambda item: self.sync_one_product(item["source"]),
+                limit=limit,
+                workers=workers,
+                rate=rate,
+                max_attempts=max_attempts,
             )
-            return False
+        finally:
+            self._close_journal()
+
+        self.logger.info(
+            "[DLQ] Product replay finished | "
+            f"Total={summary['total']} | Replayed={summary['replayed']} | "
+            f"Failed={summary['failed']} | Remaining={summary['remaining']}"
+        )
+
+        return summary
 
     # -------------------------------------------------
     # Sync masivo con fechas
@@ -93,79 +294,271 @@ class ProductSyncService:
         created_to: Optional[datetime] = None,
         updated_from: Optional[datetime] = None,
         updated_to: Optional[datetime] = None,
+        workers: Optional[int] = None,
+        prefetch_depth: Optional[int] = None,
     ):
         """
         Sincroniza productos DSCO → Mintsoft
         filtrando por fechas de creación / actualización
-        """
 
-        now = datetime.now(timezone.utc)
+        workers: productos en paralelo por página
+        (default PRODUCT_SYNC_WORKERS, 1 = serial)
+        prefetch_depth: páginas pedidas por adelantado
+        (default SYNC_PREFETCH_DEPTH, 0 = sin prefetch)
+
+        Sin fechas explícitas se retoma la ventana que quedó
+        a medias (desde la última página resuelta) o se
+        arranca desde los watermarks en
+        state/product_sync_state.json.
+        Con fechas explícitas la ventana se guarda aparte
+        (ver _window_checkpoints).
+        """
 
-        if not created_to:
-            created_to = now
-        if not updated_to:
-            updated_to = now
+        workers = max(1, workers or PRODUCT_SYNC_WORKERS)
+        if prefetch_depth is None:
+            prefetch_depth = SYNC_PREFETCH_DEPTH
 
-        # Defaults razonables: última hora
-        if not created_from:
-            created_from = created_to - timedelta(hours=1)
-        if not updated_from:
-            updated_from = updated_to - timedelta(hours=1)
+        checkpoints = self._window_checkpoints(
+            created_from,
+            created_to,
+            updated_from,
+            updated_to,
+        )
+        window, start_page = self._resolve_window(
+            created_from,
+            created_to,
+            updated_from,
+            updated_to,
+        )
+        created_from_iso = window["createdFrom"]
+        created_to_iso = window["createdTo"]
+        updated_from_iso = window["updatedFrom"]
+        updated_to_iso = window["updatedTo"]
 
-        created_from_iso = self._iso(created_from)
-        created_to_iso = self._iso(created_to)
-        updated_from_iso = self._iso(updated_from)
-        updated_to_iso = self._iso(updated_to)
+        checkpoints.start_window(window)
 
         self.logger.info(
             "[BATCH] Product sync started | "
             f"createdFrom={created_from_iso} | "
             f"createdTo={created_to_iso} | "
             f"updatedFrom={updated_from_iso} | "
-            f"updatedTo={updated_to_iso}"
+            f"updatedTo={updated_to_iso} | "
+            f"workers={workers} | "
+            f"prefetch={prefetch_depth}"
         )
 
-        page = 0
-        total = success = failed = 0
-
-        while True:
-            page_data = self.dsco_client.get_products_page(
-                page=page,
-                size=page_size,
-                created_at_min=created_from_iso,
-                created_at_max=created_to_iso,
-                updated_at_min=updated_from_iso,
-                updated_at_max=updated_to_iso,
-            )
+        total = success = failed = skipped = 0
+        completed = False
+        baseline = metrics.registry.snapshot()
+
+        reset_retry_budget()
+        self.journal = RunJournal(
+            "product",
+            kind="sync",
+            mode="threads",
+            window=window,
+            workers=workers,
+        )
 
-            products = (
-                page_data.get("content")
-                or page_data.get("items")
-                or page_data.get("products")
-                or []
+        executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="product-sync",
+        ) if workers > 1 else None
+
+        try:
+            # La página N+1 se pide mientras se procesa la N
+            pages = prefetch(
+                metrics.timed_iter(
+                    self.dsco_client.iter_product_pages(
+                        size=page_size,
+                        start_page=start_page,
+                        created_at_min=created_from_iso,
+                        created_at_max=created_to_iso,
+                        updated_at_min=updated_from_iso,
+                        updated_at_max=updated_to_iso,
+                    ),
+                    "product",
+                    metrics.STAGE_FETCH,
+                ),
+                depth=prefetch_depth,
             )
 
-            if not products:
-                break
+            for page, products in enumerate(pages, start=start_page):
+                self.logger.info(
+                    f"[BATCH] Page {page} fetched | products={len(products)}"
+                )
+
+                results = self._sync_page(products, executor)
+
+                synced = sum(1 for action in results if action is not None)
+
+                total += len(results)
+                success += synced
+                failed += len(results) - synced
+                skipped += results.count(ACTION_SKIP)
+
+                # Página resuelta: la próxima ejecución sigue desde acá
+                checkpoints.save_cursor(page + 1)
+
+            checkpoints.complete_window({
+                "createdAt": created_to_iso,
+                "updatedAt": updated_to_iso,
+            })
+            completed = True
+
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+            self._close_journal(completed=completed)
+
+        self.logger.info(
+            "[BATCH] Product sync finished | "
+            f"Total={total} | Success={success} | "
+            f"Skipped={skipped} | Failed={failed}"
+        )
+        metrics.log_summary(self.logger, "Product sync", since=baseline)
+
+    def _window_checkpoints(self, *dates: Optional[datetime]) -> CheckpointStore:
+        """
+        Checkpoint de la ventana del run.
+        Con fechas explícitas (run manual) se usa
+        state/product_manual_sync_state.json: así no pisa
+        la ventana a medias del cron ni mueve sus watermarks.
+        """
+        if any(d is not None for d in dates):
+            return CheckpointStore("product_manual")
+
+        return self.checkpoints
+
+    def _resolve_window(
+        self,
+        created_from: Optional[datetime],
+        created_to: Optional[datetime],
+        updated_from: Optional[datetime],
+        updated_to: Optional[datetime],
+    ) -> Tuple[Dict[str, str], int]:
+        """
+        Ventana de fechas (ISO) y página desde donde seguir.
+        Sin fechas explícitas se retoma la ventana a medias
+        o se arranca desde los watermarks.
+        """
+        in_progress = None
+
+        explicit = any(
+            d is not None
+            for d in (created_from, created_to, updated_from, updated_to)
+        )
+        if not explicit:
+            in_progress = self.checkpoints.get_in_progress()
+
+        if in_progress and in_progress.get("window"):
+            # Retoma una ejecución que no terminó
+            window = in_progress["window"]
+            start_page = int(in_progress.get("cursor") or 0)
 
             self.logger.info(
-                f"[BATCH] Page {page} fetched | products={len(products)}"
+                f"[BATCH] Resuming interrupted window | page={start_page}"
             )
 
-            for product in products:
-                total += 1
-                if self.sync_one_product(product):
-                    success += 1
-                else:
-                    failed += 1
+            return window, start_page
+
+        now = datetime.now(timezone.utc)
+
+        if not created_to:
+            created_to = now
+        if not updated_to:
+            updated_to = now
+
+        # Defaults: último watermark o, si no hay, última hora
+        if not created_from:
+            created_from = (
+                parse_watermark(self.checkpoints.get_watermark("createdAt"))
+                or created_to - timedelta(hours=1)
+            )
+        if not updated_from:
+            updated_from = (
+                parse_watermark(self.checkpoints.get_watermark("updatedAt"))
+                or updated_to - timedelta(hours=1)
+            )
+
+        window = {
+            "createdFrom": self._iso(created_from),
+            "createdTo": self._iso(created_to),
+            "updatedFrom": self._iso(updated_from),
+            "updatedTo": self._iso(updated_to),
+        }
+
+        return window, 0
+
+    # -------------------------------------------------
+    # Ejecución por página (serial / workers)
+    # -------------------------------------------------
+    def _sync_page(
+        self,
+        products: List[Dict[str, Any]],
+        executor: Optional[ThreadPoolExecutor],
+    ) -> List[Optional[str]]:
+        """
+        Sincroniza una página, serial o con el pool de workers.
+        Devuelve la acción de cada producto (None = falló).
+        """
+        if executor is None:
+            return [self._sync_product(p) for p in products]
+
+        return list(executor.map(self._sync_product, products))
+
+    # -------------------------------------------------
+    # Mintsoft → DSCO (inventario / estado) en batches
+    # -------------------------------------------------
+    def push_catalog_updates(
+        self,
+        items: Iterable[Dict[str, Any]],
+        max_items: int = DSCO_BATCH_MAX_ITEMS,
+        max_wait: float = DSCO_BATCH_MAX_WAIT,
+    ) -> Dict[str, int]:
+        """
+        Envía updates de catálogo a DSCO agrupados en
+        /catalog/batch/small (un request cada max_items
+        o cada max_wait segundos).
 
-            total_pages = page_data.get("totalPages")
-            if total_pages is not None and page >= total_pages - 1:
-                break
+        DSCO procesa cada batch después de aceptarlo: los items
+        quedan "submitted" con el requestId del batch, no como
+        sincronizados. Devuelve {"total", "submitted", "failed"}.
+        """
 
-            page += 1
+        reset_retry_budget()
 
         self.logger.info(
-            "[BATCH] Product sync finished | "
-            f"Total={total} | Success={success} | Failed={failed}"
+            "[BATCH] DSCO catalog push started | "
+            f"maxItems={max_items} | maxWait={max_wait}s"
         )
+
+        with CatalogBatchWriter(
+            self.dsco_client,
+            max_items=max_items,
+            max_wait=max_wait,
+        ) as writer:
+            for item in items:
+                writer.add(item)
+
+        return self._catalog_push_finished(writer)
+
+    def _catalog_push_finished(self, writer) -> Dict[str, int]:
+        """Loguea el resultado del push (compartido con la versión async)"""
+        for result in writer.results:
+            if result["status"] == STATUS_FAILED:
+                self.logger.warning(
+                    "[PRODUCT] DSCO catalog update FAILED | SKU=%s | %s",
+                    result["key"],
+                    result["error"],
+                )
+
+        request_ids = sorted({r["request_id"] for r in writer.results if r["request_id"]})
+        summary = writer.summary()
+        self.logger.info(
+            "[BATCH] DSCO catalog push finished | "
+            f"Total={summary['total']} | Submitted={summary['submitted']} | "
+            f"Failed={summary['failed']} | requestIds={','.join(request_ids)}"
+        )
+
+        return summary
@@ -0,0 +1,145 @@
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from stores.sqlite_store import STATE_DIR
+
+
+class CheckpointStore:
+    """
+    Watermarks de sincronización por entidad
+    Persistido en state/<entity>_sync_state.json
+
+    {
+      "watermarks": {"createdAt": "...", "updatedAt": "..."},
+      "in_progress": {
+        "window": {...},
+        "cursor": "<scrollId DSCO | página>",
+        "updated_at": "..."
+      }
+    }
+    """
+
+    def __init__(self, entity: str, path: Optional[str] = None):
+        self.entity = entity
+        self.path = path or os.path.join(STATE_DIR, f"{entity}_sync_state.json")
+        self._lock = threading.Lock()
+        self._state = self._read()
+
+    # -------------------------------------------------
+    # Lectura
+    # -------------------------------------------------
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = f.read()
+        except OSError:
+            return {}
+
+        if not raw.strip():
+            return {}
+
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            return {}
+
+        return data if isinstance(data, dict) else {}
+
+    def get_watermark(self, field: str) -> Optional[str]:
+        """Último timestamp completamente sincronizado"""
+        return self._state.get("watermarks", {}).get(field)
+
+    def get_in_progress(self) -> Optional[Dict[str, Any]]:
+        """Ventana en curso de una ejecución que no terminó"""
+        return self._state.get("in_progress")
+
+    # -------------------------------------------------
+    # Escritura
+    # -------------------------------------------------
+    def start_window(self, window: Dict[str, str]) -> None:
+        with self._lock:
+            current = self._state.get("in_progress") or {}
+
+            # Si es la misma ventana se conserva el cursor
+            cursor = current.get("cursor") if current.get("window") == window else None
+
+            self._state["in_progress"] = {
+                "window": window,
+                "cursor": cursor,
+                "updated_at": _now(),
+            }
+            self._write()
+
+    def save_cursor(self, cursor: Any) -> None:
+        """Guarda el cursor luego de resolver una página completa"""
+        with self._lock:
+            in_progress = self._state.setdefault("in_progress", {})
+            in_progress["cursor"] = cursor
+            in_progress["updated_at"] = _now()
+            self._write()
+
+    def complete_window(self, watermarks: Dict[str, str]) -> None:
+        """
+        Avanza los watermarks (nunca hacia atrás)
+        y limpia la ventana en curso
+        """
+        with self._lock:
+            current = self._state.setdefault("watermarks", {})
+
+            for field, value in watermarks.items():
+                previous = current.get(field)
+                if previous is None or _parse(value) > _parse(previous):
+                    current[field] = value
+
+            self._state.pop("in_progress", None)
+            self._state["completed_at"] = _now()
+            self._write()
+
+    # -------------------------------------------------
+    # Backfills (completado por sub-ventana)
+    # -------------------------------------------------
+    def completed_windows(self, job: str) -> Dict[str, str]:
+        """Sub-ventanas ya completadas de un backfill"""
+        return dict(self._state.get("backfills", {}).get(job, {}))
+
+    def mark_window_completed(self, job: str, window: str) -> None:
+        with self._lock:
+            backfills = self._state.setdefault("backfills", {})
+            backfills.setdefault(job, {})[window] = _now()
+            self._write()
+
+    def clear_backfill(self, job: str) -> None:
+        with self._lock:
+            self._state.get("backfills", {}).pop(job, None)
+            self._write()
+
+    def _write(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state, f, indent=2, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+
+        # Escritura atómica: nunca queda un JSON a medias
+        os.replace(tmp_path, self.path)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _parse(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def parse_watermark(value: Optional[str]) -> Optional[datetime]:
+    """Watermark ISO 8601 → datetime (None si no hay)"""
+    return _parse(value) if value else None
@@ -0,0 +1,147 @@
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+from stores.sqlite_store import SqliteStore
+
+
+class DeadLetterStore(SqliteStore):
+    """
+    Items que fallaron al sincronizarse (órdenes / productos)
+    Persistido en state/dead_letters.sqlite
+
+    Guarda el registro DSCO original, el payload Mintsoft
+    (si se llegó a mapear) y el último error. Una fila por
+    entity + key: si vuelve a fallar se suma un intento.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS dead_letters (
+        entity TEXT NOT NULL,
+        key TEXT NOT NULL,
+        source TEXT,
+        payload TEXT,
+        error TEXT,
+        http_status INTEGER,
+        attempts INTEGER NOT NULL,
+        first_failed_at REAL NOT NULL,
+        last_failed_at REAL NOT NULL,
+        PRIMARY KEY (entity, key)
+    );
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        super().__init__("dead_letters.sqlite", path)
+
+    # -------------------------------------------------
+    # Escritura
+    # -------------------------------------------------
+    def add(
+        self,
+        entity: str,
+        key: str,
+        source: Optional[Dict[str, Any]],
+        payload: Optional[Dict[str, Any]] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Registra (o re-registra) un item fallido"""
+        response = getattr(error, "response", None)
+        now = time.time()
+
+        self._execute(
+            """
+            INSERT INTO dead_letters (
+                entity, key, source, payload, error, http_status,
+                attempts, first_failed_at, last_failed_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?)
+            ON CONFLICT(entity, key) DO UPDATE SET
+                source = COALESCE(excluded.source, dead_letters.source),
+                payload = COALESCE(excluded.payload, dead_letters.payload),
+                error = excluded.error,
+                http_status = excluded.http_status,
+                attempts = dead_letters.attempts + 1,
+                last_failed_at = excluded.last_failed_at
+            """,
+            (
+                entity,
+                key,
+                _dumps(source),
+                _dumps(payload),
+                repr(error) if error is not None else None,
+                getattr(response, "status_code", None),
+                now,
+                now,
+            ),
+        )
+
+    def remove(self, entity: str, key: str) -> None:
+        self._execute(
+            "DELETE FROM dead_letters WHERE entity = ? AND key = ?",
+            (entity, key),
+        )
+
+    # -------------------------------------------------
+    # Lectura
+    # -------------------------------------------------
+    def count(self, entity: Optional[str] = None) -> int:
+        if entity is None:
+            row = self._fetchone("SELECT COUNT(*) FROM dead_letters")
+        else:
+            row = self._fetchone(
+                "SELECT COUNT(*) FROM dead_letters WHERE entity = ?",
+                (entity,),
+            )
+        return row[0] if row else 0
+
+    def pending(
+        self,
+        entity: str,
+        limit: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Items a reintentar, los más viejos primero.
+        max_attempts: saltea los que ya fallaron tantas veces
+        """
+        sql = (
+            "SELECT key, source, payload, error, http_status, attempts, "
+            "first_failed_at, last_failed_at "
+            "FROM dead_letters WHERE entity = ?"
+        )
+        params: List[Any] = [entity]
+
+        if max_attempts:
+            sql += " AND attempts < ?"
+            params.append(max_attempts)
+
+        sql += " ORDER BY first_failed_at"
+
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [
+            {
+                "entity": entity,
+                "key": row[0],
+                "source": _loads(row[1]),
+                "payload": _loads(row[2]),
+                "error": row[3],
+                "http_status": row[4],
+                "attempts": row[5],
+                "first_failed_at": row[6],
+                "last_failed_at": row[7],
+            }
+            for row in self._fetchall(sql, tuple(params))
+        ]
+
+
+def _dumps(value: Optional[Dict[str, Any]]) -> Optional[str]:
+    if value is None:
+        return None
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
+def _loads(raw: Optional[str]) -> Optional[Dict[str, Any]]:
+    return json.loads(raw) if raw else None
@@ -0,0 +1,79 @@
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from stores.sqlite_store import SqliteStore
+
+
+class OrderIndex(SqliteStore):
+    """
+    Índice local OrderNumber → Mintsoft OrderId
+    Persistido en state/order_index.sqlite
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS orders (
+        order_number TEXT PRIMARY KEY,
+        order_id INTEGER,
+        source TEXT NOT NULL,
+        updated_at REAL NOT NULL
+    );
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        super().__init__("order_index.sqlite", path)
+
+    # -------------------------------------------------
+    # Lookup
+    # -------------------------------------------------
+    def get(self, order_number: str) -> Optional[Dict[str, Any]]:
+        row = self._fetchone(
+            "SELECT order_id, source FROM orders WHERE order_number = ?",
+            (order_number,),
+        )
+        if not row:
+            return None
+
+        return {"ID": row[0], "OrderNumber": order_number, "source": row[1]}
+
+    def __contains__(self, order_number: str) -> bool:
+        return self.get(order_number) is not None
+
+    def count(self) -> int:
+        row = self._fetchone("SELECT COUNT(*) FROM orders")
+        return row[0] if row else 0
+
+    # -------------------------------------------------
+    # Updates
+    # -------------------------------------------------
+    def record_created(self, order_number: str, order_id: Any) -> None:
+        """Registra una orden creada por nosotros (ledger)"""
+        self._execute(
+            """
+            INSERT INTO orders (order_number, order_id, source, updated_at)
+            VALUES (?, ?, 'create', ?)
+            ON CONFLICT(order_number) DO UPDATE SET
+                order_id = COALESCE(excluded.order_id, orders.order_id),
+                updated_at = excluded.updated_at
+            """,
+            (order_number, order_id, time.time()),
+        )
+
+    def load_orders(self, orders: Iterable[Dict[str, Any]]) -> int:
+        """Carga las órdenes existentes en Mintsoft (OrderNumber / ID)"""
+        now = time.time()
+        rows = (
+            (o["OrderNumber"], o.get("ID") or o.get("OrderId"), now)
+            for o in orders
+            if o.get("OrderNumber")
+        )
+
+        return self._executemany_chunked(
+            """
+            INSERT INTO orders (order_number, order_id, source, updated_at)
+            VALUES (?, ?, 'walk', ?)
+            ON CONFLICT(order_number) DO UPDATE SET
+                order_id = COALESCE(excluded.order_id, orders.order_id),
+                updated_at = excluded.updated_at
+            """,
+            rows,
+        )
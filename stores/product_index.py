@@ -0,0 +1,112 @@
+import hashlib
+import json
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from stores.sqlite_store import SqliteStore
+
+
+def payload_hash(payload: Dict[str, Any]) -> str:
+    """Hash estable (sha1) de un payload JSON"""
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class ProductIndex(SqliteStore):
+    """
+    Índice local SKU → Mintsoft product ID
+    Persistido en state/product_index.sqlite
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS products (
+        sku TEXT PRIMARY KEY,
+        product_id INTEGER NOT NULL,
+        payload_hash TEXT,
+        updated_at REAL NOT NULL
+    );
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        super().__init__("product_index.sqlite", path)
+
+    # -------------------------------------------------
+    # Lookup
+    # -------------------------------------------------
+    def get(self, sku: str) -> Optional[Dict[str, Any]]:
+        row = self._fetchone(
+            "SELECT product_id, payload_hash FROM products WHERE sku = ?",
+            (sku,),
+        )
+        if not row:
+            return None
+
+        return {"ID": row[0], "SKU": sku, "hash": row[1]}
+
+    def count(self) -> int:
+        row = self._fetchone("SELECT COUNT(*) FROM products")
+        return row[0] if row else 0
+
+    # -------------------------------------------------
+    # Updates
+    # -------------------------------------------------
+    def upsert(
+        self,
+        sku: str,
+        product_id: Any,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Registra un producto creado / actualizado.
+        Si hay payload se guarda su hash como último enviado.
+        """
+        digest = payload_hash(payload) if payload is not None else None
+
+        self._execute(
+            """
+            INSERT INTO products (sku, product_id, payload_hash, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(sku) DO UPDATE SET
+                product_id = excluded.product_id,
+                payload_hash = COALESCE(excluded.payload_hash, products.payload_hash),
+                updated_at = excluded.updated_at
+            """,
+            (sku, product_id, digest, time.time()),
+        )
+
+    def load_catalog(self, products: Iterable[Dict[str, Any]]) -> int:
+        """
+        Carga el catálogo de Mintsoft (SKU / ID).
+        Conserva el hash del último payload enviado.
+        Cada SKU visto queda con updated_at = ahora (ver remove_unseen).
+        """
+        now = time.time()
+        rows = (
+            (p["SKU"], p["ID"], now)
+            for p in products
+            if p.get("SKU") and p.get("ID")
+        )
+
+        return self._executemany_chunked(
+            """
+            INSERT INTO products (sku, product_id, updated_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(sku) DO UPDATE SET
+                product_id = excluded.product_id,
+                updated_at = excluded.updated_at
+            """,
+            rows,
+        )
+
+    def remove_unseen(self, walk_started: float) -> int:
+        """
+        Al terminar un recorrido completo del catálogo: borra los
+        SKUs que no se vieron ni se escribieron desde walk_started
+        (productos borrados en Mintsoft). Devuelve cuántos borró.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM products WHERE updated_at < ?",
+                (walk_started,),
+            )
+            return cursor.rowcount
@@ -0,0 +1,91 @@
+import os
+import sqlite3
+import threading
+from typing import Any, Iterable, List, Optional, Tuple
+
+
+STATE_DIR = os.getenv("STATE_DIR", "state")
+
+
+class SqliteStore:
+    """
+    Base para stores locales en SQLite bajo state/
+    Una conexión por store, compartida entre threads con lock
+    """
+
+    SCHEMA: str = ""
+
+    def __init__(self, filename: str, path: Optional[str] = None):
+        self.path = path or os.path.join(STATE_DIR, filename)
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path,
+            timeout=30,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        if self.SCHEMA:
+            self._conn.executescript(self.SCHEMA)
+
+    # -------------------------------------------------
+    # Helpers
+    # -------------------------------------------------
+    def _execute(self, sql: str, params: Tuple = ()) -> None:
+        with self._lock:
+            self._conn.execute(sql, params)
+
+    def _executemany(self, sql: str, rows: Iterable[Tuple]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(sql, rows)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _executemany_chunked(
+        self,
+        sql: str,
+        rows: Iterable[Tuple],
+        chunk_size: int = 500,
+    ) -> int:
+        """
+        Inserta filas de un iterable en bloques,
+        sin materializar todo en memoria
+        """
+        written = 0
+        chunk: List[Tuple] = []
+
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                self._executemany(sql, chunk)
+                written += len(chunk)
+                chunk = []
+
+        if chunk:
+            self._executemany(sql, chunk)
+            written += len(chunk)
+
+        return written
+
+    def _fetchone(self, sql: str, params: Tuple = ()) -> Optional[Tuple[Any, ...]]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()
+
+    def _fetchall(self, sql: str, params: Tuple = ()) -> List[Tuple[Any, ...]]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,77 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Antes de importar stores / loggers / clientes: leen el entorno al importarse
+WORKDIR = tempfile.mkdtemp(prefix="dscomintsoft-tests-")
+
+os.environ.update({
+    "STATE_DIR": os.path.join(WORKDIR, "state"),
+    "LOG_DIR": os.path.join(WORKDIR, "logs"),
+    "LOG_LEVEL": "WARNING",
+    "DSCO_CLIENT_ID": "test",
+    "DSCO_CLIENT_SECRET": "test",
+    "MINTSOFT_USERNAME": "test",
+    "MINTSOFT_PASSWORD": "test",
+    "MINTSOFT_CLIENT_ID": "1",
+})
+for name in ("HTTP_RATE_LIMITS", "DSCO_TOKEN_CACHE_FILE", "MINTSOFT_API_KEY_CACHE_FILE"):
+    os.environ.pop(name, None)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def workdir():
+    """product_logger escribe en ./logs: fuera del repo"""
+    cwd = os.getcwd()
+    os.chdir(WORKDIR)
+
+    yield WORKDIR
+
+    os.chdir(cwd)
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    """state/ vacío por test (índices, checkpoints, dead letters)"""
+    from stores import checkpoint_store, sqlite_store
+
+    path = str(tmp_path / "state")
+    monkeypatch.setattr(sqlite_store, "STATE_DIR", path)
+    monkeypatch.setattr(checkpoint_store, "STATE_DIR", path)
+
+    return path
+
+
+@pytest.fixture
+def mock_server():
+    """Servidor mock DSCO / Mintsoft con los clientes apuntando a él"""
+    from bench.mock_server import MockServer, point_clients_at
+
+    server = MockServer(orders=5, products=5).start()
+    point_clients_at(server.url)
+
+    yield server
+
+    server.stop()
+
+
+@pytest.fixture
+def fast_retries(monkeypatch):
+    """Política de reintentos sin esperas (y con presupuesto propio)"""
+    from clients import async_base_client, base_client
+
+    policy = base_client.RetryPolicy(
+        max_attempts=5,
+        base_delay=0,
+        max_delay=0,
+        budget=base_client.RetryBudget(100),
+    )
+    monkeypatch.setattr(base_client, "retry_policy", policy)
+    monkeypatch.setattr(async_base_client, "retry_policy", policy)
+
+    return policy
@@ -0,0 +1,367 @@
+import asyncio
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from clients import base_client
+from clients.base_client import BaseClient, RetryBudget, RetryPolicy, request
+
+
+def _response(status: int, retry_after: str = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return response
+
+
+def _mintsoft_headers(server) -> dict:
+    return {"ms-apikey": server.api_key}
+
+
+def _dsco_headers(server) -> dict:
+    return {"Authorization": f"Bearer {server.dsco_token}"}
+
+
+# -------------------------------------------------
+# Reglas de reintento
+# -------------------------------------------------
+@pytest.mark.parametrize(
+    "retryable, response, error, expected",
+    [
+        # Escrituras no idempotentes: sólo 429 / ConnectTimeout
+        (False, _response(429), None, True),
+        (False, _response(503), None, False),
+        (False, _response(500), None, False),
+        (False, None, requests.exceptions.ConnectTimeout(), True),
+        (False, None, requests.exceptions.ReadTimeout(), False),
+        (False, None, requests.exceptions.ConnectionError(), False),
+        # Lecturas / escrituras marcadas retry=True
+        (True, _response(503), None, True),
+        (True, _response(404), None, False),
+        (True, None, requests.exceptions.ReadTimeout(), True),
+        (True, None, requests.exceptions.ConnectionError(), True),
+    ],
+)
+def test_should_retry_rules(retryable, response, error, expected):
+    policy = RetryPolicy(max_attempts=5, budget=RetryBudget(10))
+
+    assert policy.should_retry(1, retryable, response=response, error=error) is expected
+
+
+def test_should_retry_stops_at_max_attempts():
+    policy = RetryPolicy(max_attempts=3, budget=RetryBudget(10))
+
+    assert policy.should_retry(2, True, response=_response(503))
+    assert not policy.should_retry(3, True, response=_response(503))
+
+
+def test_put_not_resent_after_503(mock_server, fast_retries):
+    mock_server.fail_next("PUT", "/api/Order", 503)
+
+    r = request(
+        "PUT",
+        f"{mock_server.url}/api/Order",
+        headers=_mintsoft_headers(mock_server),
+        json={"OrderNumber": "A-1"},
+    )
+
+    assert r.status_code == 503
+    assert mock_server.requests["PUT /api/Order"] == 1
+    assert mock_server.mintsoft_orders == {}
+
+
+def test_put_resent_after_429(mock_server, fast_retries):
+    mock_server.fail_next("PUT", "/api/Order", 429, headers={"Retry-After": "0"})
+
+    r = request(
+        "PUT",
+        f"{mock_server.url}/api/Order",
+        headers=_mintsoft_headers(mock_server),
+        json={"OrderNumber": "A-1"},
+    )
+
+    assert r.status_code == 200
+    assert mock_server.requests["PUT /api/Order"] == 2
+    assert list(mock_server.mintsoft_orders) == ["A-1"]
+
+
+def test_get_retried_after_503(mock_server, fast_retries):
+    mock_server.fail_next("GET", "/api/v3/catalog", 503, times=2)
+
+    r = request(
+        "GET",
+        f"{mock_server.url}/api/v3/catalog",
+        headers=_dsco_headers(mock_server),
+        params={"sku": "x"},
+    )
+
+    assert r.status_code == 200
+    assert mock_server.requests["GET /api/v3/catalog"] == 3
+
+
+class _FlakySession:
+    """Sesión falsa: lanza `errors` en orden y después responde 200"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return _response(200)
+
+
+def test_write_resent_after_connect_timeout(monkeypatch, fast_retries):
+    session = _FlakySession(requests.exceptions.ConnectTimeout("connect"))
+    monkeypatch.setattr(base_client, "get_session", lambda url, pool_size: session)
+
+    r = request("PUT", "http://mintsoft.test/api/Order", json={})
+
+    assert r.status_code == 200
+    assert session.calls == 2
+
+
+def test_write_not_resent_after_read_timeout(monkeypatch, fast_retries):
+    session = _FlakySession(requests.exceptions.ReadTimeout("read"))
+    monkeypatch.setattr(base_client, "get_session", lambda url, pool_size: session)
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        request("PUT", "http://mintsoft.test/api/Order", json={})
+
+    assert session.calls == 1
+
+
+# -------------------------------------------------
+# Retry-After
+# -------------------------------------------------
+def test_retry_after_seconds():
+    assert base_client._retry_after(_response(429, "7")) == 7.0
+    assert base_client._retry_after(_response(429, "-3")) == 0.0
+
+
+def test_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    wait = base_client._retry_after(_response(503, format_datetime(retry_at, usegmt=True)))
+
+    assert 28 <= wait <= 30
+
+    past = datetime.now(timezone.utc) - timedelta(minutes=5)
+    assert base_client._retry_after(_response(503, format_datetime(past, usegmt=True))) == 0.0
+
+
+def test_retry_after_missing_or_invalid():
+    assert base_client._retry_after(_response(429)) is None
+    assert base_client._retry_after(_response(429, "soon")) is None
+
+
+def test_retry_after_is_capped(monkeypatch):
+    monkeypatch.setattr(base_client, "HTTP_RETRY_AFTER_MAX", 5)
+    policy = RetryPolicy(base_delay=0.5, max_delay=30, budget=RetryBudget(10))
+
+    assert policy.delay(1, _response(429, "600")) == 5
+
+    far = datetime.now(timezone.utc) + timedelta(hours=1)
+    assert policy.delay(1, _response(503, format_datetime(far, usegmt=True))) == 5
+
+    # Por debajo del tope se respeta tal cual
+    assert policy.delay(1, _response(429, "2")) == 2
+
+
+def test_backoff_without_retry_after_is_bounded():
+    policy = RetryPolicy(base_delay=0.5, max_delay=3, budget=RetryBudget(10))
+
+    for attempt, ceiling in [(1, 0.5), (2, 1.0), (3, 2.0), (6, 3.0)]:
+        for _ in range(20):
+            assert 0 <= policy.delay(attempt, _response(503)) <= ceiling
+
+
+def test_request_waits_retry_after(mock_server, fast_retries):
+    mock_server.fail_next("GET", "/api/v3/catalog", 429, headers={"Retry-After": "1"})
+
+    start = time.perf_counter()
+    r = request(
+        "GET",
+        f"{mock_server.url}/api/v3/catalog",
+        headers=_dsco_headers(mock_server),
+        params={"sku": "x"},
+    )
+
+    assert r.status_code == 200
+    assert time.perf_counter() - start >= 0.9
+
+
+# -------------------------------------------------
+# Presupuesto de reintentos
+# -------------------------------------------------
+def test_retry_budget_consume_and_reset():
+    budget = RetryBudget(2)
+
+    assert budget.consume()
+    assert budget.consume()
+    assert not budget.consume()
+
+    budget.reset()
+    assert budget.consume()
+
+    budget.reset(budget=0)
+    assert not budget.consume()
+
+
+def test_exhausted_budget_stops_retries(mock_server, monkeypatch):
+    policy = RetryPolicy(max_attempts=5, base_delay=0, max_delay=0, budget=RetryBudget(1))
+    monkeypatch.setattr(base_client, "retry_policy", policy)
+
+    mock_server.fail_next("GET", "/api/v3/catalog", 503, times=3)
+    url = f"{mock_server.url}/api/v3/catalog"
+    headers = _dsco_headers(mock_server)
+
+    # Un solo reintento en todo el run: el segundo 503 se devuelve
+    assert request("GET", url, headers=headers, params={"sku": "x"}).status_code == 503
+    assert mock_server.requests["GET /api/v3/catalog"] == 2
+
+    # Sin presupuesto ya no se reintenta nada
+    assert request("GET", url, headers=headers, params={"sku": "x"}).status_code == 503
+    assert mock_server.requests["GET /api/v3/catalog"] == 3
+
+
+def test_each_run_starts_with_a_fresh_budget(mock_server, fast_retries):
+    from services.order_service import OrderSyncService
+
+    # Presupuesto agotado por un run anterior del mismo proceso
+    while fast_retries.budget.consume():
+        pass
+
+    mock_server.fail_next("POST", "/api/v3/order/page", 503)
+    OrderSyncService().sync_all_orders(
+        updated_from=mock_server.created_from,
+        updated_to=mock_server.created_to,
+        prefetch_depth=0,
+    )
+
+    assert mock_server.requests["POST /api/v3/order/page"] == 2
+    assert len(mock_server.mintsoft_orders) == 5
+
+
+# -------------------------------------------------
+# Re-autenticación ante 401
+# -------------------------------------------------
+def test_expired_api_key_reauthenticates_once(mock_server, fast_retries):
+    from clients.mintsoft_order_client import MintsoftOrderClient
+
+    client = MintsoftOrderClient()
+    client.create_order({"OrderNumber": "A-1"})
+    assert mock_server.requests["POST /api/Auth"] == 1
+
+    mock_server.expire_api_key()
+    client.create_order({"OrderNumber": "A-2"})
+
+    assert mock_server.requests["POST /api/Auth"] == 2
+    assert mock_server.requests["PUT /api/Order"] == 3
+    assert sorted(mock_server.mintsoft_orders) == ["A-1", "A-2"]
+
+
+def test_second_401_is_not_retried(mock_server, fast_retries):
+    from clients.mintsoft_order_client import MintsoftOrderClient
+
+    client = MintsoftOrderClient()
+    mock_server.fail_next("PUT", "/api/Order", 401, times=3)
+
+    with pytest.raises(requests.exceptions.HTTPError) as exc:
+        client.create_order({"OrderNumber": "A-1"})
+
+    assert exc.value.response.status_code == 401
+    assert mock_server.requests["PUT /api/Order"] == 2
+    assert mock_server.requests["POST /api/Auth"] == 2
+
+
+def test_401_without_hook_is_returned(mock_server, fast_retries):
+    r = BaseClient()._request("GET", f"{mock_server.url}/api/Order/List")
+
+    assert r.status_code == 401
+    assert mock_server.requests["GET /api/Order/List"] == 1
+
+
+def test_concurrent_401s_share_one_login(mock_server, fast_retries):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from clients.mintsoft_product_client import MintsoftProductClient
+
+    client = MintsoftProductClient()
+    client.create_product({"SKU": "warm"})
+    mock_server.expire_api_key()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: client.create_product({"SKU": f"S-{i}"}), range(16)))
+
+    assert mock_server.requests["POST /api/Auth"] == 2
+    assert len(mock_server.mintsoft_products) == 17
+
+
+def test_rotated_dsco_token_is_refreshed_once(mock_server, fast_retries):
+    from clients.dsco_order_client import DscoOrderClient
+    from clients.dsco_product_client import DscoProductClient
+
+    orders = DscoOrderClient()
+    products = DscoProductClient()
+    order_number = mock_server.dsco_orders[0]["orderNumber"]
+    sku = mock_server.dsco_products[0]["sku"]
+
+    orders.get_order(order_key="orderNumber", value=order_number)
+    mock_server.expire_dsco_token()
+
+    # Token compartido: un solo refresh para los dos clientes
+    assert orders.get_order(order_key="orderNumber", value=order_number)
+    assert products.get_catalog_item(item_key="sku", value=sku)["items"]
+
+    assert mock_server.requests["POST /api/v3/oauth2/token"] == 2
+    assert mock_server.requests["GET /api/v3/order/"] == 3
+
+
+def test_async_rotated_dsco_token_is_refreshed_once(mock_server, fast_retries):
+    from clients.async_base_client import close_async_sessions
+    from clients.async_dsco_order_client import AsyncDscoOrderClient
+
+    order_number = mock_server.dsco_orders[0]["orderNumber"]
+
+    async def run():
+        client = AsyncDscoOrderClient()
+        try:
+            await client.get_order(order_key="orderNumber", value=order_number)
+            mock_server.expire_dsco_token()
+            await asyncio.gather(*(
+                client.get_order(order_key="orderNumber", value=order_number)
+                for _ in range(10)
+            ))
+        finally:
+            await close_async_sessions()
+
+    asyncio.run(run())
+
+    assert mock_server.requests["POST /api/v3/oauth2/token"] == 2
+
+
+def test_async_expired_api_key_reauthenticates_once(mock_server, fast_retries):
+    from clients.async_base_client import close_async_sessions
+    from clients.async_mintsoft_order_client import AsyncMintsoftOrderClient
+
+    async def run():
+        client = AsyncMintsoftOrderClient()
+        try:
+            await client.create_order({"OrderNumber": "A-1"})
+            mock_server.expire_api_key()
+            await asyncio.gather(*(
+                client.create_order({"OrderNumber": f"B-{i}"}) for i in range(10)
+            ))
+        finally:
+            await close_async_sessions()
+
+    asyncio.run(run())
+
+    assert mock_server.requests["POST /api/Auth"] == 2
+    assert len(mock_server.mintsoft_orders) == 11
@@ -0,0 +1,147 @@
+import itertools
+import json
+import os
+import threading
+
+import pytest
+
+from clients.cached_credentials import CachedCredentialProvider
+
+
+class _Response:
+    def __init__(self, credential: str, expires_in: float):
+        self.credential = credential
+        self.expires_in = expires_in
+
+
+class _CountingProvider(CachedCredentialProvider):
+    """Provider sin HTTP: cada refresh emite key-1, key-2, ..."""
+
+    CREDENTIAL_FIELD = "key"
+
+    def __init__(self, cache_file=None, expires_in=3600):
+        super().__init__("user", "secret", "http://auth.test", cache_file)
+        self.expires_in = expires_in
+        self.logins = 0
+        self._counter = itertools.count(1)
+
+    def _refresh(self) -> str:
+        self.logins += 1
+        return self._store(_Response(f"key-{next(self._counter)}", self.expires_in))
+
+    def _check_response(self, response) -> None:
+        pass
+
+    def _parse_response(self, response):
+        return response.credential, response.expires_in
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return str(tmp_path / "credentials" / "key.json")
+
+
+# -------------------------------------------------
+# Cache en memoria / invalidate
+# -------------------------------------------------
+def test_get_logs_in_once_and_caches():
+    provider = _CountingProvider()
+
+    assert provider.get() == "key-1"
+    assert provider.get() == "key-1"
+    assert provider.logins == 1
+
+
+def test_expired_credential_is_renewed():
+    provider = _CountingProvider(expires_in=0)
+
+    assert provider.get() == "key-1"
+    assert provider.get() == "key-2"
+
+
+def test_invalidate_renews_on_next_get():
+    provider = _CountingProvider()
+    provider.get()
+
+    provider.invalidate("key-1")
+
+    assert provider.get() == "key-2"
+    assert provider.logins == 2
+
+
+def test_invalidate_with_stale_credential_keeps_the_new_one():
+    provider = _CountingProvider()
+    provider.get()
+    provider.invalidate("key-1")
+    provider.get()
+
+    # Otro request que también había recibido 401 con key-1
+    provider.invalidate("key-1")
+
+    assert provider.get() == "key-2"
+    assert provider.logins == 2
+
+
+def test_get_never_returns_none_while_invalidating():
+    provider = _CountingProvider()
+    provider.get()
+
+    stop = threading.Event()
+    seen = []
+
+    def read():
+        while not stop.is_set():
+            seen.append(provider.get())
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for t in readers:
+        t.start()
+
+    for _ in range(2000):
+        provider.invalidate()
+
+    stop.set()
+    for t in readers:
+        t.join()
+
+    assert seen and None not in seen
+
+
+# -------------------------------------------------
+# Cache en archivo
+# -------------------------------------------------
+def test_credential_is_shared_through_the_cache_file(cache_file):
+    first = _CountingProvider(cache_file)
+    first.get()
+
+    second = _CountingProvider(cache_file)
+
+    assert second.get() == "key-1"
+    assert second.logins == 0
+    assert oct(os.stat(cache_file).st_mode & 0o777) == "0o600"
+
+
+def test_rejected_credential_is_not_reloaded_from_file(cache_file):
+    provider = _CountingProvider(cache_file)
+    provider.get()
+
+    provider.invalidate("key-1")
+
+    assert provider.get() == "key-2"
+    with open(cache_file, encoding="utf-8") as f:
+        assert json.load(f)["key"] == "key-2"
+
+
+def test_concurrent_writes_leave_one_valid_file(cache_file):
+    provider = _CountingProvider(cache_file)
+    provider.get()
+
+    threads = [threading.Thread(target=provider._save_to_file) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    with open(cache_file, encoding="utf-8") as f:
+        assert json.load(f)["key"] == "key-1"
+    assert os.listdir(os.path.dirname(cache_file)) == ["key.json"]
@@ -0,0 +1,102 @@
+import json
+
+from services.catalog_batch_writer import (
+    CatalogBatchWriter,
+    STATUS_FAILED,
+    STATUS_SUBMITTED,
+    batch_results,
+)
+
+
+BATCH = [{"sku": "A"}, {"sku": "B"}, {"dscoItemId": "C"}]
+
+
+class _FakeClient:
+    def __init__(self, response=None, error=None):
+        self.response = response or {"status": "success", "requestId": "r-1"}
+        self.error = error
+        self.batches = []
+
+    def update_catalog_small_batch(self, items):
+        self.batches.append(list(items))
+        if self.error:
+            raise self.error
+        return self.response
+
+
+# -------------------------------------------------
+# batch_results
+# -------------------------------------------------
+def test_accepted_items_are_submitted_not_synced():
+    results = batch_results(BATCH, {"status": "success", "requestId": "r-1"})
+
+    assert [r["status"] for r in results] == [STATUS_SUBMITTED] * 3
+    assert {r["request_id"] for r in results} == {"r-1"}
+
+
+def test_item_messages_fail_only_that_item():
+    response = {
+        "status": "success",
+        "requestId": "r-1",
+        "messages": [
+            {"sku": "B", "type": "error", "description": "unknown sku"},
+            {"sku": "A", "type": "info", "description": "ok"},
+        ],
+    }
+
+    results = batch_results(BATCH, response)
+
+    assert [(r["key"], r["status"]) for r in results] == [
+        ("A", STATUS_SUBMITTED),
+        ("B", STATUS_FAILED),
+        ("C", STATUS_SUBMITTED),
+    ]
+    assert results[1]["error"] == "unknown sku"
+
+
+def test_batch_failure_fails_every_item():
+    results = batch_results(BATCH, {"status": "failure", "requestId": "r-1"})
+
+    assert {r["status"] for r in results} == {STATUS_FAILED}
+
+
+# -------------------------------------------------
+# CatalogBatchWriter
+# -------------------------------------------------
+def test_writer_flushes_by_size_and_on_close():
+    client = _FakeClient()
+
+    with CatalogBatchWriter(client, max_items=2, max_wait=60, auto_flush=False) as writer:
+        for item in BATCH:
+            writer.add(item)
+
+    assert [len(b) for b in client.batches] == [2, 1]
+    assert writer.summary() == {"total": 3, "submitted": 3, "failed": 0}
+
+
+def test_writer_records_request_errors_per_item():
+    client = _FakeClient(error=RuntimeError("boom"))
+
+    with CatalogBatchWriter(client, max_items=10, max_wait=60, auto_flush=False) as writer:
+        for item in BATCH:
+            writer.add(item)
+
+    assert writer.summary() == {"total": 3, "submitted": 0, "failed": 3}
+    assert writer.results[0]["error"] == "boom"
+
+
+# -------------------------------------------------
+# python -m mains catalog push
+# -------------------------------------------------
+def test_catalog_push_command(mock_server, fast_retries, tmp_path, capsys):
+    from mains.cli import main
+
+    path = tmp_path / "items.jsonl"
+    path.write_text(
+        "\n".join(json.dumps({"sku": f"S-{i}", "quantityAvailable": i}) for i in range(3))
+    )
+
+    assert main(["catalog", "push", str(path), "--max-items", "2"]) == 0
+
+    assert mock_server.requests["POST /api/v3/catalog/batch/small"] == 2
+    assert "catalog: submitted=3 failed=0" in capsys.readouterr().out
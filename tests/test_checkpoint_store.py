@@ -0,0 +1,243 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from stores.checkpoint_store import CheckpointStore
+
+
+WINDOW = {
+    "createdFrom": "2024-01-01T00:00:00+00:00",
+    "createdTo": "2024-01-01T01:00:00+00:00",
+    "updatedFrom": "2024-01-01T00:00:00+00:00",
+    "updatedTo": "2024-01-01T01:00:00+00:00",
+}
+
+
+@pytest.fixture
+def store(state_dir):
+    return CheckpointStore("product")
+
+
+def _reopen(store: CheckpointStore) -> CheckpointStore:
+    return CheckpointStore(store.entity, path=store.path)
+
+
+# -------------------------------------------------
+# Watermarks
+# -------------------------------------------------
+def test_complete_window_advances_watermarks(store):
+    store.complete_window({"createdAt": "2024-01-01T01:00:00+00:00"})
+    store.complete_window({"createdAt": "2024-01-01T02:00:00+00:00"})
+
+    assert store.get_watermark("createdAt") == "2024-01-01T02:00:00+00:00"
+
+
+def test_complete_window_never_moves_back(store):
+    store.complete_window({
+        "createdAt": "2024-01-01T02:00:00+00:00",
+        "updatedAt": "2024-01-01T02:00:00+00:00",
+    })
+    store.complete_window({
+        # Más viejo (otra zona horaria, mismo formato ISO): se ignora
+        "createdAt": "2024-01-01T02:30:00+01:00",
+        # Más nuevo: avanza aunque el otro no
+        "updatedAt": "2024-01-01T03:00:00Z",
+    })
+
+    assert store.get_watermark("createdAt") == "2024-01-01T02:00:00+00:00"
+    assert store.get_watermark("updatedAt") == "2024-01-01T03:00:00Z"
+
+    reopened = _reopen(store)
+    assert reopened.get_watermark("createdAt") == "2024-01-01T02:00:00+00:00"
+    assert reopened.get_watermark("updatedAt") == "2024-01-01T03:00:00Z"
+
+
+def test_complete_window_clears_in_progress(store):
+    store.start_window(WINDOW)
+    store.save_cursor(4)
+
+    store.complete_window({"createdAt": WINDOW["createdTo"]})
+
+    assert store.get_in_progress() is None
+    assert _reopen(store).get_in_progress() is None
+
+
+# -------------------------------------------------
+# Ventana en curso / cursor
+# -------------------------------------------------
+def test_start_window_keeps_cursor_for_same_window(store):
+    store.start_window(WINDOW)
+    store.save_cursor(3)
+
+    # Misma ventana (ej: la ejecución se retoma): conserva el cursor
+    store.start_window(dict(WINDOW))
+
+    assert store.get_in_progress()["cursor"] == 3
+    assert _reopen(store).get_in_progress()["cursor"] == 3
+
+
+def test_start_window_resets_cursor_for_other_window(store):
+    store.start_window(WINDOW)
+    store.save_cursor(3)
+
+    store.start_window({**WINDOW, "createdTo": "2024-01-01T02:00:00+00:00"})
+
+    in_progress = _reopen(store).get_in_progress()
+    assert in_progress["cursor"] is None
+    assert in_progress["window"]["createdTo"] == "2024-01-01T02:00:00+00:00"
+
+
+@pytest.mark.parametrize("content", ["", "   ", "{not json", "[]"])
+def test_unreadable_state_starts_empty(store, content):
+    os.makedirs(os.path.dirname(store.path), exist_ok=True)
+    with open(store.path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+    reopened = _reopen(store)
+
+    assert reopened.get_watermark("createdAt") is None
+    assert reopened.get_in_progress() is None
+
+
+def test_state_file_is_valid_json_after_each_write(store):
+    store.start_window(WINDOW)
+    store.save_cursor("scroll-1")
+
+    with open(store.path, "r", encoding="utf-8") as f:
+        assert json.load(f)["in_progress"]["cursor"] == "scroll-1"
+
+
+# -------------------------------------------------
+# ProductSyncService._resolve_window
+# -------------------------------------------------
+@pytest.fixture
+def product_service(mock_server):
+    from services.product_service import ProductSyncService
+
+    return ProductSyncService()
+
+
+def test_resolve_window_resumes_interrupted_run(product_service):
+    product_service.checkpoints.start_window(WINDOW)
+    product_service.checkpoints.save_cursor(3)
+
+    window, start_page = product_service._resolve_window(None, None, None, None)
+
+    assert window == WINDOW
+    assert start_page == 3
+
+
+def test_resolve_window_explicit_dates_ignore_in_progress(product_service):
+    product_service.checkpoints.start_window(WINDOW)
+    product_service.checkpoints.save_cursor(3)
+
+    created_from = datetime(2024, 2, 1, tzinfo=timezone.utc)
+    window, start_page = product_service._resolve_window(created_from, None, None, None)
+
+    assert start_page == 0
+    assert window["createdFrom"] == created_from.isoformat()
+
+
+def test_resolve_window_starts_from_watermarks(product_service):
+    product_service.checkpoints.complete_window({
+        "createdAt": "2024-03-01T00:00:00+00:00",
+        "updatedAt": "2024-03-02T00:00:00+00:00",
+    })
+
+    window, start_page = product_service._resolve_window(None, None, None, None)
+
+    assert start_page == 0
+    assert window["createdFrom"] == "2024-03-01T00:00:00+00:00"
+    assert window["updatedFrom"] == "2024-03-02T00:00:00+00:00"
+
+
+def test_resolve_window_defaults_to_last_hour(product_service):
+    before = datetime.now(timezone.utc)
+
+    window, _ = product_service._resolve_window(None, None, None, None)
+
+    created_from = datetime.fromisoformat(window["createdFrom"])
+    created_to = datetime.fromisoformat(window["createdTo"])
+    assert created_to - created_from == timedelta(hours=1)
+    assert created_to >= before
+
+
+def test_interrupted_product_run_resumes_from_start_page(mock_server, fast_retries):
+    from services.product_service import ProductSyncService
+
+    requested = []
+
+    def tracking(service, fail_on=None):
+        fetch = service.dsco_client.get_products_page
+
+        def get_products_page(*, page, **kwargs):
+            requested.append(page)
+            if page == fail_on:
+                raise RuntimeError("connection lost")
+            return fetch(page=page, **kwargs)
+
+        service.dsco_client.get_products_page = get_products_page
+        return service
+
+    # 5 productos en páginas de 2: 0, 1, 2. Se corta al pedir la 2.
+    first = tracking(ProductSyncService(), fail_on=2)
+    with pytest.raises(RuntimeError):
+        first.sync_all_products(page_size=2, prefetch_depth=0)
+
+    assert first.checkpoints.get_in_progress()["cursor"] == 2
+    assert first.checkpoints.get_watermark("createdAt") is None
+
+    requested.clear()
+    second = tracking(ProductSyncService())
+    second.sync_all_products(page_size=2, prefetch_depth=0)
+
+    # Retoma la misma ventana desde la página 2
+    assert requested == [2]
+    assert second.checkpoints.get_in_progress() is None
+    assert second.checkpoints.get_watermark("createdAt") is not None
+    assert len(mock_server.mintsoft_products) == 5
+
+
+# -------------------------------------------------
+# Runs manuales (fechas explícitas)
+# -------------------------------------------------
+def test_manual_run_keeps_the_cron_window(product_service, fast_retries):
+    product_service.checkpoints.start_window(WINDOW)
+    product_service.checkpoints.save_cursor(3)
+
+    product_service.sync_all_products(
+        created_from=datetime(2024, 2, 1, tzinfo=timezone.utc),
+        prefetch_depth=0,
+    )
+
+    # La ventana del cron sigue a medias y sin watermarks nuevos
+    cron = _reopen(product_service.checkpoints)
+    assert cron.get_in_progress()["window"] == WINDOW
+    assert cron.get_in_progress()["cursor"] == 3
+    assert cron.get_watermark("createdAt") is None
+
+    manual = CheckpointStore("product_manual")
+    assert manual.get_in_progress() is None
+    assert manual.get_watermark("createdAt") is not None
+
+
+# -------------------------------------------------
+# Órdenes: scrollId guardado que DSCO ya no acepta
+# -------------------------------------------------
+def test_rejected_scroll_id_restarts_the_window(mock_server, fast_retries):
+    from services.order_service import OrderSyncService
+
+    service = OrderSyncService()
+    service.checkpoints.start_window({
+        "from": mock_server.created_from.isoformat(),
+        "to": mock_server.created_to.isoformat(),
+    })
+    service.checkpoints.save_cursor("expired-scroll")
+    mock_server.fail_next("POST", "/api/v3/order/page", 400)
+
+    service.sync_all_orders(prefetch_depth=0)
+
+    assert mock_server.requests["PUT /api/Order"] == 5
+    assert _reopen(service.checkpoints).get_in_progress() is None
@@ -0,0 +1,76 @@
+import pytest
+
+from stores.dead_letter_store import DeadLetterStore
+
+
+@pytest.fixture
+def store(state_dir):
+    return DeadLetterStore()
+
+
+# -------------------------------------------------
+# DeadLetterStore
+# -------------------------------------------------
+def test_failing_again_adds_an_attempt(store):
+    store.add("order", "A-1", {"orderNumber": "A-1"}, None, RuntimeError("first"))
+    store.add("order", "A-1", None, {"OrderNumber": "A-1"}, RuntimeError("second"))
+
+    [item] = store.pending("order")
+
+    assert item["attempts"] == 2
+    assert item["error"] == repr(RuntimeError("second"))
+    # Lo que ya se tenía no se pierde si el nuevo intento no lo trae
+    assert item["source"] == {"orderNumber": "A-1"}
+    assert item["payload"] == {"OrderNumber": "A-1"}
+
+
+def test_pending_skips_items_over_max_attempts(store):
+    store.add("product", "S-1", {"sku": "S-1"})
+    store.add("product", "S-2", {"sku": "S-2"})
+    store.add("product", "S-2", {"sku": "S-2"})
+
+    assert [i["key"] for i in store.pending("product")] == ["S-1", "S-2"]
+    assert [i["key"] for i in store.pending("product", max_attempts=2)] == ["S-1"]
+    assert store.count("order") == 0
+
+
+# -------------------------------------------------
+# replay_dead_letters
+# -------------------------------------------------
+def test_product_replay_removes_synced_items(mock_server, fast_retries):
+    from services.product_service import ProductSyncService
+
+    service = ProductSyncService()
+    mock_server.fail_next("PUT", "/api/Product", 503)
+    service.sync_all_products(workers=1, prefetch_depth=0)
+    assert service.dead_letters.count("product") == 1
+
+    summary = service.replay_dead_letters(rate=0)
+
+    assert summary == {"total": 1, "replayed": 1, "failed": 0, "remaining": 0}
+    assert len(mock_server.mintsoft_products) == 5
+
+
+def test_order_replay_keeps_items_that_fail_again(mock_server, fast_retries):
+    from services.order_service import OrderSyncService
+
+    service = OrderSyncService()
+    mock_server.fail_next("PUT", "/api/Order", 503)
+    service.sync_all_orders(
+        updated_from=mock_server.created_from,
+        updated_to=mock_server.created_to,
+        workers=1,
+        prefetch_depth=0,
+    )
+    [failed] = service.dead_letters.pending("order")
+
+    mock_server.fail_next("PUT", "/api/Order", 503)
+    summary = service.replay_dead_letters(rate=0)
+
+    assert summary == {"total": 1, "replayed": 0, "failed": 1, "remaining": 1}
+    assert service.dead_letters.pending("order")[0]["attempts"] == 2
+
+    summary = service.replay_dead_letters(rate=0)
+
+    assert summary["replayed"] == 1 and summary["remaining"] == 0
+    assert failed["key"] in mock_server.mintsoft_orders
@@ -0,0 +1,58 @@
+import pytest
+
+from mappers import order_mapper, product_mapper
+
+
+ORDERS = [
+    {"orderNumber": "A-1", "shipByDate": "2024-01-02T00:00:00Z"},
+    {"shipByDate": "2024-01-02T00:00:00Z"},  # sin orderNumber
+    {"orderNumber": "A-3", "orderLines": [{"sku": "S", "quantity": 2}]},
+    "not a dict",
+    {"orderNumber": "A-5"},
+]
+
+PRODUCTS = [
+    {"sku": "S-1", "price": "9.90"},
+    {"name": "no sku"},
+    {"sku": "S-3", "price": "9.90", "weight": "1.5"},
+    None,
+    {"sku": "S-5"},
+]
+
+
+@pytest.mark.parametrize(
+    "mapper, records, map_one",
+    [
+        (order_mapper, ORDERS, order_mapper.map_dsco_order_to_mintsoft),
+        (product_mapper, PRODUCTS, product_mapper.map_dsco_product_to_mintsoft),
+    ],
+)
+def test_map_many_keeps_one_slot_per_input(mapper, records, map_one):
+    payloads, errors = mapper.map_many(records)
+
+    assert len(payloads) == len(records)
+    assert [e["index"] for e in errors] == [1, 3]
+
+    for index, (record, payload) in enumerate(zip(records, payloads)):
+        if index in (1, 3):
+            assert payload is None
+        else:
+            # Mismo resultado que el mapper de a uno
+            assert payload == map_one(record)
+
+
+def test_map_many_errors_carry_the_record_key():
+    _, order_errors = order_mapper.map_many(ORDERS)
+    _, product_errors = product_mapper.map_many(PRODUCTS)
+
+    assert order_errors[0]["orderNumber"] is None
+    assert order_errors[1]["orderNumber"] is None
+    assert product_errors[0]["sku"] is None
+    assert all(e["error"] for e in order_errors + product_errors)
+
+
+def test_map_many_accepts_a_generator():
+    payloads, errors = order_mapper.map_many(o for o in ORDERS[:1])
+
+    assert payloads[0]["OrderNumber"] == "A-1"
+    assert errors == []
@@ -0,0 +1,108 @@
+import pytest
+
+from stores.order_index import OrderIndex
+
+
+@pytest.fixture
+def index(state_dir):
+    return OrderIndex()
+
+
+def _sync(server, **kwargs) -> None:
+    from services.order_service import OrderSyncService
+
+    OrderSyncService().sync_all_orders(
+        updated_from=server.created_from,
+        updated_to=server.created_to,
+        prefetch_depth=0,
+        **kwargs,
+    )
+
+
+def _creates(server) -> int:
+    return server.requests.get("PUT /api/Order", 0)
+
+
+# -------------------------------------------------
+# OrderIndex
+# -------------------------------------------------
+def test_walk_keeps_id_from_ledger(index):
+    index.record_created("A-1", 10)
+
+    # El listado de Mintsoft puede no traer el ID: se conserva
+    index.load_orders([{"OrderNumber": "A-1"}, {"OrderNumber": "A-2", "ID": 20}])
+
+    assert index.get("A-1")["ID"] == 10
+    assert index.get("A-2") == {"ID": 20, "OrderNumber": "A-2", "source": "walk"}
+    assert "A-1" in index and "A-3" not in index
+
+
+# -------------------------------------------------
+# lookup_order_number / get_order_by_number
+# -------------------------------------------------
+def test_get_order_by_number_returns_the_mintsoft_order(mock_server):
+    from clients.mintsoft_order_client import MintsoftOrderClient
+
+    client = MintsoftOrderClient()
+    response = client.create_order({"OrderNumber": "A-1"})
+
+    assert client.lookup_order_number("A-1") == {
+        "ID": response["OrderId"],
+        "OrderNumber": "A-1",
+        "source": "create",
+    }
+    assert client.get_order_by_number("A-1") == mock_server.mintsoft_orders["A-1"]
+    assert client.get_order_by_number("missing") is None
+
+
+def test_get_order_by_number_without_id_searches_the_listing(mock_server):
+    from clients.mintsoft_order_client import MintsoftOrderClient
+
+    client = MintsoftOrderClient()
+    client.ensure_index()
+    mock_server.mintsoft_orders["A-1"] = {"ID": 7, "OrderNumber": "A-1"}
+    client.index.record_created("A-1", None)
+
+    assert client.get_order_by_number("A-1") == {"ID": 7, "OrderNumber": "A-1"}
+    assert "GET /api/Order/7" not in mock_server.requests
+
+
+# -------------------------------------------------
+# Dedupe en OrderSyncService
+# -------------------------------------------------
+def test_second_run_does_not_create_orders_again(mock_server, fast_retries):
+    from services.order_service import OrderSyncService
+
+    _sync(mock_server)
+    assert _creates(mock_server) == 5
+
+    # Otro proceso / run: el ledger en state/ evita los duplicados
+    OrderSyncService().backfill_orders(
+        mock_server.created_from,
+        mock_server.created_to,
+        shards=2,
+    )
+    assert _creates(mock_server) == 5
+    assert len(mock_server.mintsoft_orders) == 5
+
+
+def test_orders_already_in_mintsoft_are_skipped(mock_server, fast_retries):
+    # Creada por otro sistema: sólo la ve el recorrido de /api/Order/List
+    existing = mock_server.dsco_orders[0]["orderNumber"]
+    mock_server.mintsoft_orders[existing] = {"ID": 999, "OrderNumber": existing}
+
+    _sync(mock_server)
+
+    assert _creates(mock_server) == 4
+    assert mock_server.mintsoft_orders[existing]["ID"] == 999
+
+
+def test_duplicate_order_numbers_in_a_page_create_once(mock_server, fast_retries):
+    mock_server.dsco_orders[1] = dict(
+        mock_server.dsco_orders[1],
+        orderNumber=mock_server.dsco_orders[0]["orderNumber"],
+    )
+
+    _sync(mock_server, workers=4)
+
+    assert _creates(mock_server) == 4
@@ -0,0 +1,153 @@
+import time
+
+import pytest
+
+from clients.base_client import BaseClient, PageWalk
+from stores.product_index import ProductIndex, payload_hash
+
+
+@pytest.fixture
+def index(state_dir):
+    return ProductIndex()
+
+
+# -------------------------------------------------
+# ProductIndex
+# -------------------------------------------------
+def test_upsert_keeps_hash_across_catalog_loads(index):
+    payload = {"SKU": "A", "Name": "a"}
+    index.upsert("A", 10, payload)
+
+    # El recorrido del catálogo sólo trae SKU / ID: conserva el hash
+    index.load_catalog([{"SKU": "A", "ID": 11}])
+
+    assert index.get("A") == {"ID": 11, "SKU": "A", "hash": payload_hash(payload)}
+
+
+def test_upsert_without_payload_keeps_previous_hash(index):
+    payload = {"SKU": "A", "Name": "a"}
+    index.upsert("A", 10, payload)
+    index.upsert("A", 10)
+
+    assert index.get("A")["hash"] == payload_hash(payload)
+
+
+def test_payload_hash_ignores_key_order():
+    assert payload_hash({"a": 1, "b": 2}) == payload_hash({"b": 2, "a": 1})
+    assert payload_hash({"a": 1}) != payload_hash({"a": 2})
+
+
+def test_remove_unseen_drops_only_rows_older_than_walk(index):
+    index.upsert("old", 1)
+    time.sleep(0.01)
+    walk_started = time.time()
+
+    index.load_catalog([{"SKU": "seen", "ID": 2}])
+
+    assert index.remove_unseen(walk_started) == 1
+    assert index.get("old") is None
+    assert index.get("seen") is not None
+
+
+# -------------------------------------------------
+# _iter_pages / PageWalk
+# -------------------------------------------------
+def _pages(total: int):
+    rows = [{"SKU": f"S-{i}", "ID": i + 1} for i in range(total)]
+
+    def fetch_page(page: int, limit: int):
+        return rows[(page - 1) * limit:page * limit]
+
+    return fetch_page
+
+
+@pytest.mark.parametrize("fanout", [1, 4])
+@pytest.mark.parametrize(
+    "total, max_pages, complete",
+    [
+        (25, 10, True),   # termina en una página corta
+        (30, 10, True),   # termina en una página vacía
+        (30, 3, False),   # corta por max_pages con páginas llenas
+        (25, 3, True),    # la última página permitida es corta
+    ],
+)
+def test_page_walk_reports_complete(fanout, total, max_pages, complete):
+    walk = PageWalk()
+
+    batches = list(BaseClient()._iter_pages(_pages(total), 10, max_pages, fanout, walk=walk))
+
+    assert sum(len(b) for b in batches) == min(total, 10 * max_pages)
+    assert walk.complete is complete
+
+
+# -------------------------------------------------
+# MintsoftProductClient.refresh_index
+# -------------------------------------------------
+def test_refresh_index_prunes_after_complete_walk(mock_server):
+    from clients.mintsoft_product_client import MintsoftProductClient
+
+    mock_server.mintsoft_products["A"] = {"ID": 1, "SKU": "A"}
+
+    client = MintsoftProductClient()
+    client.index.upsert("deleted-in-mintsoft", 99)
+
+    assert client.refresh_index() == 1
+    assert client.index.get("deleted-in-mintsoft") is None
+    assert client.index.get("A")["ID"] == 1
+
+
+def test_refresh_index_does_not_prune_after_truncated_walk(mock_server, monkeypatch):
+    from clients.mintsoft_product_client import MintsoftProductClient
+
+    client = MintsoftProductClient()
+    client.index.upsert("beyond-max-pages", 99)
+
+    # Catálogo más grande que max_pages * page_size: todas las páginas llenas
+    monkeypatch.setattr(
+        client,
+        "_get_products_page",
+        lambda page, limit: [
+            {"SKU": f"S-{page}-{i}", "ID": page * limit + i} for i in range(limit)
+        ],
+    )
+
+    client.refresh_index()
+
+    assert client.index.get("beyond-max-pages")["ID"] == 99
+
+
+def test_async_refresh_index_does_not_prune_after_truncated_walk(mock_server, monkeypatch):
+    import asyncio
+
+    from clients.async_mintsoft_product_client import AsyncMintsoftProductClient
+
+    client = AsyncMintsoftProductClient()
+    client.index.upsert("beyond-max-pages", 99)
+
+    async def full_page(page, limit):
+        return [{"SKU": f"S-{page}-{i}", "ID": page * limit + i} for i in range(limit)]
+
+    monkeypatch.setattr(client, "_get_products_page", full_page)
+
+    asyncio.run(client.refresh_index())
+
+    assert client.index.get("beyond-max-pages")["ID"] == 99
+
+
+# -------------------------------------------------
+# lookup_sku / get_product_by_sku
+# -------------------------------------------------
+def test_lookup_sku_returns_index_entry_and_get_product_by_sku_the_product(mock_server):
+    from clients.mintsoft_product_client import MintsoftProductClient
+
+    client = MintsoftProductClient()
+    payload = {"SKU": "A", "Name": "a"}
+    created = client.create_product(payload)
+
+    assert client.lookup_sku("A") == {
+        "ID": created["ID"],
+        "SKU": "A",
+        "hash": payload_hash(payload),
+    }
+    assert client.get_product_by_sku("A") == mock_server.mintsoft_products["A"]
+    assert client.get_product_by_sku("missing") is None
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+
+def _run_sync(**kwargs):
+    from services.product_service import ProductSyncService
+
+    ProductSyncService().sync_all_products(prefetch_depth=0, **kwargs)
+
+
+def _run_async(**kwargs):
+    from services.async_product_service import AsyncProductSyncService
+
+    async def run():
+        service = AsyncProductSyncService()
+        try:
+            await service.sync_all_products(prefetch_depth=0, **kwargs)
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+
+
+RUNNERS = {"sync": _run_sync, "async": _run_async}
+
+
+def _writes(server) -> dict:
+    return {
+        "create": server.requests.get("PUT /api/Product", 0),
+        "update": server.requests.get("POST /api/Product", 0),
+    }
+
+
+# -------------------------------------------------
+# Create / skip / update (sync y async, mismos resultados)
+# -------------------------------------------------
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_product_sync_creates_skips_and_updates(mode, mock_server, fast_retries):
+    run = RUNNERS[mode]
+
+    run(page_size=2)
+    assert _writes(mock_server) == {"create": 5, "update": 0}
+    assert len(mock_server.mintsoft_products) == 5
+
+    # Mismo catálogo: el hash coincide con el último payload enviado
+    run(page_size=2)
+    assert _writes(mock_server) == {"create": 5, "update": 0}
+
+    # Cambia un producto en DSCO: se actualiza sólo ese, por ID
+    mock_server.dsco_products[0]["barcode"] = "0000000000000"
+    run(page_size=2)
+    assert _writes(mock_server) == {"create": 5, "update": 1}
+    assert len(mock_server.mintsoft_products) == 5
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_product_without_sku_is_not_written(mode, mock_server, fast_retries):
+    for product in mock_server.dsco_products:
+        product.pop("sku", None)
+        product.pop("itemCode", None)
+
+    RUNNERS[mode]()
+
+    assert _writes(mock_server) == {"create": 0, "update": 0}
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_failed_product_goes_to_dead_letters(mode, mock_server, fast_retries):
+    from stores.dead_letter_store import DeadLetterStore
+
+    # Un create no idempotente no se reintenta tras un 503
+    mock_server.fail_next("PUT", "/api/Product", 503)
+
+    RUNNERS[mode](workers=1)
+
+    assert len(mock_server.mintsoft_products) == 4
+    assert DeadLetterStore().count("product") == 1
+
+
+# -------------------------------------------------
+# Workers en paralelo: mismos totales que el serial
+# -------------------------------------------------
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_concurrent_workers_keep_the_accounting(
+    mode, mock_server, fast_retries, tmp_path, monkeypatch
+):
+    from loggers import run_journal
+
+    monkeypatch.setattr(run_journal, "JOURNAL_DIR", str(tmp_path / "journal"))
+    mock_server.fail_next("PUT", "/api/Product", 503)
+
+    RUNNERS[mode](workers=4, page_size=2)
+
+    [run] = run_journal.iter_runs("product")
+    items = list(run_journal.iter_items(run))
+
+    assert run["workers"] == 4
+    assert run["total"] == 5 and run["failed"] == 1
+    assert run["by_action"] == {"create": 5}
+    # Un record por SKU, sin repetidos
+    assert len({i["key"] for i in items}) == 5
+    assert len(mock_server.mintsoft_products) == 4
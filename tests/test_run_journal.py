@@ -0,0 +1,137 @@
+import json
+import os
+from time import perf_counter
+
+import pytest
+
+from loggers import run_journal
+from loggers.run_journal import (
+    STATUS_FAILED,
+    STATUS_INVALID,
+    STATUS_OK,
+    RunJournal,
+    iter_items,
+    iter_runs,
+)
+
+
+@pytest.fixture
+def journal_dir(tmp_path, monkeypatch):
+    path = str(tmp_path / "journal")
+    monkeypatch.setattr(run_journal, "JOURNAL_DIR", path)
+    return path
+
+
+class _HttpError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.response = type("Response", (), {"status_code": status_code})()
+
+
+# -------------------------------------------------
+# RunJournal
+# -------------------------------------------------
+def test_records_items_and_summary(journal_dir):
+    journal = RunJournal("product", kind="sync", workers=2)
+
+    journal.record("S-1", "create", perf_counter(), http_status=201)
+    journal.record("S-2", "update", perf_counter(), error=_HttpError(503))
+    journal.record(None, None, perf_counter(), status=STATUS_INVALID)
+
+    summary = journal.close(completed=True)
+
+    assert summary["total"] == 3
+    assert summary["failed"] == 2
+    assert summary["failure_rate"] == round(2 / 3, 4)
+    assert summary["by_status"] == {STATUS_OK: 1, STATUS_FAILED: 1, STATUS_INVALID: 1}
+    assert summary["by_action"] == {"create": 1, "update": 1}
+    assert summary["workers"] == 2 and summary["completed"] is True
+
+    items = list(iter_items(summary))
+    assert [i["key"] for i in items] == ["S-1", "S-2", None]
+    # El HTTP del error sale de su response
+    assert items[1]["http"] == 503
+    assert items[1]["error"] == "HTTP 503"
+
+
+def test_close_is_idempotent(journal_dir):
+    journal = RunJournal("order")
+    journal.record("A-1", "create", perf_counter())
+
+    first = journal.close()
+    second = journal.close()
+
+    assert first is second
+    assert len(list(iter_runs())) == 1
+
+
+def test_one_file_per_run(journal_dir):
+    first = RunJournal("order")
+    second = RunJournal("order")
+    first.close()
+    second.close()
+
+    assert first.path != second.path
+    assert first.path.startswith(os.path.join(journal_dir, "order"))
+
+    with open(first.path, encoding="utf-8") as f:
+        assert json.loads(f.readline())["run_id"] == first.run_id
+
+
+def test_buffer_is_flushed_every_n_records(journal_dir, monkeypatch):
+    monkeypatch.setattr(run_journal, "JOURNAL_FLUSH_EVERY", 2)
+    journal = RunJournal("product")
+
+    journal.record("S-1", "create", perf_counter())
+    assert not os.path.exists(journal.path)
+
+    journal.record("S-2", "create", perf_counter())
+    with open(journal.path, encoding="utf-8") as f:
+        assert len(f.readlines()) == 2
+
+
+def test_context_manager_records_the_error(journal_dir):
+    with pytest.raises(RuntimeError):
+        with RunJournal("product") as journal:
+            raise RuntimeError("boom")
+
+    assert journal.summary["error"] == repr(RuntimeError("boom"))
+
+
+# -------------------------------------------------
+# iter_runs
+# -------------------------------------------------
+def test_iter_runs_filters_and_skips_torn_lines(journal_dir):
+    RunJournal("order").close()
+    RunJournal("product").close()
+
+    with open(os.path.join(journal_dir, run_journal.RUNS_INDEX), "a", encoding="utf-8") as f:
+        f.write('{"type": "summary", "entity": "ord')
+
+    assert [r["entity"] for r in iter_runs()] == ["order", "product"]
+    assert [r["entity"] for r in iter_runs("product")] == ["product"]
+    assert list(iter_runs(since="9999")) == []
+
+
+def test_iter_runs_without_index(journal_dir):
+    assert list(iter_runs()) == []
+
+
+# -------------------------------------------------
+# Journal de los servicios
+# -------------------------------------------------
+def test_order_sync_writes_one_run(journal_dir, mock_server, fast_retries):
+    from services.order_service import OrderSyncService
+
+    OrderSyncService().sync_all_orders(
+        updated_from=mock_server.created_from,
+        updated_to=mock_server.created_to,
+        prefetch_depth=0,
+    )
+
+    [run] = iter_runs("order")
+
+    assert run["kind"] == "sync" and run["mode"] == "threads"
+    assert run["completed"] is True
+    assert run["by_action"] == {"create": 5}
+    assert {i["http"] for i in iter_items(run)} == {200}